@@ -7,25 +7,153 @@ Replaces all bash scripts with integrated Python tools.
 """
 
 import argparse
+import atexit
+import functools
+import importlib
 import logging
+import logging.handlers
+import operator
 import os
+import queue
 import sys
-from pathlib import Path
+from enum import IntEnum
+
+
+def _configure_logging():
+    """
+    Configure root logging through a queue
+
+    Records are enqueued by a QueueHandler and written to stderr by a
+    background QueueListener, so logging threads (e.g. parallel deployments)
+    do not contend on the stream lock. Like logging.basicConfig, this does
+    nothing if the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+    )
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
 
-# Import AutoNet modules
-from lib.exceptions import ConfigurationError
-from lib.config_manager import get_config_manager
-from lib.plugin_system import initialize_plugin_system
-from lib.state_manager import get_state_manager
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+# Timestamp format used in state listings
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Default main configuration file
+DEFAULT_CONFIG_PATH = "vars/generic.yml"
+
+# Parsed configurations keyed on (path, mtime), see _ensure_config
+_CONFIG_CACHE = {}
+
+# Listing size from which timestamps are formatted in bulk with numpy
+BULK_TIMESTAMP_THRESHOLD = 200
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy(module_name):
+    """Import an AutoNet module on first use, so unrelated commands skip it"""
+    return importlib.import_module(module_name)
+
+
+class CommandAction(IntEnum):
+    """Base class for subcommand actions parsed from the command line"""
+
+    @classmethod
+    def from_str(cls, value):
+        """Parse an action name, as used for argparse type conversion"""
+        try:
+            return cls[value.upper()]
+        except KeyError:
+            choices = ", ".join(str(action) for action in cls)
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {choices})"
+            ) from None
+
+    def __str__(self):
+        return self.name.lower()
+
+
+class DeployAction(CommandAction):
+    PUSH = 0
+    CHECK = 1
+    STATUS = 2
+
+
+class StateAction(CommandAction):
+    EVENTS = 0
+    GENERATIONS = 1
+    DEPLOYMENTS = 2
+    STATS = 3
+    CLEANUP = 4
+    EXPORT = 5
+
+
+class ConfigAction(CommandAction):
+    VALIDATE = 0
+    SHOW = 1
+    METADATA = 2
+
+
+def _ensure_config(config_path=None):
+    """
+    Load a configuration file, reusing the parsed result until it changes
+
+    Results are memoized on (path, mtime) so repeated commands in the same
+    process skip re-parsing and re-validating an unchanged file.
+    """
+    config_path = config_path or DEFAULT_CONFIG_PATH
+    config_manager = _lazy("lib.config_manager").get_config_manager()
+    try:
+        key = (config_path, os.stat(config_path).st_mtime_ns)
+    except OSError:
+        # Let the configuration manager report the missing file
+        return config_manager.load_configuration(config_path)
+
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = config_manager.load_configuration(config_path)
+    return _CONFIG_CACHE[key]
+
+
+def _handle_errors(description):
+    """
+    Decorate a command handler to log unexpected errors
+
+    The handler returns exit code 2 on error; the traceback is only
+    printed (and the traceback module only imported) in debug mode.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(args):
+            try:
+                return func(args)
+            except Exception as e:
+                logger.error(f"{description}: {e}")
+                if args.debug:
+                    import traceback
+
+                    traceback.print_exc()
+                return 2
+
+        return wrapper
+
+    return decorator
+
 
 def setup_common_args(parser):
     """Add common arguments to parser"""
@@ -43,29 +171,69 @@ def cmd_generate(args):
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Import and run peering_filters functionality
-    import subprocess
+    # Run peering_filters in-process, sharing the already-loaded architecture
+    import peering_filters
 
-    cmd = [sys.executable, "peering_filters"]
+    config_manager = _lazy("lib.config_manager").get_config_manager()
+    peering_filters.set_config_manager(config_manager)
 
-    if "all" in args.targets:
-        cmd.append("all")
-    else:
-        if "configs" in args.targets:
-            cmd.append("configs")
-        if "prefixsets" in args.targets:
-            cmd.append("prefixsets")
+    # Load the configuration once here; run() reuses it from the shared
+    # manager and falls back to reading it itself if this fails
+    try:
+        _ensure_config()
+    except Exception as e:
+        logger.warning(f"Failed to load configuration: {e}")
+
+    targets = set(args.targets)
+    return peering_filters.run(
+        targets=targets, no_checks=args.no_checks, debug=args.debug
+    )
 
-    if args.no_checks:
-        cmd.append("--no-checks")
 
-    if args.debug:
-        cmd.append("debug")
+def _deploy_check(deployer, args):
+    """Validate environment and configurations without deploying"""
+    if not deployer.validate_environment():
+        return 1
+    if not deployer.comprehensive_validation():
+        return 4
+    logger.info("✓ All validations passed")
+    return 0
+
+
+def _deploy_status(deployer, args):
+    """Report reachability of every router"""
+    status_results = deployer.check_router_status()
+    print(f"\nRouter Status Report:")
+    print("=" * 50)
+    for router_name, status in status_results.items():
+        reachable = status.get("reachable", False)
+        status_icon = "✓" if reachable else "✗"
+        print(f"{status_icon} {router_name}: {'OK' if reachable else 'UNREACHABLE'}")
+        if "error" in status:
+            print(f"    Error: {status['error']}")
+    return 0
+
+
+def _deploy_push(deployer, args):
+    """Validate and deploy configurations to routers"""
+    if not deployer.validate_environment():
+        return 1
+    if not deployer.comprehensive_validation():
+        return 4
+    if not deployer.deploy_all():
+        return 5
+    logger.info("✓ Deployment completed successfully")
+    return 0
+
 
-    result = subprocess.run(cmd, cwd=Path.cwd())
-    return result.returncode
+DEPLOY_ACTIONS = {
+    DeployAction.CHECK: _deploy_check,
+    DeployAction.STATUS: _deploy_status,
+    DeployAction.PUSH: _deploy_push,
+}
 
 
+@_handle_errors("Deployment error")
 def cmd_deploy(args):
     """Deploy configurations to routers"""
     if args.debug:
@@ -74,63 +242,27 @@ def cmd_deploy(args):
     # Import and run update_routers functionality
     from update_routers import AutoNetDeployer
 
-    try:
-        # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_configuration(args.config)
-
-        # Create deployer
-        deployer = AutoNetDeployer(config)
-
-        # Filter routers if specified
-        if args.router:
-            deployer.routers = [r for r in deployer.routers if args.router in r.name]
-            if not deployer.routers:
-                logger.error(f"Router not found: {args.router}")
-                return 1
-
-        # Perform action
-        if args.action == "check":
-            if not deployer.validate_environment():
-                return 1
-            if not deployer.comprehensive_validation():
-                return 4
-            logger.info("✓ All validations passed")
-            return 0
-
-        elif args.action == "status":
-            status_results = deployer.check_router_status()
-            print(f"\nRouter Status Report:")
-            print("=" * 50)
-            for router_name, status in status_results.items():
-                reachable = status.get("reachable", False)
-                status_icon = "✓" if reachable else "✗"
-                print(
-                    f"{status_icon} {router_name}: {'OK' if reachable else 'UNREACHABLE'}"
-                )
-                if "error" in status:
-                    print(f"    Error: {status['error']}")
-            return 0
-
-        elif args.action == "push":
-            if not deployer.validate_environment():
-                return 1
-            if not deployer.comprehensive_validation():
-                return 4
-            if not deployer.deploy_all():
-                return 5
-            logger.info("✓ Deployment completed successfully")
-            return 0
+    # Load configuration
+    config = _ensure_config(args.config)
 
-    except Exception as e:
-        logger.error(f"Deployment error: {e}")
-        if args.debug:
-            import traceback
+    # Override config with command line arguments
+    if args.parallel:
+        config["max_parallel_deployments"] = args.parallel
+    if args.timeout:
+        config["deployment_timeout"] = args.timeout
 
-            traceback.print_exc()
-        return 2
+    # Create deployer, restricted to a specific router if requested
+    deployer = AutoNetDeployer(config, router_filter=args.router)
+
+    if args.router and not deployer.routers:
+        logger.error(f"Router not found: {args.router}")
+        return 1
+
+    # Perform action
+    return DEPLOY_ACTIONS[args.action](deployer, args)
 
 
+@_handle_errors("Peer config generation error")
 def cmd_peer_config(args):
     """Generate peer configurations"""
     if args.debug:
@@ -138,258 +270,255 @@ def cmd_peer_config(args):
 
     from generate_peer_config import PeerConfigGenerator
 
-    try:
-        # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_configuration(args.config)
-
-        # Create generator
-        generator = PeerConfigGenerator(config)
-
-        # Handle list vendors
-        if args.list_vendors:
-            vendors = generator.list_available_vendors()
-            print("Available vendor plugins:")
-            for vendor in vendors:
-                features = generator.get_vendor_features(vendor)
-                print(
-                    f"  • {vendor}: {', '.join(features) if features else 'no features listed'}"
-                )
-            return 0
-
-        # Handle single peer generation
-        if args.asn:
-            peer_info = {
-                "asn": args.asn,
-                "name": args.name or f"Peer {args.asn}",
-                "description": args.description or f"BGP peer {args.asn}",
-            }
-
-            if args.ipv4:
-                peer_info["ipv4"] = args.ipv4
-            if args.ipv6:
-                peer_info["ipv6"] = args.ipv6
-
-            config_content = generator.generate_peer_config(
-                args.asn, peer_info, args.vendor, args.output
+    # Load configuration
+    config = _ensure_config(args.config)
+
+    # Create generator
+    generator = PeerConfigGenerator(config)
+
+    # Handle list vendors
+    if args.list_vendors:
+        vendors = generator.list_available_vendors()
+        print("Available vendor plugins:")
+        for vendor in vendors:
+            features = generator.get_vendor_features(vendor)
+            print(
+                f"  • {vendor}: {', '.join(features) if features else 'no features listed'}"
             )
+        return 0
+
+    # Handle single peer generation
+    if args.asn:
+        peer_info = {
+            "asn": args.asn,
+            "name": args.name or f"Peer {args.asn}",
+            "description": args.description or f"BGP peer {args.asn}",
+        }
 
-            if not args.output:
-                print(config_content)
+        if args.ipv4:
+            peer_info["ipv4"] = args.ipv4
+        if args.ipv6:
+            peer_info["ipv6"] = args.ipv6
 
-            return 0
+        config_content = generator.generate_peer_config(
+            args.asn, peer_info, args.vendor, args.output
+        )
 
-        # Handle peer file
-        if args.peer_file:
-            import json
+        if not args.output:
+            print(config_content)
 
-            with open(args.peer_file, "r") as f:
-                peer_data = json.load(f)
+        return 0
 
-            if isinstance(peer_data, list):
-                peer_list = peer_data
-            else:
-                peer_list = [peer_data]
+    # Handle peer file
+    if args.peer_file:
+        peer_list = _lazy("lib.utils").iter_json_items(args.peer_file)
 
+        # Write files as they are generated rather than collecting them first
+        if args.output_dir:
+            results = generator.iter_generate_peers(peer_list, args.vendor)
+            for output_file in generator.write_configs(results, args.output_dir):
+                print(f"✓ Generated: {output_file}")
+        else:
             results = generator.generate_multiple_peers(peer_list, args.vendor)
+            sys.stdout.write(generator.format_configs(results))
 
-            if args.output_dir:
-                output_dir = Path(args.output_dir)
-                output_dir.mkdir(parents=True, exist_ok=True)
+        return 0
 
-                for asn, config_content in results.items():
-                    output_file = output_dir / f"{asn.lower()}.conf"
-                    with open(output_file, "w") as f:
-                        f.write(config_content)
-                    print(f"✓ Generated: {output_file}")
-            else:
-                for asn, config_content in results.items():
-                    print(f"\n# Configuration for {asn}")
-                    print(config_content)
+    logger.error("No peer information provided")
+    return 1
 
-            return 0
 
-        logger.error("No peer information provided")
-        return 1
+def _status_icon(success):
+    """Return the status marker used in command output"""
+    return "✓" if success else "✗"
 
-    except Exception as e:
-        logger.error(f"Peer config generation error: {e}")
-        if args.debug:
-            import traceback
 
-            traceback.print_exc()
-        return 2
+def _format_duration(duration_ms):
+    """Format a duration in milliseconds for command output"""
+    return f"{duration_ms/1000:.1f}s" if duration_ms else "N/A"
 
 
-def cmd_state(args):
-    """State management operations"""
-    if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
+def _format_memory(memory_mb):
+    """Format a memory figure in megabytes for command output"""
+    return f"{memory_mb:.1f}MB" if memory_mb else "N/A"
 
-    from lib.state_manager import StateManager
 
-    try:
-        # Load configuration
-        config_manager = get_config_manager()
-        config = config_manager.load_configuration(args.config)
-
-        # Create state manager
-        state_manager = get_state_manager(config=config)
-
-        if args.action == "events":
-            events = state_manager.get_recent_events(args.limit or 50)
-            print(f"Recent {len(events)} events:")
-            for event in events:
-                status = "✓" if event.success else "✗"
-                print(
-                    f"  {status} {event.timestamp.strftime('%Y-%m-%d %H:%M:%S')} "
-                    f"[{event.component}] {event.event_type.value}: {event.message}"
-                )
-
-        elif args.action == "generations":
-            generations = state_manager.get_recent_generations(args.limit or 20)
-            print(f"Recent {len(generations)} generations:")
-            for gen in generations:
-                status = "✓" if gen.success else "✗"
-                duration = f"{gen.duration_ms/1000:.1f}s" if gen.duration_ms else "N/A"
-                memory = f"{gen.memory_peak_mb:.1f}MB" if gen.memory_peak_mb else "N/A"
-                print(
-                    f"  {status} {gen.timestamp.strftime('%Y-%m-%d %H:%M:%S')} "
-                    f"Peers: {gen.peer_count}, Duration: {duration}, Memory: {memory}"
-                )
-
-        elif args.action == "deployments":
-            deployments = state_manager.get_deployment_history(
-                args.router, args.limit or 20
-            )
-            print(f"Recent {len(deployments)} deployments:")
-            for dep in deployments:
-                status = "✓" if dep.success else "✗"
-                duration = f"{dep.duration_ms/1000:.1f}s" if dep.duration_ms else "N/A"
-                print(
-                    f"  {status} {dep.timestamp.strftime('%Y-%m-%d %H:%M:%S')} "
-                    f"{dep.router} Duration: {duration}"
-                )
-
-        elif args.action == "stats":
-            stats = state_manager.get_performance_stats(args.days or 7)
-            import json
-
-            print(json.dumps(stats, indent=2))
-
-        elif args.action == "cleanup":
-            stats = state_manager.cleanup_old_data()
-            print(f"Cleanup completed: {stats}")
-
-        elif args.action == "export":
-            if state_manager.export_data(args.output or "autonet_state.json"):
-                print(f"✓ Data exported to {args.output or 'autonet_state.json'}")
-            else:
-                print("✗ Export failed")
-                return 1
+def _format_timestamps(records):
+    """Format the timestamps of state records with TIMESTAMP_FORMAT"""
+    if len(records) < BULK_TIMESTAMP_THRESHOLD:
+        return [record.timestamp.strftime(TIMESTAMP_FORMAT) for record in records]
 
+    # Long listings: convert and format all timestamps in one numpy call
+    np = _lazy("numpy")
+    stamps = np.array([record.timestamp for record in records], dtype="datetime64[s]")
+    return [
+        stamp.replace("T", " ")
+        for stamp in np.datetime_as_string(stamps, unit="s").tolist()
+    ]
+
+
+def _write_lines(lines):
+    """Write output lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _state_events(state_manager, args):
+    """List recent events"""
+    events = state_manager.get_recent_events(args.limit or 50)
+    lines = [f"Recent {len(events)} events:"]
+    lines.extend(
+        f"  {_status_icon(event.success)} "
+        f"{timestamp} "
+        f"[{event.component}] {event.event_type.value}: {event.message}"
+        for event, timestamp in zip(events, _format_timestamps(events))
+    )
+    _write_lines(lines)
+    return 0
+
+
+def _state_generations(state_manager, args):
+    """List recent configuration generations"""
+    generations = state_manager.get_recent_generations(args.limit or 20)
+    lines = [f"Recent {len(generations)} generations:"]
+    lines.extend(
+        f"  {_status_icon(gen.success)} "
+        f"{timestamp} "
+        f"Peers: {gen.peer_count}, "
+        f"Duration: {_format_duration(gen.duration_ms)}, "
+        f"Memory: {_format_memory(gen.memory_peak_mb)}"
+        for gen, timestamp in zip(generations, _format_timestamps(generations))
+    )
+    _write_lines(lines)
+    return 0
+
+
+def _state_deployments(state_manager, args):
+    """List recent deployments"""
+    deployments = state_manager.get_deployment_history(args.router, args.limit or 20)
+    lines = [f"Recent {len(deployments)} deployments:"]
+    lines.extend(
+        f"  {_status_icon(dep.success)} "
+        f"{timestamp} "
+        f"{dep.router} Duration: {_format_duration(dep.duration_ms)}"
+        for dep, timestamp in zip(deployments, _format_timestamps(deployments))
+    )
+    _write_lines(lines)
+    return 0
+
+
+def _state_stats(state_manager, args):
+    """Show performance statistics"""
+    stats = state_manager.get_performance_stats(args.days or 7)
+    print(_lazy("lib.utils").dump_json(stats))
+    return 0
+
+
+def _state_cleanup(state_manager, args):
+    """Remove old state data"""
+    stats = state_manager.cleanup_old_data()
+    print(f"Cleanup completed: {stats}")
+    return 0
+
+
+def _state_export(state_manager, args):
+    """Export state data to a file"""
+    output = args.output or "autonet_state.json"
+    if state_manager.export_data(output):
+        print(f"✓ Data exported to {output}")
         return 0
+    print("✗ Export failed")
+    return 1
 
-    except Exception as e:
-        logger.error(f"State management error: {e}")
-        if args.debug:
-            import traceback
 
-            traceback.print_exc()
-        return 2
+STATE_ACTIONS = {
+    StateAction.EVENTS: _state_events,
+    StateAction.GENERATIONS: _state_generations,
+    StateAction.DEPLOYMENTS: _state_deployments,
+    StateAction.STATS: _state_stats,
+    StateAction.CLEANUP: _state_cleanup,
+    StateAction.EXPORT: _state_export,
+}
 
 
-def cmd_config(args):
-    """Configuration management operations"""
+@_handle_errors("State management error")
+def cmd_state(args):
+    """State management operations"""
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    from lib.config_manager import get_config_manager
+    # Load configuration
+    config = _ensure_config(args.config)
 
-    try:
-        config_manager = get_config_manager()
-
-        if args.action == "validate":
-            config = config_manager.load_configuration(args.config_file)
-            if config_manager.validate_environment():
-                print("✓ Configuration validation passed")
-                return 0
-            else:
-                print("✗ Configuration validation failed")
-                return 1
-
-        elif args.action == "show":
-            config = config_manager.load_configuration(args.config_file)
-            import json
-
-            if args.key:
-                # Show specific key
-                keys = args.key.split(".")
-                value = config
-                for key in keys:
-                    if isinstance(value, dict) and key in value:
-                        value = value[key]
-                    else:
-                        print(f"Key not found: {args.key}")
-                        return 1
-                print(json.dumps(value, indent=2, default=str))
-            else:
-                # Show entire config
-                print(json.dumps(config, indent=2, default=str))
-
-        elif args.action == "metadata":
-            config = config_manager.load_configuration(args.config_file)
-            metadata = config_manager.get_metadata()
-            if metadata:
-                print(f"Configuration Metadata:")
-                print(f"  Version: {metadata.version}")
-                print(f"  Schema Version: {metadata.schema_version}")
-                print(f"  Environment: {metadata.environment}")
-                print(f"  Loaded At: {metadata.loaded_at}")
-                print(f"  Source Files: {', '.join(metadata.source_files)}")
-                print(f"  Validation Passed: {metadata.validation_passed}")
+    # Create state manager
+    state_manager = _lazy("lib.state_manager").get_state_manager(config=config)
 
-        return 0
+    return STATE_ACTIONS[args.action](state_manager, args)
 
-    except Exception as e:
-        logger.error(f"Configuration error: {e}")
-        if args.debug:
-            import traceback
 
-            traceback.print_exc()
-        return 2
+def _config_validate(config_manager, args):
+    """Validate the configuration and environment"""
+    config = _ensure_config(args.config_file)
+    if config_manager.validate_environment(config):
+        print("✓ Configuration validation passed")
+        return 0
+    print("✗ Configuration validation failed")
+    return 1
 
 
-def main():
-    """Main CLI interface"""
-    parser = argparse.ArgumentParser(
-        description="AutoNet - Network Automation Toolchain v2.3.1",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-AutoNet Commands:
-  generate    Generate router configurations (replaces peering_filters)
-  deploy      Deploy configurations to routers (replaces update-routers.sh)
-  peer-config Generate peer-specific configurations
-  state       State management and monitoring
-  config      Configuration management
+def _config_show(config_manager, args):
+    """Show the configuration, or a single dotted key of it"""
+    config = _ensure_config(args.config_file)
+    dump_json = _lazy("lib.utils").dump_json
 
-Examples:
-  autonet generate all                    # Generate all configurations
-  autonet deploy push                     # Deploy to all routers
-  autonet deploy check                    # Validate without deploying
-  autonet peer-config --asn AS64512 --vendor bird2
-  autonet state events --limit 100       # Show recent events
-  autonet config validate                 # Validate configuration
-        """,
-    )
+    if args.key:
+        # Show specific key
+        try:
+            value = functools.reduce(operator.getitem, args.key.split("."), config)
+        except (KeyError, TypeError):
+            print(f"Key not found: {args.key}")
+            return 1
+        print(dump_json(value))
+    else:
+        # Show entire config
+        print(dump_json(config))
+    return 0
+
+
+def _config_metadata(config_manager, args):
+    """Show configuration metadata"""
+    _ensure_config(args.config_file)
+    metadata = config_manager.get_metadata()
+    if metadata:
+        print(f"Configuration Metadata:")
+        print(f"  Version: {metadata.version}")
+        print(f"  Schema Version: {metadata.schema_version}")
+        print(f"  Environment: {metadata.environment}")
+        print(f"  Loaded At: {metadata.loaded_at}")
+        print(f"  Source Files: {', '.join(metadata.source_files)}")
+        print(f"  Validation Passed: {metadata.validation_passed}")
+    return 0
+
+
+CONFIG_ACTIONS = {
+    ConfigAction.VALIDATE: _config_validate,
+    ConfigAction.SHOW: _config_show,
+    ConfigAction.METADATA: _config_metadata,
+}
+
+
+@_handle_errors("Configuration error")
+def cmd_config(args):
+    """Configuration management operations"""
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
 
-    # Global options
-    setup_common_args(parser)
+    config_manager = _lazy("lib.config_manager").get_config_manager()
+
+    return CONFIG_ACTIONS[args.action](config_manager, args)
 
-    # Subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Generate command
+def add_generate_parser(subparsers):
+    """Add the generate subcommand"""
     gen_parser = subparsers.add_parser(
         "generate", help="Generate router configurations"
     )
@@ -405,12 +534,17 @@ Examples:
     )
     setup_common_args(gen_parser)
 
-    # Deploy command
+
+def add_deploy_parser(subparsers):
+    """Add the deploy subcommand"""
     deploy_parser = subparsers.add_parser(
         "deploy", help="Deploy configurations to routers"
     )
     deploy_parser.add_argument(
-        "action", choices=["push", "check", "status"], help="Deployment action"
+        "action",
+        type=DeployAction.from_str,
+        choices=list(DeployAction),
+        help="Deployment action",
     )
     deploy_parser.add_argument("--router", "-r", help="Deploy to specific router only")
     deploy_parser.add_argument(
@@ -421,7 +555,9 @@ Examples:
     )
     setup_common_args(deploy_parser)
 
-    # Peer config command
+
+def add_peer_config_parser(subparsers):
+    """Add the peer-config subcommand"""
     peer_parser = subparsers.add_parser(
         "peer-config", help="Generate peer configurations"
     )
@@ -439,13 +575,16 @@ Examples:
     )
     setup_common_args(peer_parser)
 
-    # State command
+
+def add_state_parser(subparsers):
+    """Add the state subcommand"""
     state_parser = subparsers.add_parser(
         "state", help="State management and monitoring"
     )
     state_parser.add_argument(
         "action",
-        choices=["events", "generations", "deployments", "stats", "cleanup", "export"],
+        type=StateAction.from_str,
+        choices=list(StateAction),
         help="State management action",
     )
     state_parser.add_argument("--limit", type=int, help="Limit number of results")
@@ -454,15 +593,99 @@ Examples:
     state_parser.add_argument("--output", help="Output file for export")
     setup_common_args(state_parser)
 
-    # Config command
+
+def add_config_parser(subparsers):
+    """Add the config subcommand"""
     config_parser = subparsers.add_parser("config", help="Configuration management")
     config_parser.add_argument(
-        "action", choices=["validate", "show", "metadata"], help="Configuration action"
+        "action",
+        type=ConfigAction.from_str,
+        choices=list(ConfigAction),
+        help="Configuration action",
     )
     config_parser.add_argument("--config-file", help="Configuration file to process")
     config_parser.add_argument("--key", help="Specific configuration key to show")
     setup_common_args(config_parser)
 
+
+# Subcommand parser builders, in help output order
+SUBPARSER_BUILDERS = {
+    "generate": add_generate_parser,
+    "deploy": add_deploy_parser,
+    "peer-config": add_peer_config_parser,
+    "state": add_state_parser,
+    "config": add_config_parser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(command=None):
+    """
+    Build the CLI argument parser
+
+    When a command is given only its subparser is constructed; otherwise
+    (e.g. for --help or an unknown command) all subcommands are added.
+    """
+    parser = argparse.ArgumentParser(
+        description="AutoNet - Network Automation Toolchain v2.3.1",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+AutoNet Commands:
+  generate    Generate router configurations (replaces peering_filters)
+  deploy      Deploy configurations to routers (replaces update-routers.sh)
+  peer-config Generate peer-specific configurations
+  state       State management and monitoring
+  config      Configuration management
+
+Examples:
+  autonet generate all                    # Generate all configurations
+  autonet deploy push                     # Deploy to all routers
+  autonet deploy check                    # Validate without deploying
+  autonet peer-config --asn AS64512 --vendor bird2
+  autonet state events --limit 100       # Show recent events
+  autonet config validate                 # Validate configuration
+        """,
+    )
+
+    # Global options
+    setup_common_args(parser)
+
+    # Subcommands
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, add_subparser in SUBPARSER_BUILDERS.items():
+        if command is None or name == command:
+            add_subparser(subparsers)
+
+    return parser
+
+
+def requested_command(argv):
+    """
+    Find the subcommand in argv without building every subparser
+
+    Global options are parsed first, so an option value such as
+    ``--config deploy`` is never taken for the command.
+
+    Returns:
+        The subcommand name, or None if there is no valid one
+    """
+    parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
+    setup_common_args(parser)
+    parser.add_argument("command", nargs="?")
+
+    try:
+        args, _ = parser.parse_known_args(argv)
+    except argparse.ArgumentError:
+        return None
+
+    return args.command if args.command in SUBPARSER_BUILDERS else None
+
+
+def main():
+    """Main CLI interface"""
+    # Only build the subparser for the requested command
+    parser = build_parser(requested_command(sys.argv[1:]))
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -11,24 +11,49 @@ Modern Python replacement for generate-peer-config.sh with enhanced features:
 """
 
 import argparse
+import functools
+import importlib
+import itertools
+import json
 import logging
+import multiprocessing.util
 import os
+import re
 import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 # Import AutoNet architecture components
 from lib.config_manager import ConfigurationError, get_config_manager
-from lib.plugin_system import get_plugin_manager, initialize_plugin_system, PluginType
-from lib.state_manager import (
-    EventType,
-    GenerationRecord,
-    get_state_manager,
-    track_event,
+from lib.plugin_system import initialize_plugin_system, PluginType
+from lib.utils import (
+    atomic_write,
+    iter_json_items,
+    validate_directory,
+    validate_network_address,
 )
-from lib.utils import get_config_value, run_command, validate_directory
+
+if TYPE_CHECKING:
+    from lib.state_manager import StateEvent
 
 # Configure logging
 logging.basicConfig(
@@ -38,6 +63,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Thread pool size for writing configuration files (I/O bound)
+WRITE_WORKERS = (os.cpu_count() or 1) * 4
+
+# Peer information validation
+REQUIRED_PEER_FIELDS = ("asn", "name")
+ASN_PATTERN = re.compile(r"AS[0-9]+")
+ASN_BATCH_PATTERN = re.compile(r"^AS[0-9]+$", re.MULTILINE)
+
+# Number of generation events written to the state database at once
+EVENT_BATCH_SIZE = 128
+
+# Peer count from which generate_multiple_peers renders in worker processes
+PARALLEL_PEER_THRESHOLD = 32
+
+# Distinct peer entries remembered for reusing the render of a repeated entry
+RENDER_CACHE_SIZE = 256
+
 
 class PeerConfigGenerator:
     """
@@ -51,17 +93,71 @@ class PeerConfigGenerator:
     - Performance monitoring
     """
 
+    # Fixed attribute layout: faster attribute access on the per-peer path
+    __slots__ = (
+        "config",
+        "config_manager",
+        "plugin_manager",
+        "_state_manager",
+        "template_dir",
+        "output_dir",
+        "compiled_templates",
+        "_event_buffer",
+        "_event_lock",
+        "_event_finalizer",
+        "_template_env_instance",
+        "_template_renders",
+        "_created_dirs",
+        "_vendor_plugins",
+        "_config_template_vars",
+        "__weakref__",
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
 
         # Initialize architecture components
         self.config_manager = get_config_manager()
         self.plugin_manager = initialize_plugin_system(self.config)
-        self.state_manager = get_state_manager(config=self.config)
+        self._state_manager = None
 
         # Configuration paths
         self.template_dir = Path(self.config.get("template_dir", "templates"))
         self.output_dir = Path(self.config.get("output_dir", "output"))
+        self.compiled_templates = Path(
+            self.config.get("compiled_templates", "build/autonet_templates.zip")
+        )
+
+        # Generation events waiting to be written to the state database
+        self._event_buffer: Deque["StateEvent"] = deque()
+        self._event_lock = threading.Lock()
+
+        # Write whatever is still buffered when the generator is collected or
+        # the interpreter exits; the finalizer holds no reference to self
+        self._event_finalizer = weakref.finalize(
+            self, _write_events, self._event_buffer, self._event_lock, self.config
+        )
+
+        # Jinja2 environment, created on first template render
+        self._template_env_instance = None
+
+        # Bound render methods of loaded templates, by template name
+        self._template_renders: Dict[str, Callable[..., str]] = {}
+
+        # Output directories already created by this generator
+        self._created_dirs: Set[Path] = set()
+
+        # Vendor plugins already resolved by name
+        self._vendor_plugins: Dict[str, Any] = {}
+
+        # Configuration-specific template variables, fixed for the whole run
+        self._config_template_vars = {
+            "local_asn": self.config.get("local_asn", "AS64512"),
+            "router_id": self.config.get("router_id", "192.0.2.1"),
+            "bgp_local_pref": self.config.get("bgp_local_pref", 100),
+            "irr_source": self.config.get("irr_source_host", "rr.ntt.net"),
+            "irr_order": self.config.get("irr_order", "NTTCOM,INTERNAL,RADB,RIPE"),
+        }
 
         # Ensure directories exist
         validate_directory(self.template_dir, create=False)
@@ -75,6 +171,7 @@ class PeerConfigGenerator:
         peer_info: Dict[str, Any],
         vendor: str = "bird",
         output_file: str = None,
+        batch_timestamp: str = None,
     ) -> str:
         """
         Generate peer configuration for specific ASN and vendor
@@ -84,6 +181,7 @@ class PeerConfigGenerator:
             peer_info: Peer information dictionary
             vendor: Target vendor (bird, bird2, frr, etc.)
             output_file: Optional output file path
+            batch_timestamp: Timestamp shared by a batch of peers (default: now)
 
         Returns:
             Generated configuration content
@@ -94,27 +192,25 @@ class PeerConfigGenerator:
 
         try:
             # Get vendor plugin
-            vendor_plugin = self.plugin_manager.get_vendor_plugin(vendor)
+            vendor_plugin = self._get_vendor_plugin(vendor)
             if not vendor_plugin:
                 raise ValueError(f"No plugin found for vendor: {vendor}")
 
             # Prepare template variables
-            template_vars = self._prepare_template_vars(asn, peer_info)
+            template_vars = self._prepare_template_vars(asn, peer_info, batch_timestamp)
 
-            # Generate configuration using plugin
-            config_content = vendor_plugin.generate_config(peer_info, template_vars)
-
-            # Validate generated configuration
-            if not vendor_plugin.validate_config(config_content):
+            # Generate and validate configuration using plugin
+            config_content, valid = vendor_plugin.generate_and_validate(
+                peer_info, template_vars
+            )
+            if not valid:
                 raise ValueError(f"Generated configuration failed validation for {asn}")
 
             # Save to file if requested
             if output_file:
                 output_path = Path(output_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(config_content)
+                self._ensure_dir(output_path.parent)
+                atomic_write(output_path, config_content)
 
                 logger.info(f"Configuration saved to: {output_path}")
 
@@ -122,9 +218,7 @@ class PeerConfigGenerator:
             generation_end_time = time.time()
             duration_ms = int((generation_end_time - generation_start_time) * 1000)
 
-            track_event(
-                EventType.GENERATION_SUCCESS,
-                "generate_peer_config",
+            self._track_event(
                 f"Generated peer configuration for {asn}",
                 details={
                     "asn": asn,
@@ -144,9 +238,7 @@ class PeerConfigGenerator:
         except Exception as e:
             logger.error(f"Failed to generate configuration for {asn}: {e}")
 
-            track_event(
-                EventType.GENERATION_FAILURE,
-                "generate_peer_config",
+            self._track_event(
                 f"Failed to generate configuration for {asn}: {e}",
                 details={"asn": asn, "vendor": vendor, "error": str(e)},
                 success=False,
@@ -154,68 +246,282 @@ class PeerConfigGenerator:
 
             raise
 
+    @property
+    def state_manager(self):
+        """State manager, opened on first use so listing and validation skip it"""
+        if self._state_manager is None:
+            self._state_manager = _state().get_state_manager(config=self.config)
+        return self._state_manager
+
+    def _track_event(
+        self,
+        message: str,
+        details: Dict[str, Any] = None,
+        duration_ms: int = None,
+        success: bool = True,
+    ) -> None:
+        """Buffer a generation event, writing a full batch to the state database"""
+        state = _state()
+        event = state.StateEvent(
+            event_type=(
+                state.EventType.GENERATION_SUCCESS
+                if success
+                else state.EventType.GENERATION_FAILURE
+            ),
+            component="generate_peer_config",
+            message=message,
+            details=details,
+            duration_ms=duration_ms,
+            success=success,
+        )
+        with self._event_lock:
+            self._event_buffer.append(event)
+            batch_full = len(self._event_buffer) >= EVENT_BATCH_SIZE
+
+        if batch_full:
+            self.flush_events()
+
+    def flush_events(self) -> None:
+        """Write buffered generation events to the state database"""
+        _write_events(self._event_buffer, self._event_lock, self.config)
+
+    def _get_vendor_plugin(self, vendor: str):
+        """Get the vendor plugin, resolving each vendor name only once"""
+        vendor_plugin = self._vendor_plugins.get(vendor)
+        if vendor_plugin is None:
+            vendor_plugin = self.plugin_manager.get_vendor_plugin(vendor)
+            if vendor_plugin:
+                self._vendor_plugins[vendor] = vendor_plugin
+        return vendor_plugin
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create an output directory, at most once per generator"""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
     def _prepare_template_vars(
-        self, asn: str, peer_info: Dict[str, Any]
+        self, asn: str, peer_info: Dict[str, Any], timestamp: str = None
     ) -> Dict[str, Any]:
         """Prepare template variables for configuration generation"""
-        # Base template variables
-        template_vars = {
+        # Base template variables, with configuration-specific variables on top
+        return {
             "asn": asn,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "generator": "AutoNet v2.0",
             **peer_info,
+            **self._config_template_vars,
         }
 
-        # Add configuration-specific variables
-        template_vars.update(
-            {
-                "local_asn": self.config.get("local_asn", "AS64512"),
-                "router_id": self.config.get("router_id", "192.0.2.1"),
-                "bgp_local_pref": self.config.get("bgp_local_pref", 100),
-                "irr_source": self.config.get("irr_source_host", "rr.ntt.net"),
-                "irr_order": self.config.get("irr_order", "NTTCOM,INTERNAL,RADB,RIPE"),
-            }
-        )
-
-        return template_vars
-
     def generate_multiple_peers(
-        self, peer_list: List[Dict[str, Any]], vendor: str = "bird"
+        self, peer_list: Iterable[Dict[str, Any]], vendor: str = "bird"
     ) -> Dict[str, str]:
         """
         Generate configurations for multiple peers
 
         Args:
-            peer_list: List of peer information dictionaries
+            peer_list: Peer information dictionaries (any iterable)
             vendor: Target vendor
 
         Returns:
             Dictionary mapping ASN to generated configuration
         """
-        logger.info(f"Generating configurations for {len(peer_list)} peers")
+        return dict(self.iter_generate_peers(peer_list, vendor))
+
+    def iter_generate_peers(
+        self, peer_list: Iterable[Dict[str, Any]], vendor: str = "bird"
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Generate configurations for multiple peers, yielding each as it is ready
 
-        results = {}
+        Peers that fail to generate are logged and skipped. Repeated
+        identical entries are rendered once and yielded for every repeat.
+        Consuming the configurations one at a time keeps only a few of
+        them in memory.
+
+        Args:
+            peer_list: Peer information dictionaries (any iterable)
+            vendor: Target vendor
+
+        Yields:
+            (ASN, generated configuration) tuples, in input order
+        """
         successful = 0
         failed = 0
 
-        for peer_info in peer_list:
-            asn = peer_info.get("asn")
-            if not asn:
-                logger.warning("Peer missing ASN, skipping")
-                failed += 1
-                continue
+        def valid_peers():
+            nonlocal failed
+            for peer_info in peer_list:
+                asn = peer_info.get("asn")
+                if not asn:
+                    logger.warning("Peer missing ASN, skipping")
+                    failed += 1
+                    continue
 
-            try:
-                config = self.generate_peer_config(asn, peer_info, vendor)
-                results[asn] = config
-                successful += 1
+                yield asn, peer_info
+
+        logger.info("Generating peer configurations")
+
+        # All peers of a batch share one generation timestamp
+        batch_timestamp = datetime.now().isoformat()
+
+        # Only start worker processes once the input turns out to be large
+        # enough to pay for them; the rest of the input is read as it goes
+        peers = valid_peers()
+        head = list(itertools.islice(peers, PARALLEL_PEER_THRESHOLD))
+        peers = itertools.chain(head, peers)
+        workers = os.cpu_count() or 1
+
+        if len(head) >= PARALLEL_PEER_THRESHOLD and workers > 1:
+            renders = self._iter_parallel_renders(
+                peers, vendor, batch_timestamp, workers
+            )
+        else:
+
+            def start_render(asn, peer_info):
+                # Rendered on first call; repeated entries reuse the result
+                return functools.lru_cache(maxsize=None)(
+                    functools.partial(
+                        self.generate_peer_config,
+                        asn,
+                        peer_info,
+                        vendor,
+                        batch_timestamp=batch_timestamp,
+                    )
+                )
+
+            renders = _shared_renders(peers, start_render)
 
+        for asn, render in renders:
+            try:
+                config_content = render()
             except Exception as e:
                 logger.error(f"Failed to generate config for {asn}: {e}")
                 failed += 1
+                continue
 
+            successful += 1
+            yield asn, config_content
+
+        self.flush_events()
         logger.info(f"✓ Generated {successful} configurations, {failed} failed")
-        return results
+
+    def _iter_parallel_renders(
+        self,
+        peers: Iterator[Tuple[str, Dict[str, Any]]],
+        vendor: str,
+        batch_timestamp: str,
+        workers: int,
+    ) -> Iterator[Tuple[str, Callable[[], str]]]:
+        """
+        Render peers in worker processes, yielding (ASN, result getter) pairs
+
+        Rendering and validation are CPU bound, so large batches are spread
+        over worker processes, each with its own generator. At most
+        2 * workers renders are in flight, so neither the input nor the
+        results are ever held in memory as a whole.
+        """
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.config,),
+        ) as executor:
+            window = deque()
+            renders = _shared_renders(
+                peers,
+                lambda asn, peer_info: executor.submit(
+                    _generate_in_worker, asn, peer_info, vendor, batch_timestamp
+                ).result,
+            )
+            for asn, render in renders:
+                window.append((asn, render))
+                if len(window) >= 2 * workers:
+                    yield window.popleft()
+
+            while window:
+                yield window.popleft()
+
+    def iter_write_configs(
+        self, results: Union[Dict[str, str], Iterable[Tuple[str, str]]], output_dir: str
+    ) -> Iterator[Path]:
+        """
+        Write generated configurations to <output_dir>/<asn>.conf
+
+        Results are read as writes complete, keeping at most
+        2 * WRITE_WORKERS configurations in memory. Writes of a repeated
+        ASN happen in order, so the last configuration for it wins.
+
+        Args:
+            results: Dictionary, or iterable of pairs, mapping ASN to generated
+                configuration
+            output_dir: Directory to write the configuration files to
+
+        Yields:
+            Each written file path, in the order of results
+        """
+        if isinstance(results, dict):
+            results = results.items()
+
+        output_path = Path(output_dir)
+        self._ensure_dir(output_path)
+
+        # Each file is independent I/O, so overlap the writes in a thread pool
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            window = deque()
+            # Output file -> its latest write still in the window
+            pending = {}
+            for asn, config_content in results:
+                output_file = output_path / f"{str(asn).lower()}.conf"
+                if output_file in pending:
+                    pending[output_file].result()
+
+                future = executor.submit(atomic_write, output_file, config_content)
+                window.append(future)
+                pending[output_file] = future
+                if len(window) >= 2 * WRITE_WORKERS:
+                    yield self._finish_write(window.popleft(), pending)
+
+            while window:
+                yield self._finish_write(window.popleft(), pending)
+
+    @staticmethod
+    def _finish_write(future, pending: Dict[Path, Any]) -> Path:
+        """Wait for a write and forget it unless a later write replaced it"""
+        output_file = future.result()
+        if pending.get(output_file) is future:
+            del pending[output_file]
+        return output_file
+
+    def write_configs(
+        self, results: Union[Dict[str, str], Iterable[Tuple[str, str]]], output_dir: str
+    ) -> List[Path]:
+        """
+        Write generated configurations to <output_dir>/<asn>.conf
+
+        Args:
+            results: Dictionary, or iterable of pairs, mapping ASN to generated
+                configuration
+            output_dir: Directory to write the configuration files to
+
+        Returns:
+            List of written file paths, in the order of results
+        """
+        return list(self.iter_write_configs(results, output_dir))
+
+    def format_configs(self, results: Dict[str, str]) -> str:
+        """
+        Format generated configurations as one text block for output
+
+        Args:
+            results: Dictionary mapping ASN to generated configuration
+
+        Returns:
+            All configurations, each preceded by a comment naming its ASN
+        """
+        return "".join(
+            f"\n# Configuration for {asn}\n{config_content}\n"
+            for asn, config_content in results.items()
+        )
 
     def list_available_vendors(self) -> List[str]:
         """List available vendor plugins"""
@@ -224,7 +530,7 @@ class PeerConfigGenerator:
 
     def get_vendor_features(self, vendor: str) -> List[str]:
         """Get supported features for a vendor"""
-        vendor_plugin = self.plugin_manager.get_vendor_plugin(vendor)
+        vendor_plugin = self._get_vendor_plugin(vendor)
         if vendor_plugin:
             return vendor_plugin.get_supported_features()
         return []
@@ -239,22 +545,21 @@ class PeerConfigGenerator:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-
         # Required fields
-        required_fields = ["asn", "name"]
-        for field in required_fields:
-            if field not in peer_info:
-                errors.append(f"Missing required field: {field}")
+        errors = [
+            f"Missing required field: {field}"
+            for field in REQUIRED_PEER_FIELDS
+            if field not in peer_info
+        ]
 
         # Validate ASN format
         asn = peer_info.get("asn", "")
-        if asn and not asn.startswith("AS"):
-            errors.append(f"Invalid ASN format: {asn} (should start with 'AS')")
+        if asn and not ASN_PATTERN.fullmatch(str(asn)):
+            errors.append(
+                f"Invalid ASN format: {asn} (should be 'AS' followed by digits)"
+            )
 
         # Validate IP addresses if present
-        from lib.utils import validate_network_address
-
         for ip_field in ["ipv4", "ipv6"]:
             if ip_field in peer_info:
                 ip_addr = peer_info[ip_field]
@@ -263,6 +568,145 @@ class PeerConfigGenerator:
 
         return errors
 
+    def validate_peer_batch(self, peers: List[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Validate a batch of peers, matching all ASNs in a single regex pass
+
+        Args:
+            peers: List of peer information dictionaries
+
+        Returns:
+            List of validation errors per peer, in input order
+        """
+        asns = [str(peer.get("asn", "")) for peer in peers]
+
+        # Offsets of each ASN in the joined text; a match only counts when it
+        # spans exactly one entry, so stray newlines inside an ASN can't pass
+        spans = {}
+        offset = 0
+        for index, asn in enumerate(asns):
+            spans[offset] = (index, offset + len(asn))
+            offset += len(asn) + 1
+
+        valid_asns = set()
+        for match in ASN_BATCH_PATTERN.finditer("\n".join(asns)):
+            index, end = spans.get(match.start(), (None, None))
+            if match.end() == end:
+                valid_asns.add(index)
+
+        results = []
+        for index, peer_info in enumerate(peers):
+            errors = [
+                f"Missing required field: {field}"
+                for field in REQUIRED_PEER_FIELDS
+                if field not in peer_info
+            ]
+
+            if peer_info.get("asn", "") and index not in valid_asns:
+                errors.append(
+                    f"Invalid ASN format: {peer_info['asn']} "
+                    "(should be 'AS' followed by digits)"
+                )
+
+            errors.extend(
+                f"Invalid {ip_field} address: {peer_info[ip_field]}"
+                for ip_field in ("ipv4", "ipv6")
+                if ip_field in peer_info
+                and not validate_network_address(peer_info[ip_field])
+            )
+            results.append(errors)
+
+        return results
+
+    def _new_template_env(self, loader, **options):
+        """Create a Jinja2 environment with the generator's template settings"""
+        from jinja2 import Environment
+
+        # Network config templates don't need HTML escaping (not user-facing web content)
+        # Templates don't change during a run, so skip per-render mtime checks
+        return Environment(
+            loader=loader,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            autoescape=False,  # nosec - Network configs, not web templates
+            auto_reload=False,
+            **options,
+        )
+
+    @property
+    def _template_env(self):
+        """Jinja2 environment shared by all template renders of this generator"""
+        if self._template_env_instance is None:
+            self._template_env_instance = self._create_template_env()
+        return self._template_env_instance
+
+    def _create_template_env(self):
+        """Create the Jinja2 environment used for template renders"""
+        from jinja2 import (
+            ChoiceLoader,
+            FileSystemBytecodeCache,
+            FileSystemLoader,
+            ModuleLoader,
+        )
+
+        loader = FileSystemLoader(str(self.template_dir))
+
+        # Prefer templates precompiled with compile_templates(), as long as
+        # the archive is not older than any template source
+        if self._compiled_templates_current():
+            logger.debug(f"Using precompiled templates: {self.compiled_templates}")
+            return self._new_template_env(
+                ChoiceLoader([ModuleLoader(str(self.compiled_templates)), loader])
+            )
+
+        # Persist compiled templates so later runs skip parsing and compiling
+        # them; entries are keyed on the template source checksum
+        bytecode_cache = None
+        bytecode_dir = Path(self.config_manager.cache_dir) / "jinja"
+        try:
+            bytecode_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+        except OSError as e:
+            logger.debug(f"Jinja2 bytecode cache disabled: {e}")
+
+        return self._new_template_env(loader, bytecode_cache=bytecode_cache)
+
+    def _compiled_templates_current(self) -> bool:
+        """Check that the precompiled template archive exists and is up to date"""
+        try:
+            archive_mtime = self.compiled_templates.stat().st_mtime_ns
+            return all(
+                entry.stat().st_mtime_ns <= archive_mtime
+                for entry in os.scandir(self.template_dir)
+                if entry.is_file()
+            )
+        except OSError:
+            return False
+
+    def compile_templates(self, target: str = None) -> Path:
+        """
+        Precompile all templates into a zip archive of Python modules
+
+        Renders load the archive instead of parsing template sources for as
+        long as it is newer than every template.
+
+        Args:
+            target: Archive path (default: the compiled_templates setting)
+
+        Returns:
+            Path of the written archive
+        """
+        from jinja2 import FileSystemLoader
+
+        target_path = Path(target) if target else self.compiled_templates
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        env = self._new_template_env(FileSystemLoader(str(self.template_dir)))
+        env.compile_templates(str(target_path), zip="deflated", ignore_errors=False)
+
+        logger.info(f"Compiled templates written to: {target_path}")
+        return target_path
+
     def generate_from_template_file(
         self, template_file: str, variables: Dict[str, Any], output_file: str = None
     ) -> str:
@@ -278,30 +722,20 @@ class PeerConfigGenerator:
             Generated configuration content
         """
         try:
-            from jinja2 import Environment, FileSystemLoader
-
-            # Set up Jinja2 environment
-            # Network config templates don't need HTML escaping (not user-facing web content)
-            env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                trim_blocks=True,
-                lstrip_blocks=True,
-                autoescape=False,  # nosec - Network configs, not web templates
-            )
-
-            # Load template
-            template = env.get_template(template_file)
+            # Load template (compiled once per generator and reused)
+            render = self._template_renders.get(template_file)
+            if render is None:
+                render = self._template_env.get_template(template_file).render
+                self._template_renders[template_file] = render
 
             # Render configuration
-            config_content = template.render(**variables)
+            config_content = render(**variables)
 
             # Save to file if requested
             if output_file:
                 output_path = Path(output_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(config_content)
+                self._ensure_dir(output_path.parent)
+                atomic_write(output_path, config_content)
 
                 logger.info(f"Configuration saved to: {output_path}")
 
@@ -312,6 +746,81 @@ class PeerConfigGenerator:
             raise
 
 
+@functools.lru_cache(maxsize=None)
+def _state():
+    """Import lib.state_manager on first use; listing and validation never need it"""
+    return importlib.import_module("lib.state_manager")
+
+
+def _write_events(
+    buffer: Deque["StateEvent"], lock: threading.Lock, config: Dict[str, Any]
+) -> None:
+    """Write and clear a generator's buffered events"""
+    with lock:
+        events = list(buffer)
+        buffer.clear()
+
+    if events:
+        _state().get_state_manager(config=config).track_events(events)
+
+
+# Generator instance of a generate_multiple_peers worker process
+_worker_generator: Optional[PeerConfigGenerator] = None
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """Create the generator used by a worker process"""
+    global _worker_generator
+    _worker_generator = PeerConfigGenerator(config)
+
+    # Worker processes skip atexit handlers, so flush buffered events on exit
+    multiprocessing.util.Finalize(
+        _worker_generator, _worker_generator.flush_events, exitpriority=10
+    )
+
+
+def _generate_in_worker(
+    asn: str, peer_info: Dict[str, Any], vendor: str, batch_timestamp: str
+) -> str:
+    """Generate a peer configuration in a worker process"""
+    return _worker_generator.generate_peer_config(
+        asn, peer_info, vendor, batch_timestamp=batch_timestamp
+    )
+
+
+def _render_key(peer_info: Dict[str, Any]) -> Optional[str]:
+    """Canonical form of a peer's render input, or None if it has none"""
+    try:
+        return json.dumps(peer_info, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _shared_renders(
+    peers: Iterable[Tuple[str, Dict[str, Any]]],
+    start_render: Callable[[str, Dict[str, Any]], Callable[[], str]],
+) -> Iterator[Tuple[str, Callable[[], str]]]:
+    """
+    Start one render per distinct peer entry, yielding (ASN, result getter) pairs
+
+    A repeated entry (e.g. from merged peer lists) reuses the getter of the
+    identical entry among the last RENDER_CACHE_SIZE distinct ones.
+    """
+    recent: "OrderedDict[str, Callable[[], str]]" = OrderedDict()
+    for asn, peer_info in peers:
+        key = _render_key(peer_info)
+        render = recent.get(key) if key is not None else None
+        if render is None:
+            render = start_render(asn, peer_info)
+            if key is not None:
+                recent[key] = render
+                if len(recent) > RENDER_CACHE_SIZE:
+                    recent.popitem(last=False)
+        else:
+            recent.move_to_end(key)
+        yield asn, render
+
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(
@@ -358,6 +867,13 @@ Examples:
     parser.add_argument(
         "--validate-only", action="store_true", help="Validate peer information only"
     )
+    parser.add_argument(
+        "--compile-templates",
+        metavar="ARCHIVE",
+        nargs="?",
+        const="",
+        help="Precompile templates into a zip archive and exit",
+    )
 
     args = parser.parse_args()
 
@@ -373,6 +889,12 @@ Examples:
         # Create generator
         generator = PeerConfigGenerator(config)
 
+        # Handle template precompilation
+        if args.compile_templates is not None:
+            output_file = generator.compile_templates(args.compile_templates or None)
+            print(f"✓ Compiled templates: {output_file}")
+            return
+
         # Handle information requests
         if args.list_vendors:
             vendors = generator.list_available_vendors()
@@ -393,20 +915,13 @@ Examples:
 
         # Handle peer file processing
         if args.peer_file:
-            import json
-
-            with open(args.peer_file, "r") as f:
-                peer_data = json.load(f)
-
-            if isinstance(peer_data, list):
-                peer_list = peer_data
-            else:
-                peer_list = [peer_data]
+            peer_list = iter_json_items(args.peer_file)
 
             if args.validate_only:
                 # Validate all peers
-                for i, peer_info in enumerate(peer_list):
-                    errors = generator.validate_peer_info(peer_info)
+                peer_list = list(peer_list)
+                batch_errors = generator.validate_peer_batch(peer_list)
+                for i, (peer_info, errors) in enumerate(zip(peer_list, batch_errors)):
                     if errors:
                         print(f"Peer {i+1} validation errors:")
                         for error in errors:
@@ -416,22 +931,16 @@ Examples:
                             f"✓ Peer {i+1} ({peer_info.get('asn', 'unknown')}) is valid"
                         )
             else:
-                # Generate configurations
-                results = generator.generate_multiple_peers(peer_list, args.vendor)
-
+                # Generate configurations, writing files as they are generated
                 if args.output_dir:
-                    output_dir = Path(args.output_dir)
-                    output_dir.mkdir(parents=True, exist_ok=True)
-
-                    for asn, config_content in results.items():
-                        output_file = output_dir / f"{asn.lower()}.conf"
-                        with open(output_file, "w") as f:
-                            f.write(config_content)
+                    results = generator.iter_generate_peers(peer_list, args.vendor)
+                    for output_file in generator.iter_write_configs(
+                        results, args.output_dir
+                    ):
                         print(f"✓ Generated: {output_file}")
                 else:
-                    for asn, config_content in results.items():
-                        print(f"\n# Configuration for {asn}")
-                        print(config_content)
+                    results = generator.generate_multiple_peers(peer_list, args.vendor)
+                    sys.stdout.write(generator.format_configs(results))
 
             return
 
@@ -462,6 +971,7 @@ Examples:
             config_content = generator.generate_peer_config(
                 args.asn, peer_info, args.vendor, args.output
             )
+            generator.flush_events()
 
             if not args.output:
                 print(config_content)
@@ -6,14 +6,11 @@ Enhanced support for traditional BGP communities and RFC 8092 Large Communities.
 Includes validation, parsing, and formatting utilities.
 """
 
-import re
-import logging
-from typing import List, Dict, Any, Union, Optional, Tuple
+import functools
+from typing import List, Dict, Iterable, Union, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-logger = logging.getLogger(__name__)
-
 
 class CommunityType(Enum):
     """Types of BGP communities"""
@@ -22,18 +19,50 @@ class CommunityType(Enum):
     LARGE = "large"             # ASN:LocalData1:LocalData2 (RFC 8092)
 
 
-@dataclass
+@dataclass(frozen=True, init=False)
 class BGPCommunity:
     """BGP Community representation"""
+    # Explicit slots rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('community_type', 'value', 'packed')
+    
     community_type: CommunityType
     value: str
-    parsed_value: Tuple[int, ...]
+    # Parts packed into one int: asn << 16 | value for standard communities,
+    # asn << 64 | local1 << 32 | local2 for large communities
+    packed: int
+    
+    def __init__(self, community_type: CommunityType, value: str,
+                 packed: Union[int, Tuple[int, ...], None] = None, *,
+                 parsed_value: Optional[Tuple[int, ...]] = None):
+        # Callers written against the old (community_type, value, parsed_value)
+        # signature pass the parts as a tuple, positionally or by keyword
+        if parsed_value is not None:
+            packed = parsed_value
+        if isinstance(packed, tuple):
+            packed = _pack(packed)
+        if packed is None:
+            raise TypeError("BGPCommunity() missing 'packed' or 'parsed_value'")
+        object.__setattr__(self, 'community_type', community_type)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'packed', packed)
     
     def __str__(self) -> str:
         return self.value
     
     def __repr__(self) -> str:
         return f"BGPCommunity({self.community_type.value}, {self.value})"
+    
+    def __reduce__(self):
+        # Frozen slots can't be restored with setattr, so copy/pickle via __init__
+        return self.__class__, (self.community_type, self.value, self.packed)
+    
+    @property
+    def parsed_value(self) -> Tuple[int, ...]:
+        """Community parts, unpacked from the packed integer"""
+        packed = self.packed
+        if self.community_type is CommunityType.LARGE:
+            return packed >> 64, packed >> 32 & 0xFFFFFFFF, packed & 0xFFFFFFFF
+        return packed >> 16, packed & 0xFFFF
 
 
 class BGPCommunityManager:
@@ -56,7 +85,8 @@ class BGPCommunityManager:
     def __init__(self):
         self.communities: List[BGPCommunity] = []
     
-    def validate_standard_community(self, community: str) -> bool:
+    @staticmethod
+    def validate_standard_community(community: str) -> bool:
         """
         Validate standard BGP community format (16:16)
         
@@ -66,27 +96,10 @@ class BGPCommunityManager:
         Returns:
             True if valid standard community
         """
-        try:
-            # Standard community format: ASN:VALUE (both 16-bit)
-            if not re.match(r'^\d+:\d+$', community):
-                return False
-            
-            parts = community.split(':')
-            if len(parts) != 2:
-                return False
-            
-            asn, value = int(parts[0]), int(parts[1])
-            
-            # Both parts must fit in 16 bits (0-65535)
-            if not (0 <= asn <= 65535 and 0 <= value <= 65535):
-                return False
-            
-            return True
-            
-        except (ValueError, TypeError):
-            return False
+        return _validate_standard(community)
     
-    def validate_large_community(self, community: str) -> bool:
+    @staticmethod
+    def validate_large_community(community: str) -> bool:
         """
         Validate large BGP community format (32:32:32) per RFC 8092
         
@@ -96,28 +109,10 @@ class BGPCommunityManager:
         Returns:
             True if valid large community
         """
-        try:
-            # Large community format: ASN:LocalData1:LocalData2 (all 32-bit)
-            if not re.match(r'^\d+:\d+:\d+$', community):
-                return False
-            
-            parts = community.split(':')
-            if len(parts) != 3:
-                return False
-            
-            asn, local1, local2 = int(parts[0]), int(parts[1]), int(parts[2])
-            
-            # All parts must fit in 32 bits (0-4294967295)
-            max_32bit = 4294967295
-            if not (0 <= asn <= max_32bit and 0 <= local1 <= max_32bit and 0 <= local2 <= max_32bit):
-                return False
-            
-            return True
-            
-        except (ValueError, TypeError):
-            return False
+        return _validate_large(community)
     
-    def validate_community(self, community: str) -> Tuple[bool, CommunityType]:
+    @staticmethod
+    def validate_community(community: str) -> Tuple[bool, CommunityType]:
         """
         Validate any BGP community format and return its type
         
@@ -127,25 +122,32 @@ class BGPCommunityManager:
         Returns:
             Tuple of (is_valid, community_type)
         """
-        # Check for well-known communities by name
-        if community.upper() in self.WELL_KNOWN_COMMUNITIES:
-            return True, CommunityType.STANDARD
+        return _validate_impl(community)
+    
+    @staticmethod
+    def validate_many(communities: List[str]) -> List[bool]:
+        """
+        Validate a list of communities, e.g. a route server filter policy
         
-        # Check for large community format first (3 parts)
-        if ':' in community and len(community.split(':')) == 3:
-            if self.validate_large_community(community):
-                return True, CommunityType.LARGE
-            else:
-                return False, CommunityType.LARGE
+        Uses the numba-compiled batch validator when numba is installed.
         
-        # Check for standard community format (2 parts)
-        elif ':' in community and len(community.split(':')) == 2:
-            if self.validate_standard_community(community):
-                return True, CommunityType.STANDARD
-            else:
-                return False, CommunityType.STANDARD
+        Args:
+            communities: Community strings
+            
+        Returns:
+            List of validity flags in input order
+        """
+        from lib.bgp_communities_fast import validate_numeric_batch
         
-        return False, CommunityType.STANDARD
+        valid = validate_numeric_batch(communities)
+        if valid is None:
+            return [_validate_impl(community)[0] for community in communities]
+        
+        # Well-known communities are names, which the numeric validator rejects
+        return [
+            is_valid or (':' not in community and community.upper() in _WELL_KNOWN_PARSED)
+            for is_valid, community in zip(valid, communities)
+        ]
     
     def parse_community(self, community: str) -> Optional[BGPCommunity]:
         """
@@ -157,29 +159,7 @@ class BGPCommunityManager:
         Returns:
             BGPCommunity object or None if invalid
         """
-        # Handle well-known communities
-        if community.upper() in self.WELL_KNOWN_COMMUNITIES:
-            actual_value = self.WELL_KNOWN_COMMUNITIES[community.upper()]
-            parts = tuple(int(x) for x in actual_value.split(':'))
-            return BGPCommunity(
-                community_type=CommunityType.STANDARD,
-                value=actual_value,
-                parsed_value=parts
-            )
-        
-        is_valid, comm_type = self.validate_community(community)
-        if not is_valid:
-            return None
-        
-        try:
-            parts = tuple(int(x) for x in community.split(':'))
-            return BGPCommunity(
-                community_type=comm_type,
-                value=community,
-                parsed_value=parts
-            )
-        except ValueError:
-            return None
+        return _parse_impl(community)
     
     def add_community(self, community: str) -> bool:
         """
@@ -197,9 +177,30 @@ class BGPCommunityManager:
             return True
         return False
     
+    def parse_communities(self, communities: Iterable[str]) -> List[BGPCommunity]:
+        """
+        Parse and add many communities at once, skipping invalid ones
+        
+        Args:
+            communities: Community strings to add
+            
+        Returns:
+            List of the parsed communities that were added
+        """
+        parse = _parse_impl
+        parsed = []
+        append = parsed.append
+        for community in communities:
+            result = parse(community)
+            if result is not None:
+                append(result)
+        
+        self.communities.extend(parsed)
+        return parsed
+    
     def get_communities_by_type(self, community_type: CommunityType) -> List[BGPCommunity]:
         """Get all communities of a specific type"""
-        return [c for c in self.communities if c.community_type == community_type]
+        return [c for c in self.communities if c.community_type is community_type]
     
     def format_for_vendor(self, vendor: str, community_type: CommunityType = None) -> List[str]:
         """
@@ -216,63 +217,47 @@ class BGPCommunityManager:
         if community_type:
             communities = self.get_communities_by_type(community_type)
         
-        if vendor.lower() == "bird":
-            return self._format_bird_communities(communities)
-        elif vendor.lower() == "cisco":
-            return self._format_cisco_communities(communities)
-        elif vendor.lower() == "frr":
-            return self._format_frr_communities(communities)
-        else:
+        formatter = self._FORMATTERS.get(vendor.lower())
+        if formatter is None:
             # Generic format
             return [c.value for c in communities]
+        return formatter(self, communities)
     
     def _format_bird_communities(self, communities: List[BGPCommunity]) -> List[str]:
         """Format communities for BIRD router"""
-        formatted = []
+        standard, large = CommunityType.STANDARD, CommunityType.LARGE
         
-        for comm in communities:
-            if comm.community_type == CommunityType.STANDARD:
-                # BIRD format: (asn, value)
-                asn, value = comm.parsed_value
-                formatted.append(f"({asn}, {value})")
-            elif comm.community_type == CommunityType.LARGE:
-                # BIRD large community format: (asn, local1, local2)
-                asn, local1, local2 = comm.parsed_value
-                formatted.append(f"({asn}, {local1}, {local2})")
-        
-        return formatted
+        # BIRD format: (asn, value), large communities: (asn, local1, local2)
+        return [
+            f"({n >> 16}, {n & 0xFFFF})" if comm.community_type is standard
+            else f"({n >> 64}, {n >> 32 & 0xFFFFFFFF}, {n & 0xFFFFFFFF})"
+            for comm in communities
+            if comm.community_type is standard or comm.community_type is large
+            for n in (comm.packed,)
+        ]
     
-    def _format_cisco_communities(self, communities: List[BGPCommunity]) -> List[str]:
-        """Format communities for Cisco routers"""
-        formatted = []
-        
-        for comm in communities:
-            if comm.community_type == CommunityType.STANDARD:
-                # Cisco format: ASN:VALUE
-                formatted.append(comm.value)
-            elif comm.community_type == CommunityType.LARGE:
-                # Cisco large community format: large:ASN:LOCAL1:LOCAL2
-                asn, local1, local2 = comm.parsed_value
-                formatted.append(f"large:{asn}:{local1}:{local2}")
+    def _format_asn_colon_communities(self, communities: List[BGPCommunity]) -> List[str]:
+        """Format communities for Cisco and FRRouting routers"""
+        standard, large = CommunityType.STANDARD, CommunityType.LARGE
         
-        return formatted
+        # Format: ASN:VALUE, large communities: large:ASN:LOCAL1:LOCAL2
+        return [
+            comm.value if comm.community_type is standard
+            else f"large:{n >> 64}:{n >> 32 & 0xFFFFFFFF}:{n & 0xFFFFFFFF}"
+            for comm in communities
+            if comm.community_type is standard or comm.community_type is large
+            for n in (comm.packed,)
+        ]
     
-    def _format_frr_communities(self, communities: List[BGPCommunity]) -> List[str]:
-        """Format communities for FRRouting"""
-        formatted = []
-        
-        for comm in communities:
-            if comm.community_type == CommunityType.STANDARD:
-                # FRR format: ASN:VALUE
-                formatted.append(comm.value)
-            elif comm.community_type == CommunityType.LARGE:
-                # FRR large community format: large:ASN:LOCAL1:LOCAL2
-                asn, local1, local2 = comm.parsed_value
-                formatted.append(f"large:{asn}:{local1}:{local2}")
-        
-        return formatted
+    # Vendor name -> formatter; other vendors get the plain community values
+    _FORMATTERS = {
+        "bird": _format_bird_communities,
+        "cisco": _format_asn_colon_communities,
+        "frr": _format_asn_colon_communities,
+    }
     
-    def generate_blackhole_communities(self, asn: int, use_large: bool = True) -> List[str]:
+    @staticmethod
+    def generate_blackhole_communities(asn: int, use_large: bool = True) -> List[str]:
         """
         Generate blackhole communities for the specified ASN
         
@@ -283,28 +268,10 @@ class BGPCommunityManager:
         Returns:
             List of blackhole community strings
         """
-        communities = []
-        
-        # Traditional blackhole community (RFC 7999)
-        communities.append("65535:666")
-        
-        # ASN-specific blackhole community
-        if asn <= 65535:
-            # 16-bit ASN - use standard community
-            communities.append(f"{asn}:666")
-        else:
-            # 32-bit ASN - use large community if requested
-            if use_large:
-                communities.append(f"{asn}:666:0")
-            # Also provide a traditional community with ASN encoded
-            # Some operators use high-order/low-order encoding
-            high = asn >> 16
-            low = asn & 0xFFFF
-            communities.append(f"{high}:{low}")
-        
-        return communities
+        return list(_blackhole_communities(asn, use_large))
     
-    def validate_asn_32bit(self, asn: Union[str, int]) -> bool:
+    @staticmethod
+    def validate_asn_32bit(asn: Union[str, int]) -> bool:
         """
         Validate 32-bit ASN number
         
@@ -314,28 +281,24 @@ class BGPCommunityManager:
         Returns:
             True if valid 32-bit ASN
         """
-        try:
-            if isinstance(asn, str):
-                # Remove AS prefix if present
-                if asn.upper().startswith('AS'):
-                    asn_num = int(asn[2:])
-                else:
-                    asn_num = int(asn)
-            else:
-                asn_num = int(asn)
-            
-            # Valid 32-bit ASN range (excluding reserved ranges)
-            # 0 is reserved, 23456 is reserved for AS_TRANS, 4294967295 is reserved
-            if asn_num == 0 or asn_num == 23456 or asn_num == 4294967295:
-                return False
-            
-            # Valid range: 1-4294967294
-            return 1 <= asn_num <= 4294967294
-            
-        except (ValueError, TypeError):
+        # Fast path for ASNs that are already integers (e.g. loaded from YAML)
+        if type(asn) is int:
+            return 1 <= asn <= 4294967294 and asn != 23456
+        
+        asn_num = _asn_to_int(asn)
+        if asn_num is None:
+            return False
+        
+        # Valid 32-bit ASN range (excluding reserved ranges)
+        # 0 is reserved, 23456 is reserved for AS_TRANS, 4294967295 is reserved
+        if asn_num == 0 or asn_num == 23456 or asn_num == 4294967295:
             return False
+        
+        # Valid range: 1-4294967294
+        return 1 <= asn_num <= 4294967294
     
-    def is_32bit_asn(self, asn: Union[str, int]) -> bool:
+    @staticmethod
+    def is_32bit_asn(asn: Union[str, int]) -> bool:
         """
         Check if ASN is a 32-bit ASN (> 65535)
         
@@ -345,19 +308,142 @@ class BGPCommunityManager:
         Returns:
             True if 32-bit ASN
         """
-        try:
-            if isinstance(asn, str):
-                if asn.upper().startswith('AS'):
-                    asn_num = int(asn[2:])
-                else:
-                    asn_num = int(asn)
-            else:
-                asn_num = int(asn)
-            
-            return asn_num > 65535
-            
-        except (ValueError, TypeError):
-            return False
+        if type(asn) is int:
+            return asn > 65535
+        
+        asn_num = _asn_to_int(asn)
+        return asn_num is not None and asn_num > 65535
+
+
+def _asn_to_int(asn: Union[str, int]) -> Optional[int]:
+    """ASN as an integer, or None if it is not a number"""
+    if isinstance(asn, str):
+        # Remove AS prefix if present; check digits up front rather than
+        # letting int() raise on malformed input
+        if asn.upper().startswith('AS'):
+            asn = asn[2:]
+        asn = asn.strip()
+        return int(asn) if asn.isdecimal() else None
+    
+    try:
+        return int(asn)
+    except (ValueError, TypeError):
+        return None
+
+
+# Traditional blackhole community (RFC 7999)
+_RFC7999_BLACKHOLE = "65535:666"
+
+
+def _pack(parts: Tuple[int, ...]) -> int:
+    """Pack standard (16-bit) or large (32-bit) community parts into one int"""
+    if len(parts) == 3:
+        return parts[0] << 64 | parts[1] << 32 | parts[2]
+    return parts[0] << 16 | parts[1]
+
+
+# Well-known communities by name, parsed once at import
+_WELL_KNOWN_PARSED: Dict[str, BGPCommunity] = {
+    name: BGPCommunity(CommunityType.STANDARD, value, _pack(tuple(int(x) for x in value.split(':'))))
+    for name, value in BGPCommunityManager.WELL_KNOWN_COMMUNITIES.items()
+}
+
+
+def _split_and_validate(community: str) -> Tuple[bool, CommunityType, Optional[Tuple[int, ...]]]:
+    """
+    Split a community string once and validate its parts
+    
+    Args:
+        community: Community string (e.g., "64512:100" or "64512:1:100")
+        
+    Returns:
+        Tuple of (is_valid, community_type, parsed_value); parsed_value is
+        None if the community is invalid
+    """
+    parts = community.split(':')
+    
+    # Large communities have three 32-bit parts, standard ones two 16-bit parts
+    if len(parts) == 3:
+        comm_type, max_value = CommunityType.LARGE, 4294967295
+    elif len(parts) == 2:
+        comm_type, max_value = CommunityType.STANDARD, 65535
+    else:
+        return False, CommunityType.STANDARD, None
+    
+    # One C-level digit sweep over the whole string instead of one per part
+    if '' in parts or not community.replace(':', '').isdecimal():
+        return False, comm_type, None
+    
+    parsed_value = tuple(map(int, parts))
+    if max(parsed_value) > max_value:
+        return False, comm_type, None
+    
+    return True, comm_type, parsed_value
+
+
+def _validate_standard(community: str) -> bool:
+    """Validate a standard community string, see validate_standard_community"""
+    if not isinstance(community, str):
+        return False
+    is_valid, comm_type, _ = _split_and_validate(community)
+    return is_valid and comm_type is CommunityType.STANDARD
+
+
+def _validate_large(community: str) -> bool:
+    """Validate a large community string, see validate_large_community"""
+    if not isinstance(community, str):
+        return False
+    is_valid, comm_type, _ = _split_and_validate(community)
+    return is_valid and comm_type is CommunityType.LARGE
+
+
+# Community parsing is a pure function of the community string, and policies
+# reuse the same few communities across peers, so the results are cached
+@functools.lru_cache(maxsize=8192)
+def _validate_impl(community: str) -> Tuple[bool, CommunityType]:
+    """Validate any community string, see validate_community"""
+    # Well-known communities are names without ':', so numeric
+    # communities skip the uppercase copy and lookup
+    if ':' not in community:
+        return community.upper() in _WELL_KNOWN_PARSED, CommunityType.STANDARD
+    
+    is_valid, comm_type, _ = _split_and_validate(community)
+    return is_valid, comm_type
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_impl(community: str) -> Optional[BGPCommunity]:
+    """Parse a community string, see parse_community"""
+    # Handle well-known communities
+    if ':' not in community:
+        return _WELL_KNOWN_PARSED.get(community.upper())
+    
+    is_valid, comm_type, parts = _split_and_validate(community)
+    if not is_valid:
+        return None
+    
+    return BGPCommunity(
+        community_type=comm_type,
+        value=community,
+        packed=_pack(parts)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _blackhole_communities(asn: int, use_large: bool) -> Tuple[str, ...]:
+    """Blackhole communities for an ASN, see generate_blackhole_communities"""
+    # ASN-specific blackhole community
+    if asn <= 65535:
+        # 16-bit ASN - use standard community
+        return _RFC7999_BLACKHOLE, f"{asn}:666"
+    
+    # Also provide a traditional community with ASN encoded
+    # Some operators use high-order/low-order encoding
+    high, low = divmod(asn, 65536)
+    if use_large:
+        # 32-bit ASN - use large community if requested
+        return _RFC7999_BLACKHOLE, f"{asn}:666:0", f"{high}:{low}"
+    return _RFC7999_BLACKHOLE, f"{high}:{low}"
 
 
 def create_community_manager() -> BGPCommunityManager:
@@ -368,19 +454,16 @@ def create_community_manager() -> BGPCommunityManager:
 # Utility functions for backward compatibility
 def validate_32bit_asn(asn: Union[str, int]) -> bool:
     """Validate 32-bit ASN - utility function"""
-    manager = BGPCommunityManager()
-    return manager.validate_asn_32bit(asn)
+    return BGPCommunityManager.validate_asn_32bit(asn)
 
 
 def validate_large_community(community: str) -> bool:
     """Validate large community - utility function"""
-    manager = BGPCommunityManager()
-    return manager.validate_large_community(community)
+    return BGPCommunityManager.validate_large_community(community)
 
 
 def generate_blackhole_communities(asn: Union[str, int], use_large: bool = True) -> List[str]:
     """Generate blackhole communities - utility function"""
-    manager = BGPCommunityManager()
     if isinstance(asn, str):
         if asn.upper().startswith('AS'):
             asn_num = int(asn[2:])
@@ -389,7 +472,7 @@ def generate_blackhole_communities(asn: Union[str, int], use_large: bool = True)
     else:
         asn_num = int(asn)
     
-    return manager.generate_blackhole_communities(asn_num, use_large)
+    return BGPCommunityManager.generate_blackhole_communities(asn_num, use_large)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Bulk BGP Community Validation for AutoNet
+
+Numba-compiled validator for large community lists, such as route server
+filter policies. Only used when numba is installed; BGPCommunityManager
+falls back to the pure-Python validators otherwise.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional speedup
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _validate_batch(buf, offsets):
+        """Validate each ASCII community buf[offsets[i]:offsets[i + 1]]"""
+        count = offsets.shape[0] - 1
+        valid = np.zeros(count, dtype=np.bool_)
+
+        for i in numba.prange(count):
+            colons = 0
+            digits = 0
+            value = 0
+            largest = 0
+            ok = True
+
+            for j in range(offsets[i], offsets[i + 1]):
+                char = buf[j]
+                if 48 <= char <= 57:
+                    value = value * 10 + (char - 48)
+                    digits += 1
+                    # Stop before a long digit run can overflow int64
+                    if value > 4294967295:
+                        ok = False
+                        break
+                elif char == 58 and digits > 0 and colons < 2:
+                    largest = max(largest, value)
+                    colons += 1
+                    digits = 0
+                    value = 0
+                else:
+                    ok = False
+                    break
+
+            if ok and digits > 0 and colons > 0:
+                largest = max(largest, value)
+                # Standard communities are 16:16, large ones 32:32:32
+                valid[i] = largest <= (65535 if colons == 1 else 4294967295)
+
+        return valid
+
+
+def validate_numeric_batch(communities: Sequence[str]) -> Optional[List[bool]]:
+    """
+    Validate numeric standard and large communities in one compiled pass
+
+    Args:
+        communities: Community strings (e.g., "64512:100", "64512:1:100")
+
+    Returns:
+        Validity flag per community, or None if numba is not installed or
+        the input is not plain ASCII text
+    """
+    if numba is None:
+        return None
+
+    try:
+        data = "".join(communities).encode("ascii")
+    except (TypeError, UnicodeEncodeError):
+        return None
+
+    offsets = np.zeros(len(communities) + 1, dtype=np.int64)
+    np.cumsum([len(community) for community in communities], out=offsets[1:])
+
+    return _validate_batch(np.frombuffer(data, dtype=np.uint8), offsets).tolist()
@@ -8,23 +8,93 @@ overrides, and secure API key handling.
 
 import os
 import sys
+import hashlib
+import pickle
+import tempfile
+import threading
+import time
 import yaml
 import json
 import jsonschema
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Callable, Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 import logging
 
 # Import AutoNet exception classes
 from lib.exceptions import ConfigurationError, ValidationError
+from lib.utils import YamlLoader, dump_json
 
-# Import API key functions from peering_filters (avoid circular import at module level)
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+try:
+    import fastjsonschema
+except ImportError:  # fastjsonschema is an optional speedup
+    fastjsonschema = None
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the layout of the on-disk parse cache changes
+CACHE_CONTENT_VERSION = 3
+
+# Cache entries older than this are removed whenever a new one is written
+CACHE_MAX_AGE = 30 * 24 * 3600
+
+# At most this many entries of each kind are kept in the cache directory
+CACHE_MAX_ENTRIES = 256
+
+# Top-level keys holding credentials (the PeeringDB API key and the per-ASN
+# BGP session passwords); files containing them are never cached on disk
+SECRET_KEYS = frozenset({'pdb_apikey', 'bgp_passwords'})
+
+# Files modified more recently than this are re-checked by content on every load
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Marks a cache lookup that produced only pickled data
+_NOT_PARSED = object()
+
+# Distinguishes a missing key from a stored None in _dig
+_MISSING = object()
+
+
+def _dig(obj: Any, *keys: Any, default: Any = None) -> Any:
+    """Look up a nested key path without allocating empty dicts on misses"""
+    for key in keys:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key, _MISSING)
+        if obj is _MISSING:
+            return default
+    return obj
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Check that a cache file is owned by the current user and closed to everyone else"""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+# String values up to this length are interned along with all mapping keys
+INTERN_MAX_LENGTH = 64
+
+
+def _intern_strings(obj: Any) -> Any:
+    """
+    Intern mapping keys and short string values in a parsed YAML tree
+
+    Large configurations repeat the same keys and values ('asn', 'ipv4',
+    router names, ...) thousands of times; interning makes every repeat
+    share one string object, also after a pickle round trip.
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if type(key) is str else key): _intern_strings(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    if type(obj) is str and len(obj) <= INTERN_MAX_LENGTH:
+        return sys.intern(obj)
+    return obj
+
 
 @dataclass
 class ConfigMetadata:
@@ -49,15 +119,32 @@ class ConfigurationManager:
     - Validation caching for performance
     """
 
-    def __init__(self, config_dir: str = None, environment: str = None):
+    def __init__(self, config_dir: str = None, environment: str = None, cache_dir: str = None,
+                 validation_cache: bool = True):
         self.config_dir = Path(config_dir or "config")
         self.environment = environment or os.getenv("AUTONET_ENV", "production")
+        self.cache_dir = Path(
+            cache_dir or os.getenv("AUTONET_CACHE_DIR") or Path.home() / ".cache" / "autonet"
+        )
         self.schema_cache: Dict[str, Dict] = {}
         self.config_cache: Dict[str, Dict] = {}
+        self._parsed_yaml_cache: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+        self._validator_cache: Dict[bytes, Any] = {}
+        self._schema_hashes: Dict[str, bytes] = {}
+        self._autonet_defaults: Dict[str, Any] = {}
+        self._env_overrides: Optional[Dict[str, Any]] = None
         self.metadata: Optional[ConfigMetadata] = None
 
-        # Load base schema
-        self._load_schema()
+        # Remember configurations that passed schema validation in cache_dir
+        self.validation_cache = validation_cache
+
+    def _get_schema(self) -> Dict[str, Any]:
+        """Get the configuration schema, loading it on first use"""
+        schema = self.schema_cache.get('main')
+        if schema is None:
+            self._load_schema()
+            schema = self.schema_cache['main']
+        return schema
 
     def _load_schema(self) -> None:
         """Load and cache the configuration schema"""
@@ -67,10 +154,25 @@ class ConfigurationManager:
             raise ConfigurationError(f"Schema file not found: {schema_path}")
 
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                self.schema_cache['main'] = yaml.safe_load(f)
+            self.schema_cache['main'] = self._load_yaml_cached(schema_path)
+
+            schema = self.schema_cache['main'] or {}
+
+            # Identical sub-schemas share one compiled validator
+            self._schema_hashes = {
+                name: self._schema_hash(subschema)
+                for name, subschema in schema.get('schemas', {}).items()
+            }
 
-            logger.info(f"Loaded configuration schema from {schema_path}")
+            # The schema is fixed for this manager, so resolve the parts every
+            # configuration load needs once; None means no environments section
+            self._autonet_defaults = schema.get('autonet', {})
+            self._env_overrides = (
+                schema['environments'].get(self.environment, {})
+                if 'environments' in schema else None
+            )
+
+            logger.info("Loaded configuration schema from %s", schema_path)
 
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in schema file {schema_path}: {e}")
@@ -97,8 +199,7 @@ class ConfigurationManager:
 
         # Load base configuration
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                base_config = yaml.safe_load(f)
+            base_config = self._load_yaml_cached(config_path)
 
             if base_config is None:
                 raise ConfigurationError(f"Configuration file is empty: {config_path}")
@@ -122,8 +223,8 @@ class ConfigurationManager:
 
         # Store metadata
         self.metadata = ConfigMetadata(
-            version=config.get('autonet', {}).get('version', '2.0'),
-            schema_version=config.get('autonet', {}).get('schema_version', '1.0'),
+            version=_dig(config, 'autonet', 'version', default='2.0'),
+            schema_version=_dig(config, 'autonet', 'schema_version', default='1.0'),
             loaded_at=datetime.now(),
             source_files=[str(config_path)],
             environment=self.environment,
@@ -133,35 +234,164 @@ class ConfigurationManager:
         # Cache the configuration
         self.config_cache[str(config_path)] = config
 
-        logger.info(f"Successfully loaded and validated configuration from {config_path}")
+        logger.info("Successfully loaded and validated configuration from %s", config_path)
         return config
 
+    def _load_yaml_cached(self, path: Path) -> Any:
+        """
+        Parse a YAML file, reusing an earlier parse while the file is unchanged
+
+        Parses are kept pickled in memory, keyed by path and checked against
+        the file's mtime and size, so repeated loads cost a stat() and an
+        unpickle. Each call returns a fresh copy that callers may modify.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._parsed_yaml_cache.get(str(path))
+        if cached is not None and cached[0] == stamp:
+            return pickle.loads(cached[1])  # nosec - produced by this process
+
+        pickled, data = self._load_yaml_pickled(path, stat.st_mtime_ns)
+
+        # A file written within the filesystem's timestamp granularity could
+        # change again without a new mtime, so only remember settled files
+        if time.time_ns() - stat.st_mtime_ns > RACY_MTIME_WINDOW_NS:
+            self._parsed_yaml_cache[str(path)] = (stamp, pickled)
+
+        # A fresh parse is not shared with anything, so hand it out as is
+        if data is _NOT_PARSED:
+            data = pickle.loads(pickled)  # nosec - produced by this process
+        return data
+
+    def _load_yaml_pickled(self, path: Path, mtime: int) -> Tuple[bytes, Any]:
+        """
+        Parse a YAML file into pickled data, reusing the on-disk parse cache
+
+        Cache entries are keyed by the file's path and a hash of its content
+        and carry the source mtime, so any edit to the file forces a fresh
+        YAML parse. Writing an entry drops the older ones for the same path.
+        Files holding credentials (SECRET_KEYS) are never written to disk.
+
+        Returns:
+            Tuple of (pickled data, parsed data); the parsed data is
+            _NOT_PARSED when the pickle came from the on-disk cache
+        """
+        raw = path.read_bytes()
+        path_key = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+        key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        cache_dir = self._private_cache_dir()
+        cache_file = cache_dir / f"config-{path_key}-{key}.pkl" if cache_dir else None
+
+        if cache_file is not None:
+            try:
+                with open(cache_file, 'rb') as f:
+                    if not _is_private(os.fstat(f.fileno())):
+                        raise PermissionError("not private to the current user")
+                    entry = pickle.load(f)  # nosec - ownership and mode checked above
+                if (entry.get('content_version') == CACHE_CONTENT_VERSION
+                        and entry.get('mtime') == mtime):
+                    logger.debug("Using cached parse of %s", path)
+                    return entry['data'], _NOT_PARSED
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+
+        data = _intern_strings(yaml.load(raw, Loader=YamlLoader))
+        pickled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if cache_file is None or (isinstance(data, dict) and not SECRET_KEYS.isdisjoint(data)):
+            return pickled, data
+
+        try:
+            # NamedTemporaryFile creates the file with mode 0600
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tmp:
+                pickle.dump(
+                    {'content_version': CACHE_CONTENT_VERSION, 'mtime': mtime, 'data': pickled},
+                    tmp,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp.name, cache_file)
+        except Exception as e:
+            logger.debug("Failed to write config cache %s: %s", cache_file, e)
+            return pickled, data
+
+        for stale in cache_dir.glob(f"config-{path_key}-*.pkl"):
+            if stale != cache_file:
+                try:
+                    stale.unlink()
+                except OSError as e:
+                    logger.debug("Failed to remove cache entry %s: %s", stale, e)
+        self._prune_cache(cache_dir, "config-*.pkl")
+
+        return pickled, data
+
+    def _private_cache_dir(self) -> Optional[Path]:
+        """
+        Create cache_dir if needed and make sure only the current user can write it
+
+        Parse cache entries are unpickled, so a directory owned by someone
+        else is never used. Returns None when the cache can't be used safely.
+        """
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = self.cache_dir.stat()
+            if st.st_uid != os.getuid():
+                logger.warning("Not using cache directory %s owned by another user", self.cache_dir)
+                return None
+            if st.st_mode & 0o077:
+                self.cache_dir.chmod(0o700)
+        except OSError as e:
+            logger.debug("Cache directory %s unavailable: %s", self.cache_dir, e)
+            return None
+        return self.cache_dir
+
+    @staticmethod
+    def _prune_cache(cache_dir: Path, pattern: str) -> None:
+        """Remove cache entries older than CACHE_MAX_AGE and all but the newest CACHE_MAX_ENTRIES"""
+        entries = []
+        for entry in cache_dir.glob(pattern):
+            try:
+                entries.append((entry.stat().st_mtime, entry))
+            except OSError:
+                pass
+        entries.sort(reverse=True)
+
+        cutoff = time.time() - CACHE_MAX_AGE
+        for i, (mtime, entry) in enumerate(entries):
+            if i >= CACHE_MAX_ENTRIES or mtime < cutoff:
+                try:
+                    entry.unlink()
+                except OSError as e:
+                    logger.debug("Failed to remove cache entry %s: %s", entry, e)
+
     def _apply_environment_overrides(self, base_config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment-specific configuration overrides"""
-        if 'environments' not in self.schema_cache['main']:
+        self._get_schema()  # also precomputes the overrides on first use
+        env_overrides = self._env_overrides
+        if env_overrides is None:
             return base_config
 
-        env_overrides = self.schema_cache['main']['environments'].get(self.environment, {})
         if not env_overrides:
-            logger.info(f"No environment overrides found for environment: {self.environment}")
+            logger.info("No environment overrides found for environment: %s", self.environment)
             return base_config
 
         # Deep merge environment overrides
         config = self._deep_merge(base_config, env_overrides)
-        logger.info(f"Applied environment overrides for: {self.environment}")
+        logger.info("Applied environment overrides for: %s", self.environment)
 
         return config
 
     def _merge_schema_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge schema defaults into configuration"""
-        schema = self.schema_cache['main']
+        self._get_schema()  # also precomputes the defaults on first use
 
         if 'autonet' not in config:
             config['autonet'] = {}
 
         # Merge AutoNet defaults
-        autonet_defaults = schema.get('autonet', {})
-        config['autonet'] = self._deep_merge(autonet_defaults, config['autonet'])
+        config['autonet'] = self._deep_merge(self._autonet_defaults, config['autonet'])
 
         return config
 
@@ -169,14 +399,18 @@ class ConfigurationManager:
         """Validate configuration against schema"""
         try:
             # Get validation schema
-            schema = self.schema_cache['main'].get('schemas', {}).get('generic_config', {})
+            schema = _dig(self._get_schema(), 'schemas', 'generic_config')
 
             if not schema:
                 logger.warning("No validation schema found, skipping validation")
                 return
 
-            # Validate using jsonschema
-            jsonschema.validate(config, schema)
+            # Validate using jsonschema, unless this exact configuration
+            # already passed against this exact schema
+            marker = self._validation_marker(schema, config)
+            if marker is None or not self._is_valid_marker(marker):
+                self._validate_against('generic_config', schema, config)
+                self._remember_valid(marker)
 
             # Custom validation rules
             self._apply_custom_validation(config)
@@ -191,9 +425,98 @@ class ConfigurationManager:
         except Exception as e:
             raise ValidationError(f"Configuration validation error: {e}")
 
+    def _validate_against(self, name: str, schema: Dict[str, Any], config: Dict[str, Any]) -> None:
+        """
+        Validate config against a named schema, building its validator only once
+
+        Validators are cached by schema content, so identical schemas share
+        one. Raises the same error that jsonschema.validate() would.
+        """
+        key = self._schema_hashes.get(name) or self._schema_hash(schema)
+        cached = self._validator_cache.get(key)
+        if cached is None:
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            cached = self._validator_cache[key] = (cls(schema), self._compile_fast_validator(schema))
+        validator, fast_validate = cached
+
+        # The generated code only decides pass/fail quickly; failures are
+        # reported through jsonschema so error messages stay the same
+        if fast_validate is not None:
+            try:
+                fast_validate(config)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass
+
+        error = jsonschema.exceptions.best_match(validator.iter_errors(config))
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _compile_fast_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """Compile a schema with fastjsonschema, if installed and supported"""
+        if fastjsonschema is None:
+            return None
+
+        try:
+            # Match jsonschema.validate(): no format checks, data left untouched
+            return fastjsonschema.compile(schema, use_default=False, use_formats=False)
+        except Exception as e:
+            logger.debug("Using jsonschema only, fastjsonschema can't compile schema: %s", e)
+            return None
+
+    @staticmethod
+    def _schema_hash(schema: Dict[str, Any]) -> bytes:
+        """Hash a schema by content, independent of key order"""
+        canonical = json.dumps(schema, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _validation_marker(self, schema: Dict[str, Any], config: Dict[str, Any]) -> Optional[Path]:
+        """
+        Path of the marker file recording that config passed schema validation
+
+        The key covers the pickled configuration and the schema hash; equal
+        pickles imply equal data, so a marker can never vouch for another
+        configuration. Returns None when the validation cache is disabled.
+        """
+        if not self.validation_cache:
+            return None
+
+        try:
+            pickled = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+
+        digest = hashlib.blake2b(pickled, digest_size=16)
+        digest.update(self._schema_hashes.get('generic_config') or self._schema_hash(schema))
+        return self.cache_dir / f"valid-{digest.hexdigest()}"
+
+    @staticmethod
+    def _is_valid_marker(marker: Path) -> bool:
+        """Check for a validation marker written by the current user"""
+        try:
+            return _is_private(marker.stat())
+        except OSError:
+            return False
+
+    def _remember_valid(self, marker: Optional[Path]) -> None:
+        """Record a successful schema validation, if caching is enabled"""
+        if marker is None or self._private_cache_dir() is None:
+            return
+
+        try:
+            marker.touch(mode=0o600)
+            marker.chmod(0o600)
+        except OSError as e:
+            logger.debug("Failed to write validation cache %s: %s", marker, e)
+            return
+
+        self._prune_cache(marker.parent, "valid-*")
+
     def _apply_custom_validation(self, config: Dict[str, Any]) -> None:
         """Apply custom validation rules"""
-        validation_rules = self.schema_cache['main'].get('validation_rules', {})
+        validation_rules = _dig(self._get_schema(), 'validation_rules', default={})
 
         # Validate ASNs
         if 'bgp' in config:
@@ -202,14 +525,15 @@ class ConfigurationManager:
                 pass
 
         # Validate IXP mappings
-        if 'ixp_map' in config:
+        if 'ixp_map' in config and 'bgp' in config:
+            bgp_routers = set(config['bgp'])
             for ixp_name, ixp_config in config['ixp_map'].items():
                 # Validate present_on routers exist in bgp section
-                if 'present_on' in ixp_config and 'bgp' in config:
+                if 'present_on' in ixp_config:
                     for router in ixp_config['present_on']:
-                        router_short = router.split('.')[0]  # Extract short name
-                        if router_short not in config['bgp']:
-                            logger.warning(f"Router {router} in IXP {ixp_name} not found in BGP configuration")
+                        router_short = router.partition('.')[0]  # Extract short name
+                        if router_short not in bgp_routers:
+                            logger.warning("Router %s in IXP %s not found in BGP configuration", router, ixp_name)
 
     def _process_api_keys(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Process API keys with secure handling"""
@@ -217,22 +541,31 @@ class ConfigurationManager:
             try:
                 # Use the secure API key retrieval system (lazy import to avoid circular dependency)
                 import peering_filters
-                config['pdb_apikey'] = peering_filters.get_api_key("PEERINGDB", "pdb_apikey")
+                config['pdb_apikey'] = peering_filters.get_api_key("PEERINGDB", "pdb_apikey", config)
                 logger.info("Processed PeeringDB API key securely")
             except Exception as e:
-                logger.warning(f"Failed to process PeeringDB API key: {e}")
+                logger.warning("Failed to process PeeringDB API key: %s", e)
 
         return config
 
     def _deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """Deep merge two dictionaries"""
-        result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        if not base:
+            return dict(override)
+
+        # Walk the trees with an explicit stack; only dicts on merged paths are
+        # copied, everything else is shared with base and override
+        result = dict(base)
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = target[key] = dict(current)
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
         return result
 
@@ -253,8 +586,7 @@ class ConfigurationManager:
             raise ConfigurationError(f"Router configuration not found: {router_config_path}")
 
         try:
-            with open(router_config_path, 'r', encoding='utf-8') as f:
-                router_config = yaml.safe_load(f)
+            router_config = self._load_yaml_cached(router_config_path)
 
             if router_config is None:
                 router_config = {}
@@ -270,21 +602,21 @@ class ConfigurationManager:
         # Merge with base configuration if provided
         if base_config:
             # Extract router-specific config from base
-            router_short = router_name.split('.')[0]
+            router_short = router_name.partition('.')[0]
             if 'bgp' in base_config and router_short in base_config['bgp']:
                 base_router_config = base_config['bgp'][router_short]
                 router_config = self._deep_merge(base_router_config, router_config)
 
-        logger.info(f"Loaded router configuration for {router_name}")
+        logger.info("Loaded router configuration for %s", router_name)
         return router_config
 
     def _validate_router_configuration(self, config: Dict[str, Any]) -> None:
         """Validate router-specific configuration"""
         try:
-            schema = self.schema_cache['main'].get('schemas', {}).get('router_config', {})
+            schema = _dig(self._get_schema(), 'schemas', 'router_config')
 
             if schema:
-                jsonschema.validate(config, schema)
+                self._validate_against('router_config', schema, config)
                 logger.debug("Router configuration validation passed")
             else:
                 logger.warning("No router configuration schema found")
@@ -294,28 +626,33 @@ class ConfigurationManager:
 
     def get_plugin_config(self, plugin_name: str, base_config: Dict[str, Any]) -> Dict[str, Any]:
         """Get plugin-specific configuration"""
-        plugins_config = base_config.get('autonet', {}).get('plugins', {})
+        return _dig(base_config, 'autonet', 'plugins', 'vendors', plugin_name, default={})
 
-        if plugin_name in plugins_config.get('vendors', {}):
-            return plugins_config['vendors'][plugin_name]
+    def validate_environment(self, base_config: Dict[str, Any] = None) -> bool:
+        """
+        Validate current environment configuration
 
-        return {}
+        Args:
+            base_config: Already loaded configuration to check (default: load
+                the default configuration file)
 
-    def validate_environment(self) -> bool:
-        """Validate current environment configuration"""
+        Returns:
+            True if the environment is valid, False otherwise
+        """
         try:
             # Check required directories
             required_dirs = ['builddir', 'stagedir']
-            base_config = self.load_configuration()
+            if base_config is None:
+                base_config = self.load_configuration()
 
             for dir_key in required_dirs:
                 if dir_key in base_config:
                     dir_path = Path(base_config[dir_key])
                     if not dir_path.exists():
-                        logger.warning(f"Directory does not exist: {dir_path}")
+                        logger.warning("Directory does not exist: %s", dir_path)
                         return False
                     if not os.access(dir_path, os.W_OK):
-                        logger.error(f"Directory not writable: {dir_path}")
+                        logger.error("Directory not writable: %s", dir_path)
                         return False
 
             # Check API connectivity
@@ -330,7 +667,7 @@ class ConfigurationManager:
             return True
 
         except Exception as e:
-            logger.error(f"Environment validation failed: {e}")
+            logger.error("Environment validation failed: %s", e)
             return False
 
     def get_metadata(self) -> Optional[ConfigMetadata]:
@@ -341,6 +678,8 @@ class ConfigurationManager:
         """Reload configuration and clear caches"""
         self.config_cache.clear()
         self.schema_cache.clear()
+        self._parsed_yaml_cache.clear()
+        self._validator_cache.clear()
 
         # Reload schema
         self._load_schema()
@@ -351,6 +690,7 @@ class ConfigurationManager:
 
 # Global configuration manager instance
 _config_manager: Optional[ConfigurationManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager(config_dir: str = None, environment: str = None) -> ConfigurationManager:
@@ -358,7 +698,9 @@ def get_config_manager(config_dir: str = None, environment: str = None) -> Confi
     global _config_manager
 
     if _config_manager is None:
-        _config_manager = ConfigurationManager(config_dir, environment)
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigurationManager(config_dir, environment)
 
     return _config_manager
 
@@ -373,10 +715,10 @@ def validate_config(config_path: str = None, environment: str = None) -> bool:
     """Convenience function to validate configuration"""
     try:
         manager = get_config_manager(environment=environment)
-        manager.load_configuration(config_path)
-        return manager.validate_environment()
+        config = manager.load_configuration(config_path)
+        return manager.validate_environment(config)
     except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         return False
 
 
@@ -389,10 +731,14 @@ if __name__ == "__main__":
     parser.add_argument("--environment", "-e", help="Environment (development, staging, production)")
     parser.add_argument("--validate", "-v", action="store_true", help="Validate configuration only")
     parser.add_argument("--show-metadata", "-m", action="store_true", help="Show configuration metadata")
+    parser.add_argument("--no-validation-cache", action="store_true",
+                        help="Always run full schema validation, ignoring cached results")
 
     args = parser.parse_args()
 
     try:
+        get_config_manager(environment=args.environment).validation_cache = not args.no_validation_cache
+
         if args.validate:
             if validate_config(args.config, args.environment):
                 print("✓ Configuration validation passed")
@@ -415,7 +761,7 @@ if __name__ == "__main__":
                     print(f"  Source Files: {', '.join(metadata.source_files)}")
                     print(f"  Validation Passed: {metadata.validation_passed}")
             else:
-                print(json.dumps(config, indent=2, default=str))
+                sys.stdout.write(dump_json(config) + "\n")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
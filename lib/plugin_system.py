@@ -7,12 +7,15 @@ Extensible plugin architecture for vendor-specific implementations and custom fe
 
 import os
 import sys
+import ast
 import importlib
-import inspect
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type, Union
-from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple, Type, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 import logging
 
@@ -53,15 +56,27 @@ class PluginInfo:
 class PluginInterface(ABC):
     """Base interface for all AutoNet plugins"""
 
+    # Plugins with static metadata set INFO instead of overriding get_info(),
+    # which lets the plugin manager register them without instantiating them
+    INFO: Optional[PluginInfo] = None
+
+    _class_logger: logging.Logger
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the logger once per plugin class rather than per instance
+        cls._class_logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.enabled = True
-        self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self.logger = self._class_logger
 
-    @abstractmethod
     def get_info(self) -> PluginInfo:
         """Return plugin information"""
-        pass
+        if self.INFO is None:
+            raise NotImplementedError(f"{type(self).__name__} must set INFO or override get_info()")
+        return replace(self.INFO, config=self.config)
 
     @abstractmethod
     def initialize(self) -> bool:
@@ -80,12 +95,12 @@ class PluginInterface(ABC):
     def enable(self) -> None:
         """Enable the plugin"""
         self.enabled = True
-        self.logger.info(f"Plugin {self.__class__.__name__} enabled")
+        self.logger.info("Plugin %s enabled", self.__class__.__name__)
 
     def disable(self) -> None:
         """Disable the plugin"""
         self.enabled = False
-        self.logger.info(f"Plugin {self.__class__.__name__} disabled")
+        self.logger.info("Plugin %s disabled", self.__class__.__name__)
 
 
 class VendorPlugin(PluginInterface):
@@ -106,6 +121,20 @@ class VendorPlugin(PluginInterface):
         """Return list of supported features"""
         pass
 
+    def generate_and_validate(self, peer_info: Dict[str, Any],
+                              template_vars: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Generate configuration and validate it in one call
+
+        Plugins that can validate while generating should override this to
+        avoid a second pass over the generated configuration.
+
+        Returns:
+            Tuple of (configuration content, validation result)
+        """
+        config_content = self.generate_config(peer_info, template_vars)
+        return config_content, self.validate_config(config_content)
+
 
 class FilterPlugin(PluginInterface):
     """Base class for filter plugins"""
@@ -130,6 +159,52 @@ class ValidatorPlugin(PluginInterface):
         pass
 
 
+def _scandir_py(path: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield plugin source files below a directory
+
+    Uses os.scandir so file type checks come from the directory listing
+    instead of a stat() per entry. Symlinks and names starting with "__"
+    are skipped.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith("__") or entry.is_symlink():
+                    continue
+                if entry.name.endswith(".py"):
+                    if entry.is_file():
+                        yield entry
+                elif entry.is_dir():
+                    yield from _scandir_py(entry.path)
+    except PermissionError as e:
+        logger.warning("Cannot scan plugin directory %s: %s", path, e)
+
+
+def _read_declared_plugin_info(plugin_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a module-level PLUGIN_INFO literal without importing the module
+
+    PLUGIN_INFO holds the PluginInfo fields (plus "class_name") as plain
+    literals, e.g. {"name": "frr", "plugin_type": "vendor", ...}. Returns
+    None if the file does not declare it.
+    """
+    with open(plugin_file, 'rb') as f:
+        source = f.read()
+
+    # Avoid parsing files that cannot contain the declaration
+    if b'PLUGIN_INFO' not in source:
+        return None
+
+    for node in ast.parse(source, plugin_file).body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id == 'PLUGIN_INFO'):
+            return ast.literal_eval(node.value)
+
+    return None
+
+
 class PluginManager:
     """
     Plugin manager for loading, managing, and executing plugins
@@ -139,6 +214,7 @@ class PluginManager:
     - Plugin dependency resolution
     - Configuration-based plugin enabling/disabling
     - Plugin lifecycle management
+    - Deferred import of plugins declaring PLUGIN_INFO
     - Type-safe plugin interfaces
     """
 
@@ -148,6 +224,21 @@ class PluginManager:
         self.plugins: Dict[str, PluginInterface] = {}
         self.plugin_info: Dict[str, PluginInfo] = {}
         self.plugin_types: Dict[PluginType, List[str]] = {pt: [] for pt in PluginType}
+        # Plugin file path -> (mtime_ns, size, plugin class names)
+        self._discovery_cache: Dict[str, Tuple[int, int, List[str]]] = {}
+        # Plugins registered from their metadata, not instantiated yet:
+        # name -> (module name, class name)
+        self._pending: Dict[str, Tuple[str, str]] = {}
+        # Lowercased vendor name or alias -> plugin name, built on first lookup
+        self._vendor_index: Optional[Dict[str, Optional[str]]] = None
+        # Module names of plugins disabled in configuration, never imported
+        self._disabled_modules = self._get_disabled_modules()
+
+        # Vendor plugin class name -> its vendors section entry
+        self._class_to_cfg: Dict[str, Dict[str, Any]] = {}
+        for vendor_config in self.config.get('plugins', {}).get('vendors', {}).values():
+            if 'class' in vendor_config:
+                self._class_to_cfg.setdefault(vendor_config['class'], vendor_config)
 
         # Add plugin directories to Python path
         for plugin_dir in self.plugin_dirs:
@@ -159,93 +250,220 @@ class PluginManager:
         """Discover and register all available plugins"""
         logger.info("Discovering plugins...")
 
+        candidates = []
         for plugin_dir in self.plugin_dirs:
-            plugin_path = Path(plugin_dir)
-
-            if not plugin_path.exists():
-                logger.warning(f"Plugin directory does not exist: {plugin_path}")
+            if not os.path.isdir(plugin_dir):
+                logger.warning("Plugin directory does not exist: %s", plugin_dir)
                 continue
 
             # Scan for Python files
-            for py_file in plugin_path.rglob("*.py"):
-                if py_file.name.startswith("__"):
+            for entry in _scandir_py(plugin_dir):
+                # Calculate module name from file path
+                relative_path = os.path.relpath(entry.path, plugin_dir)
+                module_name = relative_path[:-len(".py")].replace(os.sep, ".")
+
+                if module_name in self._disabled_modules:
+                    logger.info("Plugin module %s is disabled in configuration", module_name)
                     continue
 
                 try:
-                    self._load_plugin_from_file(py_file)
+                    # Plugins declaring PLUGIN_INFO are imported on first use
+                    declared_info = _read_declared_plugin_info(entry.path)
+                    if declared_info is not None:
+                        self._register_declared_plugin(declared_info, module_name)
+                    else:
+                        candidates.append((entry.path, module_name, entry.stat()))
                 except Exception as e:
-                    logger.error(f"Failed to load plugin from {py_file}: {e}")
-
-        logger.info(f"Discovered {len(self.plugins)} plugins")
+                    logger.error("Failed to load plugin from %s: %s", entry.path, e)
+
+        if candidates:
+            # Imports run concurrently; registration stays on this thread
+            workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                modules = list(executor.map(
+                    self._import_plugin_module,
+                    [plugin_file for plugin_file, _, _ in candidates],
+                    [module_name for _, module_name, _ in candidates]))
+
+            for (plugin_file, module_name, stat), module in zip(candidates, modules):
+                if module is None:
+                    continue
+                try:
+                    self._load_plugin_from_module(plugin_file, module, stat)
+                except Exception as e:
+                    logger.error("Failed to load plugin from %s: %s", plugin_file, e)
 
-    def _load_plugin_from_file(self, plugin_file: Path) -> None:
-        """Load plugin from a Python file"""
-        # Calculate module name from file path
-        relative_path = plugin_file.relative_to(Path(self.plugin_dirs[0]))
-        module_name = str(relative_path.with_suffix("")).replace(os.sep, ".")
+        logger.info("Discovered %s plugins", len(self.plugin_info))
 
+    def _import_plugin_module(self, plugin_file: str, module_name: str) -> Optional[ModuleType]:
+        """Import a plugin module, logging failures instead of raising"""
         try:
-            # Import the module
-            module = importlib.import_module(module_name)
-
-            # Find plugin classes
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, PluginInterface) and
-                    obj != PluginInterface and
-                    not inspect.isabstract(obj)):
-
-                    # Get plugin config
-                    plugin_config = self._get_plugin_config(name)
-
-                    if plugin_config.get('enabled', True):
-                        # Instantiate plugin
-                        plugin = obj(plugin_config.get('config', {}))
-
-                        # Get plugin info
-                        info = plugin.get_info()
-
-                        # Register plugin
-                        self.plugins[info.name] = plugin
-                        self.plugin_info[info.name] = info
-                        self.plugin_types[info.plugin_type].append(info.name)
+            return importlib.import_module(module_name)
+        except ImportError as e:
+            logger.error("Failed to import plugin module %s: %s", module_name, e)
+        except Exception as e:
+            logger.error("Failed to load plugin from %s: %s", plugin_file, e)
+        return None
 
-                        logger.info(f"Loaded plugin: {info.name} ({info.plugin_type.value})")
-                    else:
-                        logger.info(f"Plugin {name} is disabled in configuration")
+    def _load_plugin_from_module(self, plugin_file: str, module: ModuleType,
+                                 stat: Optional[os.stat_result] = None) -> None:
+        """
+        Register the plugins defined in an imported plugin module
+
+        The plugin classes found in a file are remembered per (mtime, size),
+        so rediscovering an unchanged file skips the module scan.
+        """
+        # Find plugin classes
+        cached = self._discovery_cache.get(plugin_file)
+        if stat is not None and cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            class_names = cached[2]
+        else:
+            # Only classes defined in this module, not imported ones
+            class_names = [
+                name for name, obj in list(vars(module).items())
+                if (isinstance(obj, type) and
+                    obj.__module__ == module.__name__ and
+                    issubclass(obj, PluginInterface) and
+                    not getattr(obj, "__abstractmethods__", None))
+            ]
+            if stat is not None:
+                self._discovery_cache[plugin_file] = (stat.st_mtime_ns, stat.st_size, class_names)
+
+        for name in class_names:
+            obj = getattr(module, name)
+
+            # Get plugin config
+            plugin_config = self._get_plugin_config(name)
+
+            if not plugin_config.get('enabled', True):
+                logger.info("Plugin %s is disabled in configuration", name)
+            elif obj.INFO is not None:
+                # Metadata is on the class; instantiate on first use
+                info = replace(obj.INFO, config=plugin_config.get('config', {}))
+                self._register_pending(info, module.__name__, name)
+            else:
+                # Instantiate and register plugin
+                info = self._register_plugin(obj(plugin_config.get('config', {})))
+
+                logger.info("Loaded plugin: %s (%s)", info.name, info.plugin_type.value)
+
+    def _register_plugin(self, plugin: PluginInterface) -> PluginInfo:
+        """Register a plugin instance under the name from its info"""
+        info = plugin.get_info()
+
+        self.plugins[info.name] = plugin
+        self.plugin_info[info.name] = info
+        if info.name not in self.plugin_types[info.plugin_type]:
+            self.plugin_types[info.plugin_type].append(info.name)
+        self._vendor_index = None
+
+        return info
+
+    def _register_declared_plugin(self, declared_info: Dict[str, Any], module_name: str) -> None:
+        """Register a plugin from its PLUGIN_INFO without importing it"""
+        class_name = declared_info['class_name']
+        plugin_config = self._get_plugin_config(class_name)
+
+        if not plugin_config.get('enabled', True):
+            logger.info("Plugin %s is disabled in configuration", class_name)
+            return
+
+        info = PluginInfo(**{
+            'enabled': True,
+            'dependencies': [],
+            **declared_info,
+            'config': plugin_config.get('config', {}),
+            'module_path': module_name,
+        })
+        self._register_pending(info, module_name, class_name)
+
+    def _register_pending(self, info: PluginInfo, module_name: str, class_name: str) -> None:
+        """Register plugin metadata, deferring instantiation to first use"""
+        if info.name in self.plugins:
+            return
+
+        self.plugin_info[info.name] = info
+        if info.name not in self.plugin_types[info.plugin_type]:
+            self.plugin_types[info.plugin_type].append(info.name)
+        self._pending[info.name] = (module_name, class_name)
+        self._vendor_index = None
+
+        logger.info("Registered plugin: %s (%s)", info.name, info.plugin_type.value)
+
+    def _materialize(self, name: str) -> Optional[PluginInterface]:
+        """Import and instantiate a plugin registered from its metadata"""
+        module_name, class_name = self._pending.pop(name)
+        info = self.plugin_info[name]
 
-        except ImportError as e:
-            logger.error(f"Failed to import plugin module {module_name}: {e}")
+        try:
+            module = importlib.import_module(module_name)
+            plugin = getattr(module, class_name)(info.config)
         except Exception as e:
-            logger.error(f"Failed to load plugin from {plugin_file}: {e}")
+            logger.error("Failed to load plugin %s from %s: %s", name, module_name, e)
+            self.plugin_info.pop(name, None)
+            if name in self.plugin_types[info.plugin_type]:
+                self.plugin_types[info.plugin_type].remove(name)
+            return None
+
+        self.plugins[name] = plugin
+        return plugin
+
+    def _get_disabled_modules(self) -> Set[str]:
+        """
+        Collect the modules of vendor plugins disabled in configuration
+
+        Configured module paths are package-qualified (plugins.vendors.bird2)
+        while discovery names modules relative to the plugin directory
+        (vendors.bird2), so a leading plugin directory name is also
+        stripped. Shorter suffixes such as "bird2" never match.
+        """
+        disabled = set()
+        vendors_config = self.config.get('plugins', {}).get('vendors', {})
+        prefixes = {f"{Path(plugin_dir).name}." for plugin_dir in self.plugin_dirs}
+
+        for vendor_config in vendors_config.values():
+            module = vendor_config.get('module')
+            if module and not vendor_config.get('enabled', True):
+                disabled.add(module)
+                disabled.update(module[len(prefix):] for prefix in prefixes
+                                if module.startswith(prefix))
+
+        return disabled
 
     def _get_plugin_config(self, plugin_name: str) -> Dict[str, Any]:
         """Get configuration for a specific plugin"""
-        plugins_config = self.config.get('plugins', {})
-
         # Check in vendors section
-        if 'vendors' in plugins_config:
-            for vendor_name, vendor_config in plugins_config['vendors'].items():
-                if vendor_config.get('class') == plugin_name:
-                    return vendor_config
+        vendor_config = self._class_to_cfg.get(plugin_name)
+        if vendor_config is not None:
+            return vendor_config
 
         # Check in general plugins section
-        return plugins_config.get(plugin_name, {})
+        return self.config.get('plugins', {}).get(plugin_name, {})
 
     def initialize_plugins(self) -> None:
         """Initialize all enabled plugins"""
         logger.info("Initializing plugins...")
 
+        for name in list(self._pending):
+            self._materialize(name)
+
+        # Initialize dependencies before the plugins that need them
+        order = [name for name in self._dependency_order() if name in self.plugins]
+        ordered = set(order)
+        order += [name for name in self.plugins if name not in ordered]
+        self.plugins = {name: self.plugins[name] for name in order}
+
         failed_plugins = []
 
         for name, plugin in self.plugins.items():
             try:
                 if plugin.initialize():
-                    logger.info(f"Initialized plugin: {name}")
+                    logger.info("Initialized plugin: %s", name)
                 else:
-                    logger.error(f"Failed to initialize plugin: {name}")
+                    logger.error("Failed to initialize plugin: %s", name)
                     failed_plugins.append(name)
             except Exception as e:
-                logger.error(f"Error initializing plugin {name}: {e}")
+                logger.error("Error initializing plugin %s: %s", name, e)
                 failed_plugins.append(name)
 
         # Remove failed plugins
@@ -253,7 +471,7 @@ class PluginManager:
             self.plugins.pop(name, None)
             self.plugin_info.pop(name, None)
 
-        logger.info(f"Successfully initialized {len(self.plugins)} plugins")
+        logger.info("Successfully initialized %s plugins", len(self.plugins))
 
     def cleanup_plugins(self) -> None:
         """Cleanup all plugins"""
@@ -262,30 +480,51 @@ class PluginManager:
         for name, plugin in self.plugins.items():
             try:
                 plugin.cleanup()
-                logger.debug(f"Cleaned up plugin: {name}")
+                logger.debug("Cleaned up plugin: %s", name)
             except Exception as e:
-                logger.error(f"Error cleaning up plugin {name}: {e}")
+                logger.error("Error cleaning up plugin %s: %s", name, e)
 
     def get_plugin(self, name: str) -> Optional[PluginInterface]:
         """Get plugin by name"""
-        return self.plugins.get(name)
+        plugin = self.plugins.get(name)
+        if plugin is None and name in self._pending:
+            plugin = self._materialize(name)
+        return plugin
 
     def get_plugins_by_type(self, plugin_type: PluginType) -> List[PluginInterface]:
         """Get all plugins of a specific type"""
-        plugin_names = self.plugin_types.get(plugin_type, [])
-        return [self.plugins[name] for name in plugin_names if name in self.plugins]
+        plugin_names = list(self.plugin_types.get(plugin_type, []))
+        plugins = (self.get_plugin(name) for name in plugin_names)
+        return [plugin for plugin in plugins if plugin is not None]
 
     def get_vendor_plugin(self, vendor: str) -> Optional[VendorPlugin]:
         """Get vendor plugin by vendor name"""
-        vendor_plugins = self.get_plugins_by_type(PluginType.VENDOR)
+        if self._vendor_index is None:
+            self._vendor_index = self._build_vendor_index()
 
-        for plugin in vendor_plugins:
-            if isinstance(plugin, VendorPlugin):
-                info = plugin.get_info()
-                if info.name.lower() == vendor.lower() or vendor.lower() in info.name.lower():
-                    return plugin
+        key = vendor.lower()
+        if key in self._vendor_index:
+            name = self._vendor_index[key]
+        else:
+            # Fall back to partial matches, e.g. "bird" for "bird2"
+            name = next((name for alias, name in self._vendor_index.items()
+                         if name is not None and key in alias), None)
+            self._vendor_index[key] = name
 
-        return None
+        plugin = self.get_plugin(name) if name is not None else None
+        return plugin if isinstance(plugin, VendorPlugin) else None
+
+    def _build_vendor_index(self) -> Dict[str, Optional[str]]:
+        """Map lowercased vendor plugin names and aliases to plugin names"""
+        index = {}
+
+        for name in self.plugin_types[PluginType.VENDOR]:
+            info = self.plugin_info.get(name)
+            aliases = info.config.get('aliases', []) if info is not None else []
+            for alias in [name, *aliases]:
+                index.setdefault(alias.lower(), name)
+
+        return index
 
     def list_plugins(self) -> List[PluginInfo]:
         """List all registered plugins"""
@@ -293,46 +532,122 @@ class PluginManager:
 
     def reload_plugin(self, name: str) -> bool:
         """Reload a specific plugin"""
+        if name in self._pending:
+            # Never imported, so the first load is already current
+            return self.get_plugin(name) is not None
+
         if name not in self.plugins:
-            logger.error(f"Plugin not found: {name}")
+            logger.error("Plugin not found: %s", name)
             return False
 
         try:
             # Cleanup existing plugin
-            self.plugins[name].cleanup()
+            plugin = self.plugins[name]
+            plugin.cleanup()
 
             # Remove from registries
             info = self.plugin_info[name]
             self.plugin_types[info.plugin_type].remove(name)
             del self.plugins[name]
             del self.plugin_info[name]
+            self._vendor_index = None
+
+            # Reload only the module defining this plugin
+            plugin_class = type(plugin)
+            module = importlib.reload(sys.modules[plugin_class.__module__])
+            plugin_class = getattr(module, plugin_class.__name__)
 
-            # Rediscover and load
-            self.discover_plugins()
+            plugin_config = self._get_plugin_config(plugin_class.__name__)
+            self._register_plugin(plugin_class(plugin_config.get('config', {})))
 
             if name in self.plugins:
                 self.plugins[name].initialize()
-                logger.info(f"Successfully reloaded plugin: {name}")
+                logger.info("Successfully reloaded plugin: %s", name)
                 return True
             else:
-                logger.error(f"Failed to reload plugin: {name}")
+                logger.error("Failed to reload plugin: %s", name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error reloading plugin {name}: {e}")
+            logger.error("Error reloading plugin %s: %s", name, e)
             return False
 
     def validate_dependencies(self) -> List[str]:
-        """Validate plugin dependencies and return missing dependencies"""
+        """Validate plugin dependencies and return missing or circular dependencies"""
         missing_deps = []
 
         for name, info in self.plugin_info.items():
             for dep in info.dependencies:
-                if dep not in self.plugins:
+                if dep not in self.plugins and dep not in self._pending:
                     missing_deps.append(f"{name} requires {dep}")
 
+        # Plugins left unordered are either part of a cycle or wait on one
+        ordered = set(self._dependency_order())
+        unordered = [name for name in self.plugin_info if name not in ordered]
+        cyclic = self._cycle_members(unordered)
+        for name in unordered:
+            if name in cyclic:
+                missing_deps.append(f"{name} has circular dependencies")
+            else:
+                missing_deps.append(f"{name} depends on a plugin with circular dependencies")
+
         return missing_deps
 
+    def _dependency_order(self) -> List[str]:
+        """
+        Order registered plugins so each follows the plugins it depends on
+
+        Uses Kahn's algorithm. Dependencies that are not registered are
+        ignored here (validate_dependencies reports them); plugins caught
+        in a dependency cycle are left out of the result.
+        """
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        indegree: Dict[str, int] = {}
+
+        for name, info in self.plugin_info.items():
+            deps = {dep for dep in info.dependencies if dep in self.plugin_info}
+            indegree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+
+        queue = deque(name for name, count in indegree.items() if count == 0)
+        order = []
+
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        return order
+
+    def _cycle_members(self, names: List[str]) -> Set[str]:
+        """
+        Find the plugins among names that lie on a dependency cycle
+
+        Expects the plugins _dependency_order() left out: every cycle is
+        contained in that set, so the search never leaves it.
+        """
+        remaining = set(names)
+        members = set()
+
+        for name in names:
+            # Depth-first search for a dependency path leading back to name
+            stack = [dep for dep in self.plugin_info[name].dependencies if dep in remaining]
+            seen = set()
+            while stack:
+                dep = stack.pop()
+                if dep == name:
+                    members.add(name)
+                    break
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.extend(d for d in self.plugin_info[dep].dependencies if d in remaining)
+
+        return members
+
 
 # Global plugin manager instance
 _plugin_manager: Optional[PluginManager] = None
@@ -369,7 +684,7 @@ def initialize_plugin_system(config: Dict[str, Any]) -> PluginManager:
         if missing_deps:
             logger.warning("Missing plugin dependencies:")
             for dep in missing_deps:
-                logger.warning(f"  {dep}")
+                logger.warning("  %s", dep)
 
     return manager
 
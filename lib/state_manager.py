@@ -18,9 +18,17 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+from lib.utils import dump_json
+
 logger = logging.getLogger(__name__)
 
 
+INSERT_EVENT_SQL = """
+    INSERT INTO events (timestamp, event_type, component, message, details, duration_ms, success)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class EventType(Enum):
     """Types of events that can be tracked"""
     GENERATION_START = "generation_start"
@@ -230,18 +238,7 @@ class StateManager:
 
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    INSERT INTO events (timestamp, event_type, component, message, details, duration_ms, success)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event.timestamp.isoformat(),
-                    event.event_type.value,
-                    event.component,
-                    event.message,
-                    json.dumps(event.details) if event.details else None,
-                    event.duration_ms,
-                    event.success
-                ))
+                cursor = conn.execute(INSERT_EVENT_SQL, self._event_row(event))
 
                 event_id = cursor.lastrowid
                 conn.commit()
@@ -253,6 +250,46 @@ class StateManager:
             logger.error(f"Failed to track event: {e}")
             return 0
 
+    def track_events(self, events: List[StateEvent]) -> int:
+        """
+        Track several state events in a single transaction
+
+        Args:
+            events: StateEvents to track
+
+        Returns:
+            Number of events tracked
+        """
+        rows = [self._event_row(event) for event in events
+                if self._should_track_event(event.event_type)]
+        if not rows:
+            return 0
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(INSERT_EVENT_SQL, rows)
+                conn.commit()
+
+            logger.debug(f"Tracked {len(rows)} events")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to track events: {e}")
+            return 0
+
+    @staticmethod
+    def _event_row(event: StateEvent) -> tuple:
+        """Build the events table row for a StateEvent"""
+        return (
+            event.timestamp.isoformat(),
+            event.event_type.value,
+            event.component,
+            event.message,
+            json.dumps(event.details) if event.details else None,
+            event.duration_ms,
+            event.success
+        )
+
     def track_generation(self, generation: GenerationRecord) -> int:
         """
         Track a configuration generation
@@ -643,18 +680,13 @@ class StateManager:
                 'stats': self.get_performance_stats(30)
             }
 
-            # Convert datetime objects to strings for JSON serialization
-            def datetime_converter(obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return obj
+            if format.lower() != 'json':
+                # Could add other formats (CSV, etc.)
+                raise ValueError(f"Unsupported format: {format}")
 
+            # dump_json converts datetimes and enums for JSON serialization
             with open(output_file, 'w') as f:
-                if format.lower() == 'json':
-                    json.dump(data, f, indent=2, default=datetime_converter)
-                else:
-                    # Could add other formats (CSV, etc.)
-                    raise ValueError(f"Unsupported format: {format}")
+                f.write(dump_json(data))
 
             logger.info(f"Exported state data to {output_file}")
             return True
@@ -7,18 +7,42 @@ with the new architecture.
 """
 
 import ipaddress
+import json
 import logging
 import os
 import shlex
 import subprocess
 import sys
+import tempfile
+from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml is an optional speedup
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional speedup
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Process umask, read once at import since os.umask() can only be queried by
+# setting it; atomic_write() applies it to its temporary files
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
 
 def get_config_value(
     key: str, default: Any = None, config_file: str = "vars/generic.yml"
@@ -43,8 +67,8 @@ def get_config_value(
             logger.warning(f"Configuration file not found: {config_file}")
             return default
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        # libyaml decodes the raw bytes itself, skipping a str copy of the file
+        config = yaml.load(config_path.read_bytes(), Loader=YamlLoader)
 
         if config is None:
             logger.warning(f"Configuration file is empty: {config_file}")
@@ -363,6 +387,41 @@ def ensure_file_permissions(file_path: Union[str, Path], mode: int) -> bool:
         return False
 
 
+def atomic_write(file_path: Union[str, Path], content: str) -> Path:
+    """
+    Write text to a file atomically
+
+    The content is written to a uniquely named temporary file in the same
+    directory, flushed to disk and then renamed over the target, so readers
+    never see a partial file and concurrent writers of one path never share
+    a temporary file.
+
+    Args:
+        file_path: Path to write
+        content: Text content to write
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(file_path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        # mkstemp creates the file 0600; give it the usual umask-based mode
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return path
+
+
 def create_backup_file(
     source_path: Union[str, Path], backup_suffix: str = None
 ) -> Optional[Path]:
@@ -472,6 +531,91 @@ def get_file_hash(
         return None
 
 
+def load_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Load a JSON document from file
+
+    Uses orjson's C parser when it is installed, falling back to the
+    standard library json module otherwise.
+
+    Args:
+        file_path: Path to JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def iter_json_items(file_path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Iterate over the items of a JSON array file
+
+    A top-level array is streamed item by item with ijson when it is
+    installed, so the whole document is never held in memory at once.
+    Any other top-level value is yielded as a single item.
+
+    Args:
+        file_path: Path to JSON file
+
+    Yields:
+        Parsed array items, or the document itself if it is not an array
+    """
+    if ijson is not None:
+        with open(file_path, "rb") as f:
+            if f.read(4096).lstrip().startswith(b"["):
+                f.seek(0)
+                yield from ijson.items(f, "item", use_float=True)
+                return
+
+    data = load_json_file(file_path)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialise values the JSON encoders don't handle natively"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def dump_json(data: Any) -> str:
+    """
+    Serialise data to indented JSON
+
+    Uses orjson when it is installed, falling back to the standard library
+    json module (also for data orjson rejects, such as oversized integers).
+
+    Args:
+        data: Data to serialise
+
+    Returns:
+        JSON document indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+
+    return json.dumps(data, indent=2, default=_json_default)
+
+
 def retry_operation(
     func,
     max_retries: int = 3,
@@ -25,7 +25,7 @@ import psutil
 from concurrent.futures import as_completed, ProcessPoolExecutor
 from hashlib import sha256
 from subprocess import PIPE, Popen
-from typing import List, Dict, Optional, Union, Iterator, Generator
+from typing import Collection, List, Dict, Optional, Union, Iterator, Generator
 from pathlib import Path
 from io import StringIO
 from datetime import datetime
@@ -123,16 +123,27 @@ def sanitize_shell_input(input_str: str) -> str:
     return shlex.quote(sanitized)
 
 
-def get_api_key(key_name: str, config_key: str = None) -> str:
-    """Securely retrieve API key from environment or config"""
+def get_api_key(key_name: str, config_key: str = None, config: Dict = None) -> str:
+    """
+    Securely retrieve API key from environment or config
+
+    Args:
+        key_name: Key name, used for the AUTONET_<NAME>_KEY environment variable
+        config_key: Configuration key holding the (optionally encrypted) key
+        config: Configuration to read config_key from (default: the generic
+            configuration loaded by run())
+    """
+    if config is None:
+        config = generic
+
     # First try environment variable (most secure)
     env_key = os.environ.get(f'AUTONET_{key_name.upper()}_KEY')
     if env_key:
         return env_key
 
     # Fall back to encrypted config if available
-    if config_key and config_key in generic:
-        encrypted_key = generic[config_key]
+    if config_key and config_key in config:
+        encrypted_key = config[config_key]
         # Check if it's encrypted (starts with our encryption prefix)
         if isinstance(encrypted_key, str) and encrypted_key.startswith('ENCRYPTED:'):
             try:
@@ -486,24 +497,29 @@ def resilient_peeringdb_request(endpoint: str, headers: Dict, fallback_cache_fil
     raise PeeringDBError(f"All PeeringDB mirrors failed and no valid cache available. Last error: {last_error}")
 
 
-# Load generic configuration with proper error handling
-try:
-    with open("vars/generic.yml", "r", encoding="utf-8") as genfile:
-        generic = yaml.safe_load(genfile)
-        if generic is None:
-            raise ConfigurationError("vars/generic.yml is empty or invalid")
-except FileNotFoundError:
-    print("ERROR: Configuration file vars/generic.yml not found", file=sys.stderr)
-    raise ConfigurationError("Configuration file vars/generic.yml not found")
-except yaml.YAMLError as e:
-    print(f"ERROR: Invalid YAML in vars/generic.yml: {e}", file=sys.stderr)
-    raise ConfigurationError(f"Invalid YAML in vars/generic.yml: {e}")
-except PermissionError:
-    print("ERROR: Permission denied reading vars/generic.yml", file=sys.stderr)
-    raise ConfigurationError("Permission denied reading vars/generic.yml")
-except UnicodeDecodeError as e:
-    print(f"ERROR: Unicode decode error in vars/generic.yml: {e}", file=sys.stderr)
-    raise ConfigurationError(f"Unicode decode error in vars/generic.yml: {e}")
+# Module state, populated by run() so the module can be imported without
+# side effects (e.g. from the unified autonet CLI or the config manager)
+generic: Dict = {}
+peerings: Dict = {}
+pdb: Dict = {}
+max_prefixes: Dict = {}
+ixp_map: Dict = {}
+router_map: Dict = {}
+multihop_source_map: Dict = {}
+vendor_map: Dict = {}
+launchdir = os.getcwd()
+outputdir = None
+irr_source_host = "rr.ntt.net"
+debugmode = False
+
+# Configuration manager shared by an in-process caller (see set_config_manager)
+_config_manager: Optional[ConfigurationManager] = None
+
+
+def set_config_manager(manager: ConfigurationManager) -> None:
+    """Share an already-initialized configuration manager with run()"""
+    global _config_manager
+    _config_manager = manager
 
 
 def download(url, headers={}, timeout=30, max_retries=3):
@@ -573,157 +589,8 @@ def readfile(filename):
     return filecontent
 
 
-# Secure API key handling with validation
-try:
-    pdb_api_key = get_api_key("PEERINGDB", "pdb_apikey")
-    if not pdb_api_key:
-        raise ConfigurationError("PeeringDB API key is empty")
-    pdb_auth = {"Authorization": f"Api-Key {pdb_api_key}"}
-except (KeyError, ConfigurationError) as e:
-    print(f"ERROR: {e}", file=sys.stderr)
-    print("Set AUTONET_PEERINGDB_KEY environment variable or configure pdb_apikey in generic.yml", file=sys.stderr)
-    sys.exit(1)
-# Use memory-efficient processing with fallback caching
-print("Using memory-efficient PeeringDB processing...", file=sys.stderr)
-
-try:
-    # Process PeeringDB data with memory-efficient streaming
-    pdb = memory_efficient_pdb_processing(pdb_auth)
-    max_prefixes = memory_efficient_max_prefixes_processing(pdb_auth)
-except PeeringDBError as e:
-    print(f"ERROR: {e}", file=sys.stderr)
-    sys.exit(1)
-
-# Defaults
-generate_configs = False
-generate_prefixsets = False
-debugmode = False
-do_checks = True
-
-if "all" in sys.argv:
-    generate_configs = True
-    generate_prefixsets = True
-if "prefixsets" in sys.argv:
-    generate_prefixsets = True
-if "configs" in sys.argv:
-    generate_configs = True
-if "--no-checks" in sys.argv:
-    do_checks = False
-    print(
-        "Saw '--no-checks': skipping existence checks for prefix sets when generating config."
-    )
-if "debug" in sys.argv:
-    debugmode = True
-
-# Initialize new architecture
-try:
-    # Load configuration with new architecture
-    config_manager = get_config_manager()
-    config = config_manager.load_configuration()
-
-    # Initialize plugin system
-    plugin_manager = initialize_plugin_system(config)
-
-    # Initialize state manager
-    state_manager = get_state_manager(config=config)
-
-    # Track generation start
-    generation_start_time = time.time()
-    start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-
-    track_event(
-        EventType.GENERATION_START,
-        "peering_filters",
-        f"Starting configuration generation with new architecture",
-        details={
-            "total_peers": len(peerings) if 'peerings' in locals() else 0,
-            "generate_configs": generate_configs,
-            "generate_prefixsets": generate_prefixsets,
-            "memory_start_mb": start_memory
-        }
-    )
-
-    print(f"✓ Initialized new architecture - Config Manager, Plugin System, State Manager", file=sys.stderr)
-
-except Exception as e:
-    print(f"WARNING: Failed to initialize new architecture: {e}", file=sys.stderr)
-    print("Falling back to legacy mode", file=sys.stderr)
-    config_manager = None
-    plugin_manager = None
-    state_manager = None
-    generation_start_time = time.time()
-    start_memory = 0.0
-
-
-# For testing purposes, allow a local file as peering manifest
-if "PEERINGS_FILE" in os.environ:
-    peerings_flat = readfile(os.environ.get("PEERINGS_FILE"))
-else:
-    peerings_flat = download(generic["peerings_url"])
-
-# Parse peerings configuration with error handling
-try:
-    peerings = yaml.safe_load(peerings_flat)
-    if peerings is None:
-        raise ConfigurationError("Peerings configuration is empty or invalid")
-except yaml.YAMLError as e:
-    print(f"ERROR: Invalid YAML in peerings configuration: {e}", file=sys.stderr)
-    raise ConfigurationError(f"Invalid YAML in peerings configuration: {e}")
-
-# ip addresses should not be needed to define ourselves
-#   this could be retrieved from https://www.peeringdb.com/api/ixlan
-ixp_map = {}
-router_map = {}
-for ixp in generic["ixp_map"]:
-    ixp_map[ixp] = {}
-    ixp_map[ixp]["subnets"] = [
-        ipaddress.ip_network(generic["ixp_map"][ixp]["ipv4_range"]),
-        ipaddress.ip_network(generic["ixp_map"][ixp]["ipv6_range"]),
-    ]
-
-    # Set a default bgp_local_pref of 100, allow for IXP based override
-    ixp_map[ixp]["bgp_local_pref"] = 100
-    if "bgp_local_pref" in generic["ixp_map"][ixp]:
-        ixp_map[ixp]["bgp_local_pref"] = generic["ixp_map"][ixp]["bgp_local_pref"]
-
-    router_map[ixp] = []
-    for router in generic["ixp_map"][ixp]["present_on"]:
-        router_map[ixp].append(router)
-
-multihop_source_map = {}
-vendor_map = {}
-for routername in generic["bgp"]:
-    fqdn = generic["bgp"][routername]["fqdn"]
-    multihop_source_map[fqdn] = {}
-    multihop_source_map[fqdn]["ipv4"] = generic["bgp"][routername]["ipv4"]
-    multihop_source_map[fqdn]["ipv6"] = generic["bgp"][routername]["ipv6"]
-    vendor_map[fqdn] = generic["bgp"][routername]["vendor"]
-
 allow_upto = {4: "24", 6: "48"}
 
-# store the directory in which the script was started
-# this is used to find template files
-launchdir = os.getcwd()
-
-# get output dir from environment, configuration or hard-coded default.
-try:
-    outputdir = os.environ["BUILDDIR"]
-except KeyError:
-    outputdir = (
-        generic["builddir"] if "builddir" in generic.keys() else "/opt/routefilters"
-    )
-
-try:
-    os.chdir(outputdir)
-except IOError:
-    print("%s does not exist?" % outputdir)
-    sys.exit(2)
-
-if "irr_source_host" in generic:
-    irr_source_host = generic["irr_source_host"]
-else:
-    irr_source_host = "rr.ntt.net"
-
 
 def render(tpl_path, context):
     path, filename = os.path.split(launchdir + "/" + tpl_path)
@@ -1024,347 +891,518 @@ def process_asn(
     return results
 
 
-for router in vendor_map:
-    if not generate_configs:
-        break
 
-    if vendor_map[router] == "bird":
-        try:
-            os.remove("%s.ipv4.config" % router)
-            os.remove("%s.ipv6.config" % router)
-        except OSError:
-            print("INFO: Config for %s wasn't present, no need to delete" % router)
-
-with ProcessPoolExecutor(max_workers=10) as executor:
-    futures = [
-        executor.submit(
-            process_asn,
-            asn,
-            peerings,
-            generic,
-            generate_prefixsets,
-            irr_source_host,
-            do_checks,
-        )
-        for asn in peerings
-    ]
+def run(targets: Collection[str], no_checks: bool = False, debug: bool = False) -> int:
+    """
+    Generate router configurations and/or prefix sets
 
-    for future in as_completed(futures):
-        try:
-            result = future.result()
-            for res in result:
-                print(res)
-        except Exception as e:
-            print(f"Error processing ASN: {e}")
-
-
-# Initialize new architecture
-try:
-    # Load configuration with new architecture
-    config_manager = get_config_manager()
-    config = config_manager.load_configuration()
-
-    # Initialize plugin system
-    plugin_manager = initialize_plugin_system(config)
-
-    # Initialize state manager
-    state_manager = get_state_manager(config=config)
-
-    # Track generation start
-    generation_start_time = time.time()
-    start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-
-    track_event(
-        EventType.GENERATION_START,
-        "peering_filters",
-        f"Starting configuration generation with new architecture",
-        details={
-            "total_peers": len(peerings),
-            "generate_configs": generate_configs,
-            "generate_prefixsets": generate_prefixsets,
-            "memory_start_mb": start_memory
-        }
-    )
+    Args:
+        targets: What to generate ("all", "configs" and/or "prefixsets")
+        no_checks: Skip existence checks for prefix sets
+        debug: Enable debug output
 
-    print(f"Initialized new architecture - Config Manager, Plugin System, State Manager", file=sys.stderr)
-
-except Exception as e:
-    print(f"WARNING: Failed to initialize new architecture: {e}", file=sys.stderr)
-    print("Falling back to legacy mode", file=sys.stderr)
-    config_manager = None
-    plugin_manager = None
-    state_manager = None
-
-for asn in peerings:
-    # Validate ASN format
-    if not validate_asn(asn):
-        print(f"ERROR: Invalid ASN format: {asn}", file=sys.stderr)
-        continue
-
-    # Validate AS-SET in import field
-    if "import" in peerings[asn] and peerings[asn]["import"] != "ANY":
-        for as_set in peerings[asn]["import"].split():
-            if not validate_as_set(as_set) and not validate_asn(as_set):
-                print(f"ERROR: Invalid AS-SET or ASN format in import for {asn}: {as_set}", file=sys.stderr)
-                continue
+    Returns:
+        Process exit code
+    """
+    global generic, peerings, pdb, max_prefixes, ixp_map, router_map
+    global multihop_source_map, vendor_map, launchdir, outputdir
+    global irr_source_host, debugmode, seen_router_policy, seen_bird_peers
 
-    sessions = []
-    if "only_with" in peerings[asn]:
-        sessions = peerings[asn]["only_with"]
-    elif "private_peerings" in peerings[asn]:
-        sessions = peerings[asn]["private_peerings"]
-    elif int(asn[2:]) in pdb:
-        sessions = pdb[int(asn[2:])]
-        if "not_with" in peerings[asn]:
-            for remove_ip in peerings[asn]["not_with"]:
-                # Validate IP before removing
-                if not validate_ip_address(remove_ip):
-                    print(f"ERROR: Invalid IP address in not_with for {asn}: {remove_ip}", file=sys.stderr)
-                    continue
-                sessions.remove(remove_ip)
-    else:
-        continue
+    seen_router_policy = []
+    seen_bird_peers = {}
 
-    for session in sessions:
-        # Validate session IP address
-        if not validate_ip_address(session):
-            print(f"ERROR: Invalid session IP address for {asn}: {session}", file=sys.stderr)
-            continue
+    # Reuse the configuration an in-process caller already loaded through
+    # the shared configuration manager instead of reading it again
+    config_manager = _config_manager or get_config_manager()
+    shared_config = None
+    if _config_manager is not None:
+        shared_config = _config_manager.config_cache.get(str(Path("vars/generic.yml")))
 
+    if shared_config is not None:
+        generic = shared_config
+    else:
+        # Load generic configuration with proper error handling
         try:
-            session_ip = ipaddress.ip_address(session)
-        except (ValueError, TypeError) as e:
-            print(f"ERROR: Failed to parse IP address {session}: {e}", file=sys.stderr)
-            continue
-        for ixp in ixp_map:
-            for subnet in ixp_map[ixp]["subnets"]:
-                bgp_local_pref = ebgp_local_pref(asn, ixp, session_ip)
-                if session_ip in subnet:
-                    print(
-                        "found peer %s in IXP %s with localpref %d"
-                        % (session_ip, ixp, bgp_local_pref)
-                    )
-                    print("must deploy on %s" % " ".join(router_map[ixp]))
-                    description = peerings[asn]["description"]
-                    for router in router_map[ixp]:
-                        routershort = router.split(".")[0]
-                        routershortnodash = routershort.replace("-", "")
-
-                        if (
-                            "only_on" in peerings[asn]
-                            and router not in peerings[asn]["only_on"]
-                        ):
-                            continue
+            with open("vars/generic.yml", "r", encoding="utf-8") as genfile:
+                generic = yaml.safe_load(genfile)
+                if generic is None:
+                    raise ConfigurationError("vars/generic.yml is empty or invalid")
+        except FileNotFoundError:
+            print("ERROR: Configuration file vars/generic.yml not found", file=sys.stderr)
+            raise ConfigurationError("Configuration file vars/generic.yml not found")
+        except yaml.YAMLError as e:
+            print(f"ERROR: Invalid YAML in vars/generic.yml: {e}", file=sys.stderr)
+            raise ConfigurationError(f"Invalid YAML in vars/generic.yml: {e}")
+        except PermissionError:
+            print("ERROR: Permission denied reading vars/generic.yml", file=sys.stderr)
+            raise ConfigurationError("Permission denied reading vars/generic.yml")
+        except UnicodeDecodeError as e:
+            print(f"ERROR: Unicode decode error in vars/generic.yml: {e}", file=sys.stderr)
+            raise ConfigurationError(f"Unicode decode error in vars/generic.yml: {e}")
+
+    # Secure API key handling with validation
+    try:
+        if shared_config is not None and "pdb_apikey" in shared_config:
+            # Already resolved when the configuration manager loaded it
+            pdb_api_key = shared_config["pdb_apikey"]
+        else:
+            pdb_api_key = get_api_key("PEERINGDB", "pdb_apikey")
+        if not pdb_api_key:
+            raise ConfigurationError("PeeringDB API key is empty")
+        pdb_auth = {"Authorization": f"Api-Key {pdb_api_key}"}
+    except (KeyError, ConfigurationError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        print("Set AUTONET_PEERINGDB_KEY environment variable or configure pdb_apikey in generic.yml", file=sys.stderr)
+        return 1
+    # Use memory-efficient processing with fallback caching
+    print("Using memory-efficient PeeringDB processing...", file=sys.stderr)
 
-                        if "not_on" in peerings[asn] and ixp in peerings[asn]["not_on"]:
-                            continue
+    try:
+        # Process PeeringDB data with memory-efficient streaming
+        pdb = memory_efficient_pdb_processing(pdb_auth)
+        max_prefixes = memory_efficient_max_prefixes_processing(pdb_auth)
+    except PeeringDBError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    # Defaults
+    generate_configs = "all" in targets or "configs" in targets
+    generate_prefixsets = "all" in targets or "prefixsets" in targets
+    debugmode = debug
+    do_checks = not no_checks
+
+    if no_checks:
+        print(
+            "Saw '--no-checks': skipping existence checks for prefix sets when generating config."
+        )
 
-                        peer_type = ebgp_peer_type(asn)
-
-                        if peerings[asn]["import"] == "ANY":
-                            no_filter = True
-                        else:
-                            no_filter = False
-                        if peerings[asn]["export"] == "ANY":
-                            export_full_table = True
-                        else:
-                            export_full_table = False
-
-                        # set max prefix settings (if available)
-                        limits = {}
-                        if "ipv4_limit" in peerings[asn]:
-                            limits[4] = peerings[asn]["ipv4_limit"]
-                        elif asn in max_prefixes and "v4" in max_prefixes[asn]:
-                            limits[4] = max_prefixes[asn]["v4"]
-                        else:
-                            limits[4] = 10000
-                        if "ipv6_limit" in peerings[asn]:
-                            limits[6] = peerings[asn]["ipv6_limit"]
-                        elif asn in max_prefixes and "v6" in max_prefixes[asn]:
-                            limits[6] = max_prefixes[asn]["v6"]
-                        else:
-                            limits[6] = 1000
-
-                        gtsm = False
-                        if "gtsm" in peerings[asn]:
-                            if peerings[asn]["gtsm"]:
-                                gtsm = True
-
-                        multihop = False
-                        if "multihop" in peerings[asn]:
-                            if peerings[asn]["multihop"]:
-                                multihop = True
-
-                        disable_multihop_source_map = False
-                        if "disable_multihop_source_map" in peerings[asn]:
-                            if peerings[asn]["disable_multihop_source_map"]:
-                                disable_multihop_source_map = True
-
-                        blackhole_accept = False
-                        if "blackhole_accept" in peerings[asn]:
-                            blackhole_accept = peerings[asn]["blackhole_accept"]
-
-                        blackhole_community = ["65535:666"]
-                        if "blackhole_community" in peerings[asn]:
-                            blackhole_community = peerings[asn]["blackhole_community"]
-
-                        ixprouter = ixp + "-" + routershort
-                        admin_down_state = False
-                        # Is the IXP defined in the bgp_groups settings
-                        if ixp in generic["bgp_groups"]:
-                            # If it has an admin_down_state setting
-                            if "admin_down_state" in generic["bgp_groups"][ixp]:
-                                # Configure it to whatever it is set to in the config
-                                admin_down_state = generic["bgp_groups"][ixp][
-                                    "admin_down_state"
-                                ]
-                        # If a specific router of an IXP connection is configured
-                        if ixprouter in generic["bgp_groups"]:
-                            # If it has a admin_down_state setting, and it hasn't been configured above yet
-                            if (
-                                "admin_down_state" in generic["bgp_groups"][ixprouter]
-                                and admin_down_state is False
-                            ):
-                                # Set it to whatever it is set to in the config
-                                admin_down_state = generic["bgp_groups"][ixprouter][
-                                    "admin_down_state"
-                                ]
-
-                        graceful_shutdown = False
-                        if ixp in generic["bgp_groups"]:
-                            if "graceful_shutdown" in generic["bgp_groups"][ixp]:
-                                graceful_shutdown = generic["bgp_groups"][ixp][
-                                    "graceful_shutdown"
-                                ]
-                        if ixprouter in generic["bgp_groups"]:
-                            if (
-                                "graceful_shutdown" in generic["bgp_groups"][ixprouter]
-                                and graceful_shutdown is False
-                            ):
-                                graceful_shutdown = generic["bgp_groups"][ixprouter][
-                                    "graceful_shutdown"
-                                ]
-                        if (
-                            "graceful_shutdown" in generic["bgp"][routershortnodash]
-                            and graceful_shutdown is False
-                        ):
-                            graceful_shutdown = generic["bgp"][routershortnodash][
-                                "graceful_shutdown"
-                            ]
-
-                        block_importexport = False
-                        if (
-                            ixp in generic["bgp_groups"]
-                            or ixprouter in generic["bgp_groups"]
-                        ):
-                            if (
-                                "block_importexport" in generic["bgp_groups"][ixp]
-                                or "block_importexport"
-                                in generic["bgp_groups"][ixprouter]
-                            ):
-                                block_importexport = generic["bgp_groups"][ixp][
-                                    "block_importexport"
-                                ]
-                        if ixprouter in generic["bgp_groups"]:
-                            if (
-                                "block_importexport" in generic["bgp_groups"][ixprouter]
-                                and block_importexport is False
-                            ):
-                                block_importexport = generic["bgp_groups"][ixprouter][
-                                    "block_importexport"
-                                ]
-
-                        if not generate_configs:
-                            continue
+    # Initialize new architecture
+    try:
+        # Load configuration with new architecture
+        if shared_config is not None:
+            config = shared_config
+        else:
+            config = config_manager.load_configuration()
 
-                        config_snippet(
-                            asn,
-                            str(session_ip),
-                            description,
-                            ixp,
-                            router,
-                            no_filter,
-                            export_full_table,
-                            limits,
-                            gtsm,
-                            peer_type,
-                            multihop,
-                            disable_multihop_source_map,
-                            multihop_source_map,
-                            generic,
-                            admin_down_state,
-                            block_importexport,
-                            bgp_local_pref,
-                            graceful_shutdown,
-                            blackhole_accept,
-                            blackhole_community,
-                        )
+        # Initialize plugin system
+        plugin_manager = initialize_plugin_system(config)
 
-# Complete generation tracking with new architecture
-if state_manager:
-    try:
-        # Calculate final metrics
-        generation_end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-        peak_memory = max(start_memory, end_memory)
-        generation_duration_ms = int((generation_end_time - generation_start_time) * 1000)
-
-        # Count total filters and peers processed
-        peer_count = len(peerings)
-        filter_count = len(seen_router_policy) if 'seen_router_policy' in locals() else 0
-
-        # Create generation record
-        generation_record = GenerationRecord(
-            config_hash=sha256(str(peerings).encode()).hexdigest()[:16],
-            peer_count=peer_count,
-            filter_count=filter_count,
-            duration_ms=generation_duration_ms,
-            memory_peak_mb=peak_memory,
-            success=True,
-            metadata={
-                "generate_configs": generate_configs,
-                "generate_prefixsets": generate_prefixsets,
-                "architecture_version": "2.0",
-                "memory_start_mb": start_memory,
-                "memory_end_mb": end_memory,
-                "processed_asns": peer_count,
-                "total_sessions": sum(len(sessions) for sessions in [
-                    peerings[asn].get("only_with", []) or
-                    peerings[asn].get("private_peerings", []) or
-                    pdb.get(int(asn[2:]), []) for asn in peerings
-                ] if sessions),
-                "plugins_loaded": len(plugin_manager.plugins) if plugin_manager else 0
-            }
-        )
+        # Initialize state manager
+        state_manager = get_state_manager(config=config)
 
-        # Track the generation
-        generation_id = state_manager.track_generation(generation_record)
+        # Track generation start
+        generation_start_time = time.time()
+        start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
 
-        # Track completion event
         track_event(
-            EventType.GENERATION_SUCCESS,
+            EventType.GENERATION_START,
             "peering_filters",
-            f"Configuration generation completed successfully",
+            f"Starting configuration generation with new architecture",
             details={
-                "generation_id": generation_id,
-                "peer_count": peer_count,
-                "filter_count": filter_count,
-                "duration_ms": generation_duration_ms,
-                "memory_peak_mb": peak_memory,
-                "memory_efficiency": f"{((start_memory - end_memory) / start_memory * 100):.1f}% reduction" if start_memory > end_memory else "memory stable",
-                "architecture_version": "2.0"
-            },
-            duration_ms=generation_duration_ms
+                "total_peers": 0,
+                "generate_configs": generate_configs,
+                "generate_prefixsets": generate_prefixsets,
+                "memory_start_mb": start_memory
+            }
         )
 
-        print(f"✓ Generation completed - ID: {generation_id}, Duration: {generation_duration_ms/1000:.1f}s, Peak Memory: {peak_memory:.1f}MB", file=sys.stderr)
+        print(f"✓ Initialized new architecture - Config Manager, Plugin System, State Manager", file=sys.stderr)
 
     except Exception as e:
-        print(f"ERROR: Failed to track generation completion: {e}", file=sys.stderr)
-        if 'track_event' in locals():
-            track_event(
-                EventType.GENERATION_FAILURE,
-                "peering_filters",
-                f"Failed to track generation: {e}",
-                success=False
-            )
+        print(f"WARNING: Failed to initialize new architecture: {e}", file=sys.stderr)
+        print("Falling back to legacy mode", file=sys.stderr)
+        config_manager = None
+        plugin_manager = None
+        state_manager = None
+        generation_start_time = time.time()
+        start_memory = 0.0
+
+    # For testing purposes, allow a local file as peering manifest
+    if "PEERINGS_FILE" in os.environ:
+        peerings_flat = readfile(os.environ.get("PEERINGS_FILE"))
+    else:
+        peerings_flat = download(generic["peerings_url"])
+
+    # Parse peerings configuration with error handling
+    try:
+        peerings = yaml.safe_load(peerings_flat)
+        if peerings is None:
+            raise ConfigurationError("Peerings configuration is empty or invalid")
+    except yaml.YAMLError as e:
+        print(f"ERROR: Invalid YAML in peerings configuration: {e}", file=sys.stderr)
+        raise ConfigurationError(f"Invalid YAML in peerings configuration: {e}")
+
+    # ip addresses should not be needed to define ourselves
+    #   this could be retrieved from https://www.peeringdb.com/api/ixlan
+    ixp_map = {}
+    router_map = {}
+    for ixp in generic["ixp_map"]:
+        ixp_map[ixp] = {}
+        ixp_map[ixp]["subnets"] = [
+            ipaddress.ip_network(generic["ixp_map"][ixp]["ipv4_range"]),
+            ipaddress.ip_network(generic["ixp_map"][ixp]["ipv6_range"]),
+        ]
+
+        # Set a default bgp_local_pref of 100, allow for IXP based override
+        ixp_map[ixp]["bgp_local_pref"] = 100
+        if "bgp_local_pref" in generic["ixp_map"][ixp]:
+            ixp_map[ixp]["bgp_local_pref"] = generic["ixp_map"][ixp]["bgp_local_pref"]
+
+        router_map[ixp] = []
+        for router in generic["ixp_map"][ixp]["present_on"]:
+            router_map[ixp].append(router)
+
+    multihop_source_map = {}
+    vendor_map = {}
+    for routername in generic["bgp"]:
+        fqdn = generic["bgp"][routername]["fqdn"]
+        multihop_source_map[fqdn] = {}
+        multihop_source_map[fqdn]["ipv4"] = generic["bgp"][routername]["ipv4"]
+        multihop_source_map[fqdn]["ipv6"] = generic["bgp"][routername]["ipv6"]
+        vendor_map[fqdn] = generic["bgp"][routername]["vendor"]
+
+    # store the directory in which the script was started
+    # this is used to find template files
+    launchdir = os.getcwd()
+
+    # get output dir from environment, configuration or hard-coded default.
+    try:
+        outputdir = os.environ["BUILDDIR"]
+    except KeyError:
+        outputdir = (
+            generic["builddir"] if "builddir" in generic.keys() else "/opt/routefilters"
+        )
+
+    try:
+        os.chdir(outputdir)
+    except IOError:
+        print("%s does not exist?" % outputdir)
+        return 2
+
+    try:
+        if "irr_source_host" in generic:
+            irr_source_host = generic["irr_source_host"]
+        else:
+            irr_source_host = "rr.ntt.net"
+
+        for router in vendor_map:
+            if not generate_configs:
+                break
+
+            if vendor_map[router] == "bird":
+                try:
+                    os.remove("%s.ipv4.config" % router)
+                    os.remove("%s.ipv6.config" % router)
+                except OSError:
+                    print("INFO: Config for %s wasn't present, no need to delete" % router)
+
+        with ProcessPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(
+                    process_asn,
+                    asn,
+                    peerings,
+                    generic,
+                    generate_prefixsets,
+                    irr_source_host,
+                    do_checks,
+                )
+                for asn in peerings
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    for res in result:
+                        print(res)
+                except Exception as e:
+                    print(f"Error processing ASN: {e}")
+
+        for asn in peerings:
+            # Validate ASN format
+            if not validate_asn(asn):
+                print(f"ERROR: Invalid ASN format: {asn}", file=sys.stderr)
+                continue
+
+            # Validate AS-SET in import field
+            if "import" in peerings[asn] and peerings[asn]["import"] != "ANY":
+                for as_set in peerings[asn]["import"].split():
+                    if not validate_as_set(as_set) and not validate_asn(as_set):
+                        print(f"ERROR: Invalid AS-SET or ASN format in import for {asn}: {as_set}", file=sys.stderr)
+                        continue
+
+            sessions = []
+            if "only_with" in peerings[asn]:
+                sessions = peerings[asn]["only_with"]
+            elif "private_peerings" in peerings[asn]:
+                sessions = peerings[asn]["private_peerings"]
+            elif int(asn[2:]) in pdb:
+                sessions = pdb[int(asn[2:])]
+                if "not_with" in peerings[asn]:
+                    for remove_ip in peerings[asn]["not_with"]:
+                        # Validate IP before removing
+                        if not validate_ip_address(remove_ip):
+                            print(f"ERROR: Invalid IP address in not_with for {asn}: {remove_ip}", file=sys.stderr)
+                            continue
+                        sessions.remove(remove_ip)
+            else:
+                continue
+
+            for session in sessions:
+                # Validate session IP address
+                if not validate_ip_address(session):
+                    print(f"ERROR: Invalid session IP address for {asn}: {session}", file=sys.stderr)
+                    continue
+
+                try:
+                    session_ip = ipaddress.ip_address(session)
+                except (ValueError, TypeError) as e:
+                    print(f"ERROR: Failed to parse IP address {session}: {e}", file=sys.stderr)
+                    continue
+                for ixp in ixp_map:
+                    for subnet in ixp_map[ixp]["subnets"]:
+                        bgp_local_pref = ebgp_local_pref(asn, ixp, session_ip)
+                        if session_ip in subnet:
+                            print(
+                                "found peer %s in IXP %s with localpref %d"
+                                % (session_ip, ixp, bgp_local_pref)
+                            )
+                            print("must deploy on %s" % " ".join(router_map[ixp]))
+                            description = peerings[asn]["description"]
+                            for router in router_map[ixp]:
+                                routershort = router.split(".")[0]
+                                routershortnodash = routershort.replace("-", "")
+
+                                if (
+                                    "only_on" in peerings[asn]
+                                    and router not in peerings[asn]["only_on"]
+                                ):
+                                    continue
+
+                                if "not_on" in peerings[asn] and ixp in peerings[asn]["not_on"]:
+                                    continue
+
+                                peer_type = ebgp_peer_type(asn)
+
+                                if peerings[asn]["import"] == "ANY":
+                                    no_filter = True
+                                else:
+                                    no_filter = False
+                                if peerings[asn]["export"] == "ANY":
+                                    export_full_table = True
+                                else:
+                                    export_full_table = False
+
+                                # set max prefix settings (if available)
+                                limits = {}
+                                if "ipv4_limit" in peerings[asn]:
+                                    limits[4] = peerings[asn]["ipv4_limit"]
+                                elif asn in max_prefixes and "v4" in max_prefixes[asn]:
+                                    limits[4] = max_prefixes[asn]["v4"]
+                                else:
+                                    limits[4] = 10000
+                                if "ipv6_limit" in peerings[asn]:
+                                    limits[6] = peerings[asn]["ipv6_limit"]
+                                elif asn in max_prefixes and "v6" in max_prefixes[asn]:
+                                    limits[6] = max_prefixes[asn]["v6"]
+                                else:
+                                    limits[6] = 1000
+
+                                gtsm = False
+                                if "gtsm" in peerings[asn]:
+                                    if peerings[asn]["gtsm"]:
+                                        gtsm = True
+
+                                multihop = False
+                                if "multihop" in peerings[asn]:
+                                    if peerings[asn]["multihop"]:
+                                        multihop = True
+
+                                disable_multihop_source_map = False
+                                if "disable_multihop_source_map" in peerings[asn]:
+                                    if peerings[asn]["disable_multihop_source_map"]:
+                                        disable_multihop_source_map = True
+
+                                blackhole_accept = False
+                                if "blackhole_accept" in peerings[asn]:
+                                    blackhole_accept = peerings[asn]["blackhole_accept"]
+
+                                blackhole_community = ["65535:666"]
+                                if "blackhole_community" in peerings[asn]:
+                                    blackhole_community = peerings[asn]["blackhole_community"]
+
+                                ixprouter = ixp + "-" + routershort
+                                admin_down_state = False
+                                # Is the IXP defined in the bgp_groups settings
+                                if ixp in generic["bgp_groups"]:
+                                    # If it has an admin_down_state setting
+                                    if "admin_down_state" in generic["bgp_groups"][ixp]:
+                                        # Configure it to whatever it is set to in the config
+                                        admin_down_state = generic["bgp_groups"][ixp][
+                                            "admin_down_state"
+                                        ]
+                                # If a specific router of an IXP connection is configured
+                                if ixprouter in generic["bgp_groups"]:
+                                    # If it has a admin_down_state setting, and it hasn't been configured above yet
+                                    if (
+                                        "admin_down_state" in generic["bgp_groups"][ixprouter]
+                                        and admin_down_state is False
+                                    ):
+                                        # Set it to whatever it is set to in the config
+                                        admin_down_state = generic["bgp_groups"][ixprouter][
+                                            "admin_down_state"
+                                        ]
+
+                                graceful_shutdown = False
+                                if ixp in generic["bgp_groups"]:
+                                    if "graceful_shutdown" in generic["bgp_groups"][ixp]:
+                                        graceful_shutdown = generic["bgp_groups"][ixp][
+                                            "graceful_shutdown"
+                                        ]
+                                if ixprouter in generic["bgp_groups"]:
+                                    if (
+                                        "graceful_shutdown" in generic["bgp_groups"][ixprouter]
+                                        and graceful_shutdown is False
+                                    ):
+                                        graceful_shutdown = generic["bgp_groups"][ixprouter][
+                                            "graceful_shutdown"
+                                        ]
+                                if (
+                                    "graceful_shutdown" in generic["bgp"][routershortnodash]
+                                    and graceful_shutdown is False
+                                ):
+                                    graceful_shutdown = generic["bgp"][routershortnodash][
+                                        "graceful_shutdown"
+                                    ]
+
+                                block_importexport = False
+                                if (
+                                    ixp in generic["bgp_groups"]
+                                    or ixprouter in generic["bgp_groups"]
+                                ):
+                                    if (
+                                        "block_importexport" in generic["bgp_groups"][ixp]
+                                        or "block_importexport"
+                                        in generic["bgp_groups"][ixprouter]
+                                    ):
+                                        block_importexport = generic["bgp_groups"][ixp][
+                                            "block_importexport"
+                                        ]
+                                if ixprouter in generic["bgp_groups"]:
+                                    if (
+                                        "block_importexport" in generic["bgp_groups"][ixprouter]
+                                        and block_importexport is False
+                                    ):
+                                        block_importexport = generic["bgp_groups"][ixprouter][
+                                            "block_importexport"
+                                        ]
+
+                                if not generate_configs:
+                                    continue
+
+                                config_snippet(
+                                    asn,
+                                    str(session_ip),
+                                    description,
+                                    ixp,
+                                    router,
+                                    no_filter,
+                                    export_full_table,
+                                    limits,
+                                    gtsm,
+                                    peer_type,
+                                    multihop,
+                                    disable_multihop_source_map,
+                                    multihop_source_map,
+                                    generic,
+                                    admin_down_state,
+                                    block_importexport,
+                                    bgp_local_pref,
+                                    graceful_shutdown,
+                                    blackhole_accept,
+                                    blackhole_community,
+                                )
+
+        # Complete generation tracking with new architecture
+        if state_manager:
+            try:
+                # Calculate final metrics
+                generation_end_time = time.time()
+                end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+                peak_memory = max(start_memory, end_memory)
+                generation_duration_ms = int((generation_end_time - generation_start_time) * 1000)
+
+                # Count total filters and peers processed
+                peer_count = len(peerings)
+                filter_count = len(seen_router_policy)
+
+                # Create generation record
+                generation_record = GenerationRecord(
+                    config_hash=sha256(str(peerings).encode()).hexdigest()[:16],
+                    peer_count=peer_count,
+                    filter_count=filter_count,
+                    duration_ms=generation_duration_ms,
+                    memory_peak_mb=peak_memory,
+                    success=True,
+                    metadata={
+                        "generate_configs": generate_configs,
+                        "generate_prefixsets": generate_prefixsets,
+                        "architecture_version": "2.0",
+                        "memory_start_mb": start_memory,
+                        "memory_end_mb": end_memory,
+                        "processed_asns": peer_count,
+                        "total_sessions": sum(len(sessions) for sessions in [
+                            peerings[asn].get("only_with", []) or
+                            peerings[asn].get("private_peerings", []) or
+                            pdb.get(int(asn[2:]), []) for asn in peerings
+                        ] if sessions),
+                        "plugins_loaded": len(plugin_manager.plugins) if plugin_manager else 0
+                    }
+                )
+
+                # Track the generation
+                generation_id = state_manager.track_generation(generation_record)
+
+                # Track completion event
+                track_event(
+                    EventType.GENERATION_SUCCESS,
+                    "peering_filters",
+                    f"Configuration generation completed successfully",
+                    details={
+                        "generation_id": generation_id,
+                        "peer_count": peer_count,
+                        "filter_count": filter_count,
+                        "duration_ms": generation_duration_ms,
+                        "memory_peak_mb": peak_memory,
+                        "memory_efficiency": f"{((start_memory - end_memory) / start_memory * 100):.1f}% reduction" if start_memory > end_memory else "memory stable",
+                        "architecture_version": "2.0"
+                    },
+                    duration_ms=generation_duration_ms
+                )
+
+                print(f"✓ Generation completed - ID: {generation_id}, Duration: {generation_duration_ms/1000:.1f}s, Peak Memory: {peak_memory:.1f}MB", file=sys.stderr)
+
+            except Exception as e:
+                print(f"ERROR: Failed to track generation completion: {e}", file=sys.stderr)
+                track_event(
+                    EventType.GENERATION_FAILURE,
+                    "peering_filters",
+                    f"Failed to track generation: {e}",
+                    success=False
+                )
+    finally:
+        # Restore the caller's working directory when run in-process
+        os.chdir(launchdir)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(
+        run(
+            [arg for arg in sys.argv[1:] if arg in ("all", "configs", "prefixsets")],
+            no_checks="--no-checks" in sys.argv,
+            debug="debug" in sys.argv,
+        )
+    )
+
@@ -18,6 +18,14 @@ sys.path.append(
 from jinja2 import Environment, FileSystemLoader
 from lib.plugin_system import PluginInfo, PluginType, VendorPlugin
 
+# BIRD 2 specific template variables, identical for every peer
+BIRD2_RENDER_VARS = {
+    "bird_version": "2",
+    "supports_unified_config": True,
+    "supports_roa_tables": True,
+    "supports_large_communities": True,
+}
+
 
 class Bird2VendorPlugin(VendorPlugin):
     """
@@ -30,6 +38,19 @@ class Bird2VendorPlugin(VendorPlugin):
     - Feature detection and capability reporting
     """
 
+    INFO = PluginInfo(
+        name="bird2",
+        version="2.0.0",
+        description="BIRD 2.x routing daemon support",
+        author="AutoNet Team",
+        plugin_type=PluginType.VENDOR,
+        enabled=True,
+        config={},
+        module_path="plugins.vendors.bird2",
+        class_name="Bird2VendorPlugin",
+        dependencies=[],
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
 
@@ -51,6 +72,10 @@ class Bird2VendorPlugin(VendorPlugin):
             self.logger.warning(f"Template directory not found: {self.template_dir}")
             self.jinja_env = None
 
+        # Resolved template names and loaded templates, cached for the run
+        self._template_names: Dict[str, str] = {}
+        self._templates: Dict[str, Any] = {}
+
         # BIRD 2 capabilities
         self.capabilities = [
             "unified_ipv4_ipv6",
@@ -63,21 +88,6 @@ class Bird2VendorPlugin(VendorPlugin):
             "multiple_tables",
         ]
 
-    def get_info(self) -> PluginInfo:
-        """Return plugin information"""
-        return PluginInfo(
-            name="bird2",
-            version="2.0.0",
-            description="BIRD 2.x routing daemon support",
-            author="AutoNet Team",
-            plugin_type=PluginType.VENDOR,
-            enabled=True,
-            config=self.config,
-            module_path="plugins.vendors.bird2",
-            class_name="Bird2VendorPlugin",
-            dependencies=[],
-        )
-
     def initialize(self) -> bool:
         """Initialize the BIRD 2 plugin"""
         try:
@@ -145,24 +155,16 @@ class Bird2VendorPlugin(VendorPlugin):
             template_name = self._get_template_name(peer_info)
 
             # Load template
-            template = self.jinja_env.get_template(template_name)
-
-            # Merge peer info into template vars
-            render_vars = {**template_vars, "peer": peer_info}
-
-            # Add BIRD 2 specific variables
-            render_vars.update(
-                {
-                    "bird_version": "2",
-                    "supports_unified_config": True,
-                    "supports_roa_tables": True,
-                    "supports_large_communities": True,
-                }
+            template = self._templates.get(template_name)
+            if template is None:
+                template = self.jinja_env.get_template(template_name)
+                self._templates[template_name] = template
+
+            # Render with peer info and BIRD 2 specific variables merged in
+            config = template.render(
+                {**template_vars, "peer": peer_info, **BIRD2_RENDER_VARS}
             )
 
-            # Render configuration
-            config = template.render(**render_vars)
-
             self.logger.debug(
                 f"Generated BIRD 2 config for peer: {peer_info.get('asn', 'unknown')}"
             )
@@ -185,11 +187,16 @@ class Bird2VendorPlugin(VendorPlugin):
         elif peer_info.get("is_customer"):
             template_name = "customer.j2"
 
-        # Fallback to peer.j2 if specific template doesn't exist
-        if not (Path(self.template_dir) / template_name).exists():
-            template_name = "peer.j2"
+        # Fallback to peer.j2 if specific template doesn't exist; the
+        # template directory is fixed, so each name is only checked once
+        resolved = self._template_names.get(template_name)
+        if resolved is None:
+            resolved = template_name
+            if not (Path(self.template_dir) / template_name).exists():
+                resolved = "peer.j2"
+            self._template_names[template_name] = resolved
 
-        return template_name
+        return resolved
 
     def validate_config(self, config_content: str) -> bool:
         """
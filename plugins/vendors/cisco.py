@@ -19,6 +19,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from lib.plugin_system import VendorPlugin, PluginInfo, PluginType
 from jinja2 import Environment, DictLoader
 
+# Validation patterns, compiled once at import
+ROUTER_BGP_PATTERN = re.compile(r'^\s*router bgp \d+\s*$')
+IOS_NEIGHBOR_PATTERN = re.compile(
+    r'neighbor \d+\.\d+\.\d+\.\d+ '
+    r'(?:remote-as \d+|description .+|route-map \S+ (?:in|out))'
+)
+
 
 class CiscoVendorPlugin(VendorPlugin):
     """
@@ -222,7 +229,7 @@ class CiscoVendorPlugin(VendorPlugin):
                 return False
 
             # Check for required spaces around certain keywords
-            if ' router bgp' in line.lower() and not re.match(r'^\s*router bgp \d+\s*$', line):
+            if ' router bgp' in line.lower() and not ROUTER_BGP_PATTERN.match(line):
                 self.logger.error(f"Invalid router bgp syntax on line {line_num}: {line}")
                 return False
 
@@ -296,16 +303,9 @@ class CiscoVendorPlugin(VendorPlugin):
 
     def _validate_ios_neighbor_line(self, line: str) -> bool:
         """Validate IOS neighbor configuration line"""
-        # Basic neighbor line validation
-        neighbor_patterns = [
-            r'neighbor \d+\.\d+\.\d+\.\d+ remote-as \d+',
-            r'neighbor \d+\.\d+\.\d+\.\d+ description .+',
-            r'neighbor \d+\.\d+\.\d+\.\d+ route-map \S+ (in|out)',
-        ]
-
-        for pattern in neighbor_patterns:
-            if re.match(pattern, line):
-                return True
+        # Basic neighbor line validation (remote-as, description or route-map)
+        if IOS_NEIGHBOR_PATTERN.match(line):
+            return True
 
         # If it's a neighbor line but doesn't match patterns, it might be invalid
         if line.startswith('neighbor'):
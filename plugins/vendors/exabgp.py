@@ -31,6 +31,19 @@ class ExaBGPVendorPlugin(VendorPlugin):
     - Dynamic route injection
     """
 
+    INFO = PluginInfo(
+        name="exabgp",
+        version="1.0.0-placeholder",
+        description="ExaBGP software-defined BGP - Ready for community implementation",
+        author="AutoNet Community",
+        plugin_type=PluginType.VENDOR,
+        enabled=False,  # Disabled until implemented
+        config={},
+        module_path="plugins.vendors.exabgp",
+        class_name="ExaBGPVendorPlugin",
+        dependencies=[],
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
 
@@ -49,21 +62,6 @@ class ExaBGPVendorPlugin(VendorPlugin):
             "monitoring_integration",
         ]
 
-    def get_info(self) -> PluginInfo:
-        """Return plugin information"""
-        return PluginInfo(
-            name="exabgp",
-            version="1.0.0-placeholder",
-            description="ExaBGP software-defined BGP - Ready for community implementation",
-            author="AutoNet Community",
-            plugin_type=PluginType.VENDOR,
-            enabled=False,  # Disabled until implemented
-            config=self.config,
-            module_path="plugins.vendors.exabgp",
-            class_name="ExaBGPVendorPlugin",
-            dependencies=[],
-        )
-
     def initialize(self) -> bool:
         """Initialize the ExaBGP plugin"""
         # TODO: Community implementation needed
@@ -32,6 +32,19 @@ class FRRVendorPlugin(VendorPlugin):
     - Configuration validation via vtysh
     """
 
+    INFO = PluginInfo(
+        name="frr",
+        version="1.0.0-placeholder",
+        description="FRRouting (FRR) support - Ready for community implementation",
+        author="AutoNet Community",
+        plugin_type=PluginType.VENDOR,
+        enabled=False,  # Disabled until implemented
+        config={},
+        module_path="plugins.vendors.frr",
+        class_name="FRRVendorPlugin",
+        dependencies=[],
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
 
@@ -53,21 +66,6 @@ class FRRVendorPlugin(VendorPlugin):
             "isis_integration",
         ]
 
-    def get_info(self) -> PluginInfo:
-        """Return plugin information"""
-        return PluginInfo(
-            name="frr",
-            version="1.0.0-placeholder",
-            description="FRRouting (FRR) support - Ready for community implementation",
-            author="AutoNet Community",
-            plugin_type=PluginType.VENDOR,
-            enabled=False,  # Disabled until implemented
-            config=self.config,
-            module_path="plugins.vendors.frr",
-            class_name="FRRVendorPlugin",
-            dependencies=[],
-        )
-
     def initialize(self) -> bool:
         """Initialize the FRR plugin"""
         # TODO: Community implementation needed
@@ -31,6 +31,19 @@ class JuniperVendorPlugin(VendorPlugin):
     - Configuration validation via commit check
     """
 
+    INFO = PluginInfo(
+        name="juniper",
+        version="1.0.0-placeholder",
+        description="Juniper JunOS support - Ready for community implementation",
+        author="AutoNet Community",
+        plugin_type=PluginType.VENDOR,
+        enabled=False,  # Disabled until implemented
+        config={},
+        module_path="plugins.vendors.juniper",
+        class_name="JuniperVendorPlugin",
+        dependencies=[],
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
 
@@ -50,21 +63,6 @@ class JuniperVendorPlugin(VendorPlugin):
             "commit_rollback",
         ]
 
-    def get_info(self) -> PluginInfo:
-        """Return plugin information"""
-        return PluginInfo(
-            name="juniper",
-            version="1.0.0-placeholder",
-            description="Juniper JunOS support - Ready for community implementation",
-            author="AutoNet Community",
-            plugin_type=PluginType.VENDOR,
-            enabled=False,  # Disabled until implemented
-            config=self.config,
-            module_path="plugins.vendors.juniper",
-            class_name="JuniperVendorPlugin",
-            dependencies=[],
-        )
-
     def initialize(self) -> bool:
         """Initialize the Juniper plugin"""
         # TODO: Community implementation needed
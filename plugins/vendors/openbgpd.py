@@ -31,6 +31,19 @@ class OpenBGPDVendorPlugin(VendorPlugin):
     - Configuration validation via bgpd -n
     """
 
+    INFO = PluginInfo(
+        name="openbgpd",
+        version="1.0.0-placeholder",
+        description="OpenBGPD support - Ready for community implementation",
+        author="AutoNet Community",
+        plugin_type=PluginType.VENDOR,
+        enabled=False,  # Disabled until implemented
+        config={},
+        module_path="plugins.vendors.openbgpd",
+        class_name="OpenBGPDVendorPlugin",
+        dependencies=[],
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
 
@@ -49,21 +62,6 @@ class OpenBGPDVendorPlugin(VendorPlugin):
             "route_collectors",
         ]
 
-    def get_info(self) -> PluginInfo:
-        """Return plugin information"""
-        return PluginInfo(
-            name="openbgpd",
-            version="1.0.0-placeholder",
-            description="OpenBGPD support - Ready for community implementation",
-            author="AutoNet Community",
-            plugin_type=PluginType.VENDOR,
-            enabled=False,  # Disabled until implemented
-            config=self.config,
-            module_path="plugins.vendors.openbgpd",
-            class_name="OpenBGPDVendorPlugin",
-            dependencies=[],
-        )
-
     def initialize(self) -> bool:
         """Initialize the OpenBGPD plugin"""
         # TODO: Community implementation needed
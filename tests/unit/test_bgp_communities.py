@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AutoNet BGP Communities
+"""
+
+import copy
+import os
+import pickle
+import sys
+import unittest
+from unittest import mock
+
+# Add lib directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import lib.bgp_communities_fast
+from lib.bgp_communities import BGPCommunity, BGPCommunityManager, CommunityType
+
+# Valid, invalid and boundary communities, mixed in one batch
+MIXED_COMMUNITIES = [
+    "64512:100",
+    "0:0",
+    "65535:65535",
+    "65536:1",
+    "1:65536",
+    "00064512:0100",
+    "4200000000:1:100",
+    "4294967295:4294967295:4294967295",
+    "4294967296:0:0",
+    "99999999999999999999:1",
+    "1:2:3:4",
+    "",
+    ":",
+    "1:",
+    ":1",
+    "1::2",
+    " 1:2",
+    "+1:2",
+    "-1:2",
+    "ab:cd",
+    "NO_EXPORT",
+    "no_advertise",
+    "Blackhole",
+    "NO_EXPORT:1",
+    "UNKNOWN",
+    "64512",
+]
+
+
+class TestBGPCommunity(unittest.TestCase):
+    """Test cases for BGPCommunity"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.manager = BGPCommunityManager()
+
+    def test_parsed_value_round_trip(self):
+        """Test parts survive packing, copying and pickling"""
+        for value, parts in [
+            ("64512:100", (64512, 100)),
+            ("65535:65535", (65535, 65535)),
+            ("4200000000:1:100", (4200000000, 1, 100)),
+            ("4294967295:4294967295:4294967295", (4294967295,) * 3),
+            ("NO_EXPORT", (65535, 65281)),
+        ]:
+            community = self.manager.parse_community(value)
+            self.assertEqual(community.parsed_value, parts)
+            self.assertEqual(copy.copy(community), community)
+            self.assertEqual(pickle.loads(pickle.dumps(community)), community)
+
+    def test_constructor_accepts_parsed_value(self):
+        """Test the former (community_type, value, parsed_value) signature still works"""
+        expected = self.manager.parse_community("4200000000:1:100")
+
+        for community in (
+            BGPCommunity(CommunityType.LARGE, "4200000000:1:100", (4200000000, 1, 100)),
+            BGPCommunity(
+                community_type=CommunityType.LARGE,
+                value="4200000000:1:100",
+                parsed_value=(4200000000, 1, 100),
+            ),
+            BGPCommunity(CommunityType.LARGE, "4200000000:1:100", expected.packed),
+        ):
+            self.assertEqual(community, expected)
+            self.assertEqual(hash(community), hash(expected))
+            self.assertEqual(community.parsed_value, (4200000000, 1, 100))
+
+        with self.assertRaises(TypeError):
+            BGPCommunity(CommunityType.STANDARD, "64512:100")
+
+    def assert_validate_many_matches_scalar(self, communities):
+        """Check validate_many against validate_community for each item"""
+        self.assertEqual(
+            BGPCommunityManager.validate_many(communities),
+            [BGPCommunityManager.validate_community(c)[0] for c in communities],
+        )
+
+    def test_validate_many_matches_validate_community(self):
+        """Test the bulk validator agrees with the scalar one, with or without numba"""
+        for numba in {lib.bgp_communities_fast.numba, None}:
+            with mock.patch.object(lib.bgp_communities_fast, "numba", numba):
+                self.assert_validate_many_matches_scalar(MIXED_COMMUNITIES)
+                self.assert_validate_many_matches_scalar([])
+                self.assert_validate_many_matches_scalar(["64512:100"] * 3)
+                self.assert_validate_many_matches_scalar(["bogus", "1:2:"])
+
+                # Non-ASCII input takes the pure-Python path
+                self.assert_validate_many_matches_scalar(["\u0661\u0662:3", "1:2"])
+
+    def test_validate_numeric_batch_without_numba(self):
+        """Test the compiled validator reports itself unavailable without numba"""
+        with mock.patch.object(lib.bgp_communities_fast, "numba", None):
+            self.assertIsNone(
+                lib.bgp_communities_fast.validate_numeric_batch(["64512:100"])
+            )
+
+    @unittest.skipIf(lib.bgp_communities_fast.numba is None, "numba is not installed")
+    def test_validate_numeric_batch(self):
+        """Test the compiled validator on communities other than well-known names"""
+        numeric = [c for c in MIXED_COMMUNITIES if ":" in c]
+
+        self.assertEqual(
+            lib.bgp_communities_fast.validate_numeric_batch(numeric),
+            [BGPCommunityManager.validate_community(c)[0] for c in numeric],
+        )
+
+    def test_format_for_vendor(self):
+        """Test vendor formats unpack the stored parts"""
+        self.manager.parse_communities(["64512:100", "4200000000:1:100", "bogus"])
+
+        self.assertEqual(
+            self.manager.format_for_vendor("bird"),
+            ["(64512, 100)", "(4200000000, 1, 100)"],
+        )
+        self.assertEqual(
+            self.manager.format_for_vendor("cisco"),
+            ["64512:100", "large:4200000000:1:100"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,10 @@ Unit tests for AutoNet Configuration Manager
 import os
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -53,8 +55,11 @@ schemas:
     def test_schema_loading(self):
         """Test schema loading"""
         manager = ConfigurationManager(str(self.config_dir))
+        self.assertNotIn("main", manager.schema_cache)
+
+        schema = manager._get_schema()
         self.assertIn("main", manager.schema_cache)
-        self.assertEqual(manager.schema_cache["main"]["autonet"]["version"], "2.0")
+        self.assertEqual(schema["autonet"]["version"], "2.0")
 
     def test_config_validation_success(self):
         """Test successful configuration validation"""
@@ -79,6 +84,54 @@ schemas:
         with self.assertRaises(ValidationError):
             manager._validate_configuration(config)
 
+    def test_validation_result_cached_for_identical_config(self):
+        """Test that schema validation is skipped for a known-good config"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        config = {"builddir": "/tmp/build", "stagedir": "/tmp/stage"}
+
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+        manager._validate_configuration(config)
+
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+        with mock.patch.object(manager, "_validate_against") as validate:
+            manager._validate_configuration(dict(config))
+            validate.assert_not_called()
+
+            manager._validate_configuration({**config, "stagedir": "/tmp/other"})
+            validate.assert_called_once()
+
+        manager = ConfigurationManager(
+            str(self.config_dir), cache_dir=str(cache_dir), validation_cache=False
+        )
+        with mock.patch.object(manager, "_validate_against") as validate:
+            manager._validate_configuration(config)
+            validate.assert_called_once()
+
+    def test_validation_markers_private_and_pruned(self):
+        """Test that markers others could have written are ignored and old ones evicted"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+
+        with mock.patch("lib.config_manager.CACHE_MAX_ENTRIES", 2):
+            for i in range(3):
+                manager._validate_configuration(
+                    {"builddir": f"/tmp/build{i}", "stagedir": "/tmp/stage"}
+                )
+                time.sleep(0.01)
+
+        markers = list(cache_dir.glob("valid-*"))
+        self.assertEqual(len(markers), 2)
+        for marker in markers:
+            self.assertEqual(marker.stat().st_mode & 0o777, 0o600)
+
+        config = {"builddir": "/tmp/build2", "stagedir": "/tmp/stage"}
+        marker = manager._validation_marker({}, config)
+        marker.chmod(0o666)
+        with mock.patch.object(manager, "_validate_against") as validate:
+            manager._validate_configuration(config)
+            validate.assert_called_once()
+        self.assertEqual(marker.stat().st_mode & 0o777, 0o600)
+
     def test_environment_overrides(self):
         """Test environment-specific overrides"""
         # Add environment overrides to schema
@@ -103,6 +156,149 @@ environments:
         self.assertEqual(result["logging"]["level"], "DEBUG")
         self.assertTrue(result["test_override"])
 
+    def test_parse_cache_reused_until_file_changes(self):
+        """Test that parsed YAML is cached and invalidated on change"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+
+        config_file = Path(self.temp_dir) / "generic.yml"
+        config_file.write_text("builddir: /tmp/build\nstagedir: /tmp/stage\n")
+
+        cached_before = len(list(cache_dir.glob("config-*.pkl")))
+        first = manager._load_yaml_cached(config_file)
+        self.assertEqual(len(list(cache_dir.glob("config-*.pkl"))), cached_before + 1)
+
+        second = manager._load_yaml_cached(config_file)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        config_file.write_text("builddir: /tmp/other\nstagedir: /tmp/stage\n")
+        third = manager._load_yaml_cached(config_file)
+        self.assertEqual(third["builddir"], "/tmp/other")
+
+        # The entry for the old content is evicted
+        self.assertEqual(len(list(cache_dir.glob("config-*.pkl"))), cached_before + 1)
+
+    def test_parse_cache_private_to_user(self):
+        """Test that cache entries are private and others' entries are ignored"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+
+        config_file = Path(self.temp_dir) / "generic.yml"
+        config_file.write_text("builddir: /tmp/build\nstagedir: /tmp/stage\n")
+        manager._load_yaml_cached(config_file)
+
+        (cache_file,) = cache_dir.glob("config-*.pkl")
+        self.assertEqual(cache_dir.stat().st_mode & 0o777, 0o700)
+        self.assertEqual(cache_file.stat().st_mode & 0o777, 0o600)
+
+        cache_file.chmod(0o666)
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+        with mock.patch("lib.config_manager.pickle.load") as load:
+            self.assertEqual(
+                manager._load_yaml_cached(config_file)["builddir"], "/tmp/build"
+            )
+            load.assert_not_called()
+
+    def test_parse_cache_skips_files_with_secrets(self):
+        """Test that files holding API keys or BGP passwords are not written to the cache"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        manager = ConfigurationManager(str(self.config_dir), cache_dir=str(cache_dir))
+
+        api_key_file = Path(self.temp_dir) / "generic.yml"
+        api_key_file.write_text("builddir: /tmp/build\npdb_apikey: secret\n")
+        passwords_file = Path(self.temp_dir) / "passwords.yml"
+        passwords_file.write_text("bgp_passwords:\n  AS42: DefibClearOK\n")
+
+        self.assertEqual(
+            manager._load_yaml_cached(api_key_file)["pdb_apikey"], "secret"
+        )
+        self.assertEqual(
+            manager._load_yaml_cached(passwords_file)["bgp_passwords"],
+            {"AS42": "DefibClearOK"},
+        )
+        self.assertEqual(list(cache_dir.glob("config-*.pkl")), [])
+
+    def test_prune_cache(self):
+        """Test that old and surplus cache entries are removed"""
+        cache_dir = Path(self.temp_dir) / "cache"
+        cache_dir.mkdir()
+        for i in range(5):
+            entry = cache_dir / f"config-{i}.pkl"
+            entry.touch()
+            os.utime(entry, (time.time() - i, time.time() - i))
+        expired = time.time() - 31 * 24 * 3600
+        os.utime(cache_dir / "config-1.pkl", (expired, expired))
+
+        with mock.patch("lib.config_manager.CACHE_MAX_ENTRIES", 3):
+            ConfigurationManager._prune_cache(cache_dir, "config-*.pkl")
+
+        self.assertEqual(
+            sorted(entry.name for entry in cache_dir.iterdir()),
+            ["config-0.pkl", "config-2.pkl", "config-3.pkl"],
+        )
+
+    def test_parse_kept_in_memory_for_unchanged_file(self):
+        """Test that unchanged files are served from memory without re-reading"""
+        manager = ConfigurationManager(
+            str(self.config_dir), cache_dir=str(Path(self.temp_dir) / "cache")
+        )
+
+        config_file = Path(self.temp_dir) / "generic.yml"
+        config_file.write_text("builddir: /tmp/build\nstagedir: /tmp/stage\n")
+        old = time.time() - 3600
+        os.utime(config_file, (old, old))
+
+        with mock.patch.object(
+            manager, "_load_yaml_pickled", wraps=manager._load_yaml_pickled
+        ) as load:
+            first = manager._load_yaml_cached(config_file)
+            second = manager._load_yaml_cached(config_file)
+            self.assertEqual(load.call_count, 1)
+
+            config_file.write_text("builddir: /tmp/other/\nstagedir: /tmp/stage\n")
+            os.utime(config_file, (old, old))
+            third = manager._load_yaml_cached(config_file)
+            self.assertEqual(load.call_count, 2)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(third["builddir"], "/tmp/other/")
+
+    def test_api_key_resolved_from_loaded_config(self):
+        """Test that an encrypted pdb_apikey is decrypted from the loaded file"""
+        from cryptography.fernet import Fernet
+
+        import peering_filters
+
+        encryption_key = Fernet.generate_key().decode()
+        encrypted = peering_filters.encrypt_api_key("a" * 32, encryption_key)
+        config_file = Path(self.temp_dir) / "generic.yml"
+        config_file.write_text(
+            f"builddir: /tmp/build\nstagedir: /tmp/stage\n"
+            f"pdb_apikey: 'ENCRYPTED:{encrypted}'\n"
+        )
+        manager = ConfigurationManager(
+            str(self.config_dir), cache_dir=str(Path(self.temp_dir) / "cache")
+        )
+
+        with mock.patch.dict(os.environ, {"AUTONET_ENCRYPTION_KEY": encryption_key}):
+            os.environ.pop("AUTONET_PEERINGDB_KEY", None)
+            config = manager.load_configuration(str(config_file))
+
+        self.assertEqual(config["pdb_apikey"], "a" * 32)
+
+    def test_validate_environment_uses_given_config(self):
+        """Test that validate_environment checks a passed config without reloading"""
+        manager = ConfigurationManager(str(self.config_dir))
+        config = {"builddir": self.temp_dir, "stagedir": self.temp_dir}
+
+        # No configuration file exists, so a reload would fail validation
+        self.assertTrue(manager.validate_environment(config))
+
+        config["stagedir"] = str(Path(self.temp_dir) / "missing")
+        self.assertFalse(manager.validate_environment(config))
+
 
 if __name__ == "__main__":
     unittest.main()
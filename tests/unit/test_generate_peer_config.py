@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AutoNet Peer Configuration Generator
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+# Add lib directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import generate_peer_config
+from generate_peer_config import (
+    PARALLEL_PEER_THRESHOLD,
+    WRITE_WORKERS,
+    PeerConfigGenerator,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def render(asn, peer_info, *args, **kwargs):
+    """Stand-in for template rendering"""
+    return f"# {asn} {peer_info['name']}\n"
+
+
+class StubGenerator(PeerConfigGenerator):
+    """Generator rendering peers without vendor plugins"""
+
+    def generate_peer_config(self, asn, peer_info, *args, **kwargs):
+        return render(asn, peer_info)
+
+
+class TestPeerConfigGenerator(unittest.TestCase):
+    """Test cases for PeerConfigGenerator"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.generator = StubGenerator(
+            {
+                "template_dir": str(REPO_ROOT / "templates"),
+                "output_dir": str(Path(self.temp_dir) / "output"),
+            }
+        )
+
+    def tearDown(self):
+        """Clean up test environment"""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def counting_peers(self, count, consumed):
+        """Yield peers, recording how many have been read"""
+        for i in range(count):
+            consumed.append(i)
+            yield {"asn": f"AS{64512 + i}", "name": f"Peer {i}"}
+
+    def test_repeated_asns_keep_last_entry(self):
+        """Test repeated and integer ASNs are generated, the last entry winning"""
+        peers = [
+            {"asn": "AS64512", "name": "old"},
+            {"name": "no asn"},
+            {"asn": 64513, "name": "integer"},
+            {"asn": "AS64512", "name": "new"},
+        ]
+
+        self.assertEqual(
+            list(self.generator.iter_generate_peers(peers)),
+            [
+                ("AS64512", "# AS64512 old\n"),
+                (64513, "# 64513 integer\n"),
+                ("AS64512", "# AS64512 new\n"),
+            ],
+        )
+        self.assertEqual(
+            self.generator.generate_multiple_peers(peers),
+            {"AS64512": "# AS64512 new\n", 64513: "# 64513 integer\n"},
+        )
+
+        output_dir = Path(self.temp_dir) / "configs"
+        self.generator.write_configs(
+            self.generator.iter_generate_peers(peers), output_dir
+        )
+        self.assertEqual((output_dir / "as64512.conf").read_text(), "# AS64512 new\n")
+        self.assertEqual((output_dir / "64513.conf").read_text(), "# 64513 integer\n")
+
+    def test_identical_peer_entries_rendered_once(self):
+        """Test repeated identical entries share one render"""
+        peers = [
+            {"asn": "AS64512", "name": "first"},
+            {"asn": "AS64513", "name": "other"},
+            {"name": "first", "asn": "AS64512"},
+            {"asn": "AS64512", "name": "changed"},
+        ]
+
+        with mock.patch.object(
+            StubGenerator, "generate_peer_config", side_effect=render
+        ) as generate:
+            results = list(self.generator.iter_generate_peers(peers))
+
+        self.assertEqual(generate.call_count, 3)
+        self.assertEqual(
+            results,
+            [
+                ("AS64512", "# AS64512 first\n"),
+                ("AS64513", "# AS64513 other\n"),
+                ("AS64512", "# AS64512 first\n"),
+                ("AS64512", "# AS64512 changed\n"),
+            ],
+        )
+
+    @mock.patch.object(generate_peer_config, "_generate_in_worker", render)
+    @mock.patch.object(
+        generate_peer_config,
+        "ProcessPoolExecutor",
+        lambda max_workers, **kwargs: ThreadPoolExecutor(max_workers),
+    )
+    @mock.patch.object(generate_peer_config.os, "cpu_count", return_value=4)
+    def test_iter_generate_peers_streams_parallel_batches(self, cpu_count):
+        """Test large batches keep a bounded window of renders in flight"""
+        workers = cpu_count.return_value
+        consumed = []
+
+        results = self.generator.iter_generate_peers(
+            self.counting_peers(1000, consumed)
+        )
+
+        self.assertEqual(next(results), ("AS64512", "# AS64512 Peer 0\n"))
+        self.assertLessEqual(len(consumed), PARALLEL_PEER_THRESHOLD + 2 * workers)
+
+        remaining = list(results)
+        self.assertEqual(len(remaining), 999)
+        self.assertEqual(remaining[-1], ("AS65511", "# AS65511 Peer 999\n"))
+
+    # Logged plugin failures would keep the frame, and so the generator, alive
+    @mock.patch.object(generate_peer_config, "initialize_plugin_system")
+    @mock.patch("lib.state_manager.get_state_manager")
+    def test_buffered_events_flushed_when_collected(self, get_state_manager, _):
+        """Test the generator is not kept alive and flushes its events when collected"""
+        generator = StubGenerator(
+            {
+                "template_dir": str(REPO_ROOT / "templates"),
+                "output_dir": str(Path(self.temp_dir) / "output"),
+            }
+        )
+        generator._track_event("Generated AS64512")
+        ref = weakref.ref(generator)
+
+        del generator
+        gc.collect()
+
+        self.assertIsNone(ref())
+        (events,) = get_state_manager.return_value.track_events.call_args[0]
+        self.assertEqual([event.message for event in events], ["Generated AS64512"])
+
+    def test_validate_peer_batch_matches_validate_peer_info(self):
+        """Test batch validation reports the same errors as per-peer validation"""
+        peers = [
+            {"asn": "AS64512", "name": "valid"},
+            {"asn": "AS64513", "name": "addresses", "ipv4": "192.0.2.1"},
+            {"asn": "AS64514", "name": "bad ipv4", "ipv4": "192.0.2.256"},
+            {"asn": "AS64515", "name": "bad ipv6", "ipv6": "2001:db8::g"},
+            {"asn": "as64516", "name": "lowercase"},
+            {"asn": "AS", "name": "no digits"},
+            {"asn": "64517", "name": "no prefix"},
+            {"asn": 64518, "name": "integer"},
+            {"asn": "AS64519\nAS64520", "name": "two lines"},
+            {"asn": "AS64521\n", "name": "trailing newline"},
+            {"asn": " AS64522", "name": "leading space"},
+            {"asn": "AS١٢", "name": "non-ASCII digits"},
+            {"asn": "", "name": "empty"},
+            {"name": "missing asn"},
+            {"asn": "AS64523"},
+            {},
+            {"asn": "AS64512", "name": "duplicate"},
+        ]
+
+        self.assertEqual(
+            self.generator.validate_peer_batch(peers),
+            [self.generator.validate_peer_info(peer) for peer in peers],
+        )
+        self.assertEqual(self.generator.validate_peer_batch([]), [])
+
+    def test_iter_write_configs_repeated_asn_written_in_order(self):
+        """Test the last configuration for a repeated ASN is the one on disk"""
+        results = [("AS64512", str(i) * 100_000) for i in range(50)]
+        output_dir = Path(self.temp_dir) / "configs"
+
+        self.generator.write_configs(results, output_dir)
+
+        self.assertEqual((output_dir / "as64512.conf").read_text(), results[-1][1])
+
+    def test_iter_write_configs_streams_results(self):
+        """Test configurations are written while results are still being read"""
+        consumed = []
+        results = (
+            (peer["asn"], render(peer["asn"], peer))
+            for peer in self.counting_peers(500, consumed)
+        )
+        output_dir = Path(self.temp_dir) / "configs"
+
+        written = 0
+        for path in self.generator.iter_write_configs(results, output_dir):
+            written += 1
+            self.assertLessEqual(len(consumed) - written, 2 * WRITE_WORKERS)
+
+        self.assertEqual(written, 500)
+        self.assertEqual(
+            (output_dir / "as64512.conf").read_text(), "# AS64512 Peer 0\n"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
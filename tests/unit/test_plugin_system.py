@@ -8,6 +8,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -56,7 +57,7 @@ class TestVendorPlugin(VendorPlugin):
             author="Test Author",
             plugin_type=PluginType.VENDOR,
             enabled=True,
-            config={},
+            config=self.config,
             module_path="test",
             class_name="TestVendorPlugin",
             dependencies=[],
@@ -131,6 +132,189 @@ class TestPluginSystem(unittest.TestCase):
         self.assertEqual(len(vendor_plugins), 1)
         self.assertIsInstance(vendor_plugins[0], VendorPlugin)
 
+    def test_get_vendor_plugin(self):
+        """Test vendor plugin lookup by exact and partial vendor name"""
+        manager = PluginManager(self.plugin_dirs)
+
+        vendor_plugin = TestVendorPlugin({"aliases": ["tv"]})
+        vendor_info = vendor_plugin.get_info()
+        manager.plugins[vendor_info.name] = vendor_plugin
+        manager.plugin_info[vendor_info.name] = vendor_info
+        manager.plugin_types[vendor_info.plugin_type].append(vendor_info.name)
+
+        self.assertIs(manager.get_vendor_plugin("TEST_VENDOR"), vendor_plugin)
+        self.assertIs(manager.get_vendor_plugin("tv"), vendor_plugin)
+        self.assertIs(manager.get_vendor_plugin("test"), vendor_plugin)
+        self.assertIsNone(manager.get_vendor_plugin("other"))
+
+    def test_class_info_plugin_instantiated_on_first_use(self):
+        """Test plugins with class-level INFO are not instantiated at discovery"""
+        plugin_file = Path(self.plugin_dirs[0]) / "info_sample_plugin.py"
+        plugin_file.write_text(
+            "from lib.plugin_system import PluginInfo, PluginInterface, PluginType\n"
+            "\n"
+            "instances = []\n"
+            "\n"
+            "\n"
+            "class InfoSamplePlugin(PluginInterface):\n"
+            "    INFO = PluginInfo(\n"
+            "        name='info_sample', version='1.0.0', description='', author='',\n"
+            "        plugin_type=PluginType.VALIDATOR, enabled=True, config={},\n"
+            "        module_path='info_sample_plugin', class_name='InfoSamplePlugin',\n"
+            "        dependencies=[],\n"
+            "    )\n"
+            "\n"
+            "    def __init__(self, config=None):\n"
+            "        super().__init__(config)\n"
+            "        instances.append(self)\n"
+            "\n"
+            "    initialize = lambda self: True\n"
+            "    cleanup = lambda self: True\n"
+        )
+        config = {"plugins": {"InfoSamplePlugin": {"config": {"level": 1}}}}
+
+        manager = PluginManager(self.plugin_dirs, config)
+        try:
+            manager.discover_plugins()
+            module = sys.modules["info_sample_plugin"]
+            self.assertEqual(module.instances, [])
+            self.assertEqual(manager.plugin_info["info_sample"].config, {"level": 1})
+
+            plugin = manager.get_plugin("info_sample")
+            self.assertEqual(module.instances, [plugin])
+            self.assertEqual(plugin.get_info().config, {"level": 1})
+        finally:
+            sys.modules.pop("info_sample_plugin", None)
+            sys.path.remove(str(Path(self.plugin_dirs[0]).absolute()))
+
+    def test_disabled_plugin_module_not_imported(self):
+        """Test modules of disabled vendor plugins are skipped before import"""
+        plugin_file = Path(self.plugin_dirs[0]) / "disabled_sample_plugin.py"
+        plugin_file.write_text("raise RuntimeError('imported')\n")
+        config = {
+            "plugins": {
+                "vendors": {
+                    "sample": {
+                        "class": "DisabledSamplePlugin",
+                        "module": "plugins.disabled_sample_plugin",
+                        "enabled": False,
+                    }
+                }
+            }
+        }
+
+        manager = PluginManager(self.plugin_dirs, config)
+        try:
+            with mock.patch("lib.plugin_system.logger") as plugin_logger:
+                manager.discover_plugins()
+            plugin_logger.error.assert_not_called()
+            self.assertNotIn("disabled_sample_plugin", sys.modules)
+        finally:
+            sys.path.remove(str(Path(self.plugin_dirs[0]).absolute()))
+
+    def test_disabled_modules_match_full_path_only(self):
+        """Test disabling a module does not disable modules sharing its last name"""
+        config = {
+            "plugins": {
+                "vendors": {
+                    "bird2": {"module": "plugins.vendors.bird2", "enabled": False},
+                    "base": {"module": "plugins.base", "enabled": False},
+                    "cisco": {"module": "vendors.cisco", "enabled": False},
+                    "frr": {"module": "plugins.vendors.frr", "enabled": True},
+                }
+            }
+        }
+
+        manager = PluginManager(self.plugin_dirs, config)
+
+        self.assertEqual(
+            manager._disabled_modules,
+            {
+                "plugins.vendors.bird2",
+                "vendors.bird2",
+                "plugins.base",
+                "base",
+                "vendors.cisco",
+            },
+        )
+        for module_name in ("bird2", "cisco", "vendors.base", "vendors.frr"):
+            self.assertNotIn(module_name, manager._disabled_modules)
+
+    def test_initialize_plugins_in_dependency_order(self):
+        """Test plugins are initialized after the plugins they depend on"""
+        manager = PluginManager(self.plugin_dirs)
+        initialized = []
+
+        class OrderedPlugin(TestPlugin):
+            def initialize(self):
+                initialized.append(self.config["name"])
+                return True
+
+        for name, dependencies in [("c", ["b"]), ("b", ["a"]), ("a", [])]:
+            plugin = OrderedPlugin({"name": name})
+            manager.plugins[name] = plugin
+            manager.plugin_info[name] = PluginInfo(
+                name=name,
+                version="1.0.0",
+                description="",
+                author="",
+                plugin_type=PluginType.VALIDATOR,
+                enabled=True,
+                config={},
+                module_path="test",
+                class_name="OrderedPlugin",
+                dependencies=dependencies,
+            )
+
+        manager.initialize_plugins()
+        self.assertEqual(initialized, ["a", "b", "c"])
+        self.assertEqual(manager.validate_dependencies(), [])
+
+        manager.plugin_info["a"].dependencies.append("c")
+        self.assertEqual(
+            manager.validate_dependencies(),
+            [f"{name} has circular dependencies" for name in "cba"],
+        )
+
+    def test_validate_dependencies_separates_cycles_from_dependents(self):
+        """Test only cycle members are reported as circular"""
+        manager = PluginManager(self.plugin_dirs)
+
+        for name, dependencies in [
+            ("a", ["b"]),
+            ("b", ["a"]),
+            ("c", ["a"]),
+            ("d", ["c"]),
+            ("e", ["missing"]),
+            ("f", ["f"]),
+            ("g", []),
+        ]:
+            manager.plugins[name] = TestPlugin()
+            manager.plugin_info[name] = PluginInfo(
+                name=name,
+                version="1.0.0",
+                description="",
+                author="",
+                plugin_type=PluginType.VALIDATOR,
+                enabled=True,
+                config={},
+                module_path="test",
+                class_name="TestPlugin",
+                dependencies=dependencies,
+            )
+
+        self.assertEqual(
+            manager.validate_dependencies(),
+            [
+                "e requires missing",
+                "a has circular dependencies",
+                "b has circular dependencies",
+                "c depends on a plugin with circular dependencies",
+                "d depends on a plugin with circular dependencies",
+                "f has circular dependencies",
+            ],
+        )
+
     def test_vendor_plugin_functionality(self):
         """Test vendor plugin specific functionality"""
         plugin = TestVendorPlugin()
@@ -147,6 +331,86 @@ class TestPluginSystem(unittest.TestCase):
         features = plugin.get_supported_features()
         self.assertIn("test_feature", features)
 
+        # Test fused generation and validation
+        config, valid = plugin.generate_and_validate(peer_info, {})
+        self.assertIn("AS64512", config)
+        self.assertTrue(valid)
+
+    def test_reload_plugin_reimports_only_its_module(self):
+        """Test reloading a plugin picks up changes to its own module"""
+        plugin_file = Path(self.plugin_dirs[0]) / "reload_sample_plugin.py"
+        plugin_source = (
+            "from lib.plugin_system import PluginInfo, PluginInterface, PluginType\n"
+            "\n"
+            "\n"
+            "class ReloadSamplePlugin(PluginInterface):\n"
+            "    def get_info(self):\n"
+            "        return PluginInfo(\n"
+            "            name='reload_sample', version='{version}', description='',\n"
+            "            author='', plugin_type=PluginType.VALIDATOR, enabled=True,\n"
+            "            config={{}}, module_path='reload_sample_plugin',\n"
+            "            class_name='ReloadSamplePlugin', dependencies=[],\n"
+            "        )\n"
+            "\n"
+            "    def initialize(self):\n"
+            "        return True\n"
+            "\n"
+            "    def cleanup(self):\n"
+            "        return True\n"
+        )
+        plugin_file.write_text(plugin_source.format(version="1.0"))
+
+        manager = PluginManager(self.plugin_dirs)
+        try:
+            manager.discover_plugins()
+            self.assertEqual(manager.plugin_info["reload_sample"].version, "1.0")
+
+            plugin_file.write_text(plugin_source.format(version="2.0.0"))
+            with mock.patch.object(manager, "discover_plugins") as discover:
+                self.assertTrue(manager.reload_plugin("reload_sample"))
+            discover.assert_not_called()
+
+            self.assertEqual(manager.plugin_info["reload_sample"].version, "2.0.0")
+            self.assertEqual(
+                manager.plugin_types[PluginType.VALIDATOR], ["reload_sample"]
+            )
+        finally:
+            sys.modules.pop("reload_sample_plugin", None)
+            sys.path.remove(str(Path(self.plugin_dirs[0]).absolute()))
+
+    def test_declared_plugin_imported_on_first_use(self):
+        """Test plugins declaring PLUGIN_INFO are imported lazily"""
+        plugin_file = Path(self.plugin_dirs[0]) / "lazy_sample_plugin.py"
+        plugin_file.write_text(
+            "from lib.plugin_system import PluginInterface\n"
+            "\n"
+            "PLUGIN_INFO = {\n"
+            "    'name': 'lazy_sample', 'version': '1.0.0', 'description': '',\n"
+            "    'author': '', 'plugin_type': 'validator',\n"
+            "    'class_name': 'LazySamplePlugin',\n"
+            "}\n"
+            "\n"
+            "\n"
+            "class LazySamplePlugin(PluginInterface):\n"
+            "    get_info = lambda self: None\n"
+            "    initialize = lambda self: True\n"
+            "    cleanup = lambda self: True\n"
+        )
+
+        manager = PluginManager(self.plugin_dirs)
+        try:
+            manager.discover_plugins()
+            self.assertNotIn("lazy_sample_plugin", sys.modules)
+            self.assertEqual(manager.list_plugins()[0].name, "lazy_sample")
+
+            # get_info() is not called for declared plugins
+            plugin = manager.get_plugin("lazy_sample")
+            self.assertEqual(type(plugin).__name__, "LazySamplePlugin")
+            self.assertIn("lazy_sample_plugin", sys.modules)
+        finally:
+            sys.modules.pop("lazy_sample_plugin", None)
+            sys.path.remove(str(Path(self.plugin_dirs[0]).absolute()))
+
 
 if __name__ == "__main__":
     unittest.main()
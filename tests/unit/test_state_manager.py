@@ -74,6 +74,28 @@ class TestStateManager(unittest.TestCase):
         self.assertEqual(events[0].message, "Test event")
         self.assertEqual(events[0].details["test"], "data")
 
+    def test_track_events(self):
+        """Test tracking a batch of events"""
+        events = [
+            StateEvent(
+                event_type=EventType.GENERATION_SUCCESS,
+                component="test",
+                message=f"Batch event {i}",
+                details={"index": i},
+            )
+            for i in range(3)
+        ]
+
+        self.assertEqual(self.manager.track_events(events), 3)
+        self.assertEqual(self.manager.track_events([]), 0)
+
+        tracked = self.manager.get_recent_events(10)
+        self.assertEqual(len(tracked), 3)
+        self.assertEqual(
+            {event.message for event in tracked},
+            {"Batch event 0", "Batch event 1", "Batch event 2"},
+        )
+
     def test_track_generation(self):
         """Test generation tracking"""
         generation = GenerationRecord(
@@ -196,6 +218,27 @@ class TestStateManager(unittest.TestCase):
         self.assertEqual(len(failure_events), 1)
         self.assertEqual(failure_events[0].message, "Failure event")
 
+    def test_export_data(self):
+        """Test exporting state data to JSON"""
+        import json
+
+        self.manager.track_event(
+            StateEvent(
+                event_type=EventType.GENERATION_SUCCESS,
+                component="test",
+                message="Exported event",
+            )
+        )
+
+        export_file = Path(self.temp_dir) / "export.json"
+        self.assertTrue(self.manager.export_data(str(export_file)))
+
+        with open(export_file) as f:
+            data = json.load(f)
+
+        self.assertEqual(data["events"][0]["event_type"], "generation_success")
+        self.assertIn("stats", data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AutoNet utilities
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+# Add lib directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import lib.utils
+from lib.state_manager import EventType
+from lib.utils import atomic_write, dump_json, iter_json_items
+
+
+class TestUtils(unittest.TestCase):
+    """Test cases for utility functions"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_atomic_write(self):
+        """Test atomic write replaces the file and leaves no temporary files"""
+        path = Path(self.temp_dir) / "as64512.conf"
+        path.write_text("old")
+
+        self.assertEqual(atomic_write(path, "new"), path)
+        self.assertEqual(path.read_text(), "new")
+        self.assertEqual(os.listdir(self.temp_dir), ["as64512.conf"])
+
+    def test_atomic_write_concurrent_same_path(self):
+        """Test concurrent writers of one path do not interfere"""
+        path = Path(self.temp_dir) / "as64512.conf"
+        contents = [str(i) * 200_000 for i in range(10)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(lambda content: atomic_write(path, content), contents * 4)
+            )
+
+        self.assertIn(path.read_text(), contents)
+        self.assertEqual(os.listdir(self.temp_dir), ["as64512.conf"])
+
+    def test_iter_json_items(self):
+        """Test JSON arrays are yielded item by item, other values whole"""
+        array_file = Path(self.temp_dir) / "peers.json"
+        array_file.write_text(
+            '  [{"asn": "AS64512", "weight": 1.5}, {"asn": "AS64513"}]'
+        )
+        object_file = Path(self.temp_dir) / "peer.json"
+        object_file.write_text('{"asn": "AS64512"}')
+
+        for ijson in (lib.utils.ijson, None):
+            with mock.patch.object(lib.utils, "ijson", ijson):
+                self.assertEqual(
+                    list(iter_json_items(array_file)),
+                    [{"asn": "AS64512", "weight": 1.5}, {"asn": "AS64513"}],
+                )
+                self.assertEqual(
+                    list(iter_json_items(object_file)), [{"asn": "AS64512"}]
+                )
+
+    @unittest.skipIf(lib.utils.ijson is None, "ijson is not installed")
+    def test_iter_json_items_streams_with_ijson(self):
+        """Test leading items are yielded before the rest is parsed"""
+        array_file = Path(self.temp_dir) / "peers.json"
+        array_file.write_text('[{"asn": "AS64512"}, ' + "x" * 100_000)
+
+        items = iter_json_items(array_file)
+        self.assertEqual(next(items), {"asn": "AS64512"})
+        with self.assertRaises(Exception):
+            next(items)
+
+    def test_dump_json(self):
+        """Test JSON output matches the standard library encoder"""
+        data = {
+            "generated": datetime(2024, 1, 2, 3, 4, 5),
+            "event": EventType.GENERATION_SUCCESS,
+            "path": Path("/tmp/as64512.conf"),
+            "peers": [{"asn": "AS64512", "prefixes": 10}],
+            "large": 2**70,
+        }
+        expected = {
+            "generated": "2024-01-02T03:04:05",
+            "event": EventType.GENERATION_SUCCESS.value,
+            "path": "/tmp/as64512.conf",
+            "peers": [{"asn": "AS64512", "prefixes": 10}],
+            "large": 2**70,
+        }
+
+        for orjson in (lib.utils.orjson, None):
+            with mock.patch.object(lib.utils, "orjson", orjson):
+                output = dump_json(data)
+                self.assertEqual(json.loads(output), expected)
+                self.assertIn('\n  "peers"', output)
+
+
+if __name__ == "__main__":
+    unittest.main()
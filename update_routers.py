@@ -13,6 +13,7 @@ Modern Python replacement for update-routers.sh with enhanced features:
 import os
 import sys
 import argparse
+import asyncio
 import logging
 import subprocess
 import tempfile
@@ -76,8 +77,9 @@ class AutoNetDeployer:
     - SSH security and key management
     """
 
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, router_filter: str = None):
         self.config = config or {}
+        self.router_filter = router_filter
 
         # Initialize architecture components
         self.config_manager = get_config_manager()
@@ -117,6 +119,9 @@ class AutoNetDeployer:
         # Try to get routers from configuration
         if 'bgp' in self.config:
             for router_short, router_config in self.config['bgp'].items():
+                if not self._router_selected(router_config['fqdn']):
+                    continue
+
                 router_info = RouterInfo(
                     name=router_config['fqdn'],
                     fqdn=router_config['fqdn'],
@@ -131,7 +136,7 @@ class AutoNetDeployer:
                 routers.append(router_info)
 
         # Fallback to environment variable or hardcoded list
-        if not routers:
+        if not self.config.get('bgp'):
             router_names = os.getenv('AUTONET_ROUTERS', '').split(',')
             if not router_names or router_names == ['']:
                 router_names = [
@@ -143,7 +148,7 @@ class AutoNetDeployer:
 
             for router_name in router_names:
                 router_name = router_name.strip()
-                if router_name:
+                if router_name and self._router_selected(router_name):
                     router_info = RouterInfo(
                         name=router_name,
                         fqdn=router_name,
@@ -157,6 +162,10 @@ class AutoNetDeployer:
 
         return routers
 
+    def _router_selected(self, router_name: str) -> bool:
+        """Check if a router matches the optional router filter"""
+        return not self.router_filter or self.router_filter in router_name
+
     def validate_environment(self) -> bool:
         """Validate deployment environment"""
         logger.info("Validating deployment environment...")
@@ -547,34 +556,39 @@ class AutoNetDeployer:
 
     def check_router_status(self) -> Dict[str, Any]:
         """Check status of all routers"""
+        return asyncio.run(self.check_router_status_async())
+
+    async def check_router_status_async(self) -> Dict[str, Any]:
+        """Check status of all routers concurrently on a single event loop"""
         logger.info("Checking router status...")
 
-        status_results = {}
+        statuses = await asyncio.gather(
+            *(self._check_single_router(router) for router in self.routers)
+        )
 
-        for router in self.routers:
-            try:
-                # Get vendor plugin
-                vendor_plugin = self.plugin_manager.get_vendor_plugin(router.vendor)
+        return {router.name: status for router, status in zip(self.routers, statuses)}
 
-                if vendor_plugin and hasattr(vendor_plugin, 'get_config_status'):
-                    # Use plugin to get status
-                    status = vendor_plugin.get_config_status()
-                else:
-                    # Fallback to basic SSH check
-                    status = self._check_router_ssh(router)
+    async def _check_single_router(self, router: RouterInfo) -> Dict[str, Any]:
+        """Check status of a single router"""
+        try:
+            # Get vendor plugin
+            vendor_plugin = self.plugin_manager.get_vendor_plugin(router.vendor)
 
-                status_results[router.name] = status
+            if vendor_plugin and hasattr(vendor_plugin, 'get_config_status'):
+                # Use plugin to get status
+                return await asyncio.to_thread(vendor_plugin.get_config_status)
 
-            except Exception as e:
-                logger.error(f"Failed to check status of {router.name}: {e}")
-                status_results[router.name] = {
-                    'error': str(e),
-                    'reachable': False
-                }
+            # Fallback to basic SSH check
+            return await self._check_router_ssh(router)
 
-        return status_results
+        except Exception as e:
+            logger.error(f"Failed to check status of {router.name}: {e}")
+            return {
+                'error': str(e),
+                'reachable': False
+            }
 
-    def _check_router_ssh(self, router: RouterInfo) -> Dict[str, Any]:
+    async def _check_router_ssh(self, router: RouterInfo) -> Dict[str, Any]:
         """Basic SSH connectivity check"""
         try:
             ssh_cmd = [
@@ -586,13 +600,21 @@ class AutoNetDeployer:
                 'echo "Connection OK"'
             ]
 
-            result = subprocess.run(
-                ssh_cmd,
-                capture_output=True, text=True, timeout=30
+            process = await asyncio.create_subprocess_exec(
+                *ssh_cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
 
+            try:
+                returncode = await asyncio.wait_for(process.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise TimeoutError(f"SSH check of {router.name} timed out")
+
             return {
-                'reachable': result.returncode == 0,
+                'reachable': returncode == 0,
                 'response_time': 'unknown',
                 'last_check': datetime.now().isoformat()
             }
@@ -659,15 +681,12 @@ Examples:
         if args.timeout:
             config['deployment_timeout'] = args.timeout
 
-        # Create deployer
-        deployer = AutoNetDeployer(config)
+        # Create deployer, restricted to a specific router if requested
+        deployer = AutoNetDeployer(config, router_filter=args.router)
 
-        # Filter routers if specific router requested
-        if args.router:
-            deployer.routers = [r for r in deployer.routers if args.router in r.name]
-            if not deployer.routers:
-                logger.error(f"Router not found: {args.router}")
-                sys.exit(EXIT_CONFIG_ERROR)
+        if args.router and not deployer.routers:
+            logger.error(f"Router not found: {args.router}")
+            sys.exit(EXIT_CONFIG_ERROR)
 
         # Perform requested action
         if args.action == 'check':